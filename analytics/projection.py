@@ -0,0 +1,191 @@
+"""
+Module: projection.py
+Purpose: Precompute 2D projections of embedding snapshots for the dashboard.
+
+A PCA basis is fitted once per topic (on a pooled sample of its snapshots) and
+reused for every later date, so points from different dates share the same
+axes. Each snapshot is stored as a float16 (N, 2) array plus per-row strata
+labels used for stratified downsampling when served. A projection is
+recomputed whenever its snapshot was rewritten after it (reruns overwrite the
+day's embeddings in place) or the row counts no longer match.
+"""
+
+import os
+import datetime as dt
+import logging
+import numpy as np
+from data_pipeline.utils.io_utils import ensure_dir, save_json, save_npy, save_npz
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PROJECTION_DIR = "data_pipeline/data/processed/projections"
+BASIS_DIR = "data_pipeline/data/processed/projection_basis"
+
+FIT_SAMPLE_SIZE = 20000
+GRID_BINS = 8   # strata = GRID_BINS x GRID_BINS quantile cells in projected space
+
+
+# ---------- Basis ----------
+def fit_basis(samples: np.ndarray):
+    """Fit a 2-component PCA basis. Returns (mean, components[2, d])."""
+    X = np.asarray(samples, dtype=np.float32)
+    mean = X.mean(axis=0)
+    _, _, vt = np.linalg.svd(X - mean, full_matrices=False)
+    components = vt[:2]
+
+    # deterministic orientation: largest loading of each axis is positive
+    signs = np.sign(components[np.arange(len(components)), np.abs(components).argmax(axis=1)])
+    signs[signs == 0] = 1
+    return mean, components * signs[:, None]
+
+
+def basis_path(topic_key: str, basis_dir=BASIS_DIR):
+    return os.path.join(basis_dir, f"{topic_key}.npz")
+
+
+def load_or_fit_basis(topic_key: str, snapshot_paths: list, basis_dir=BASIS_DIR, refit=False):
+    """Reuse the topic's stored basis; fit one on a pooled sample of its snapshots if missing."""
+    path = basis_path(topic_key, basis_dir)
+    if os.path.exists(path) and not refit:
+        with np.load(path) as f:
+            return f["mean"], f["components"]
+
+    rng = np.random.default_rng(0)
+    per_snapshot = max(1, FIT_SAMPLE_SIZE // max(1, len(snapshot_paths)))
+    parts = []
+    for p in snapshot_paths:
+        emb = np.load(p, mmap_mode="r")
+        if len(emb) == 0:
+            continue
+        idx = np.sort(rng.choice(len(emb), size=min(per_snapshot, len(emb)), replace=False))
+        parts.append(np.asarray(emb[idx], dtype=np.float32))
+    if not parts:
+        return None, None
+
+    mean, components = fit_basis(np.vstack(parts))
+    ensure_dir(basis_dir)
+    save_npz(path, mean=mean, components=components)
+    logger.info(f"📐 Fitted projection basis for '{topic_key}' on {len(parts)} snapshot(s)")
+    return mean, components
+
+
+# ---------- Projection + strata ----------
+def project(emb: np.ndarray, mean: np.ndarray, components: np.ndarray, chunk_size: int = 100000) -> np.ndarray:
+    """Project rows onto the basis in chunks (emb may be a memory-mapped array)."""
+    out = np.empty((len(emb), 2), dtype=np.float16)
+    for i in range(0, len(emb), chunk_size):
+        block = np.asarray(emb[i:i + chunk_size], dtype=np.float32)
+        out[i:i + chunk_size] = (block - mean) @ components.T
+    return out
+
+
+def grid_strata(coords: np.ndarray, bins: int = GRID_BINS) -> np.ndarray:
+    """Quantile grid cell of each projected point, as uint8 labels."""
+    coords = np.asarray(coords, dtype=np.float32)
+    if len(coords) == 0:
+        return np.empty(0, dtype=np.uint8)
+    qs = np.linspace(0, 1, bins + 1)[1:-1]
+    bx = np.searchsorted(np.quantile(coords[:, 0], qs), coords[:, 0], side="right")
+    by = np.searchsorted(np.quantile(coords[:, 1], qs), coords[:, 1], side="right")
+    return (bx * bins + by).astype(np.uint8)
+
+
+def stratified_sample(strata: np.ndarray, budget: int, seed: int = 0) -> np.ndarray:
+    """
+    Pick at most `budget` row indices, allocated to strata in proportion to
+    their size while keeping at least one point from every non-empty stratum
+    (so sparse regions and outliers stay visible). Returned indices are sorted.
+    """
+    n = len(strata)
+    if budget >= n:
+        return np.arange(n)
+
+    rng = np.random.default_rng(seed)
+    labels, counts = np.unique(strata, return_counts=True)
+    if budget < len(labels):
+        return np.sort(rng.choice(n, size=budget, replace=False))
+
+    quota = np.maximum(1, np.floor(counts * budget / n)).astype(int)
+    order = np.argsort(-counts)
+    # the "at least one" floor can overshoot: trim the largest strata first
+    excess = quota.sum() - budget
+    for i in order:
+        if excess <= 0:
+            break
+        take = min(excess, quota[i] - 1)
+        quota[i] -= take
+        excess -= take
+    # hand out any remainder to the largest strata
+    for i in order[: max(0, budget - quota.sum())]:
+        quota[i] += 1
+
+    picked = []
+    for label, q in zip(labels, quota):
+        members = np.flatnonzero(strata == label)
+        picked.append(rng.choice(members, size=min(q, len(members)), replace=False))
+    return np.sort(np.concatenate(picked))
+
+
+# ---------- Pipeline runner ----------
+def projection_paths(topic_key: str, date: str, proj_dir=PROJECTION_DIR):
+    date_dir = os.path.join(proj_dir, date)
+    return os.path.join(date_dir, f"{topic_key}.npy"), os.path.join(date_dir, f"{topic_key}_strata.npy")
+
+
+def projection_is_current(emb_path: str, coords_path: str) -> bool:
+    """True if the projection exists, is newer than its snapshot and has the same row count."""
+    if not os.path.exists(coords_path):
+        return False
+    if os.stat(coords_path).st_mtime_ns < os.stat(emb_path).st_mtime_ns:
+        return False
+    # header-only reads
+    return len(np.load(coords_path, mmap_mode="r")) == len(np.load(emb_path, mmap_mode="r"))
+
+
+def run_projections(base_emb_dir="data_pipeline/data/processed/embeddings", proj_dir=PROJECTION_DIR,
+                    basis_dir=BASIS_DIR, refit=False):
+    """Project every (date, topic) snapshot without an up-to-date projection."""
+    logger.info("🗺️  Computing 2D embedding projections...")
+    if not os.path.exists(base_emb_dir):
+        logger.error(f"Embedding directory not found: {base_emb_dir}")
+        return []
+
+    snapshots = {}
+    for date in sorted(os.listdir(base_emb_dir)):
+        date_dir = os.path.join(base_emb_dir, date)
+        if not os.path.isdir(date_dir):
+            continue
+        for f in os.listdir(date_dir):
+            if f.endswith(".npy"):
+                snapshots.setdefault(os.path.splitext(f)[0], []).append((date, os.path.join(date_dir, f)))
+
+    written = []
+    for topic_key, items in sorted(snapshots.items()):
+        try:
+            mean, components = load_or_fit_basis(topic_key, [p for _, p in items], basis_dir, refit)
+            if mean is None:
+                continue
+            for date, emb_path in items:
+                coords_path, strata_path = projection_paths(topic_key, date, proj_dir)
+                if not refit and projection_is_current(emb_path, coords_path):
+                    continue
+                coords = project(np.load(emb_path, mmap_mode="r"), mean, components)
+                ensure_dir(os.path.dirname(coords_path))
+                save_npy(coords, coords_path)
+                save_npy(grid_strata(coords), strata_path)
+                written.append(coords_path)
+        except Exception as e:
+            logger.error(f"❌ Failed to project embeddings for {topic_key}: {e}")
+
+    if written:
+        save_json(
+            {"timestamp": str(dt.datetime.utcnow()), "written": written},
+            os.path.join(proj_dir, "last_run.json")
+        )
+    logger.info(f"✅ Projections written: {len(written)}")
+    return written
+
+
+if __name__ == "__main__":
+    run_projections()
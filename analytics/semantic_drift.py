@@ -10,8 +10,7 @@ import logging
 from scipy.spatial.distance import cosine
 from scipy.stats import entropy
 from data_pipeline.utils.io_utils import ensure_dir, save_json
-from analytics.evidently_reports import generate_semantic_drift_report
-from analytics.plotly_reports import generate_semantic_drift_report, generate_concept_drift_report
+from data_pipeline.utils.stage_cache import get_stage_cache, code_fingerprint
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,6 +26,25 @@ def jensen_shannon_divergence(p, q):
     return 0.5 * (entropy(p, m) + entropy(q, m))
 
 
+def semantic_drift_metrics(old_emb, new_emb):
+    """Return (cosine_drift, jsd, drift_score) for two equally sized embedding arrays."""
+    old_mean = np.mean(old_emb, axis=0)
+    new_mean = np.mean(new_emb, axis=0)
+
+    cosine_drift = cosine(old_mean, new_mean)
+    jsd = jensen_shannon_divergence(np.abs(old_emb.flatten()), np.abs(new_emb.flatten()))
+    drift_score = round((cosine_drift + jsd) / 2, 4)
+    return cosine_drift, jsd, drift_score
+
+
+def drift_status(drift_score: float) -> str:
+    return "Significant Drift" if drift_score > 0.25 else "Minor Drift" if drift_score > 0.15 else "Stable"
+
+
+def semantic_report_path(topic: str, new_date: str) -> str:
+    return os.path.join("drift_reports/semantic", f"{topic.replace(' ', '_')}_semantic_drift_{new_date}.json")
+
+
 # ---------- Core Drift ----------
 def compute_semantic_drift(topic: str, old_path: str, new_path: str, old_date: str, new_date: str):
     """Compute semantic drift metrics between two embedding snapshots."""
@@ -41,15 +59,11 @@ def compute_semantic_drift(topic: str, old_path: str, new_path: str, old_date: s
 
     old_emb, new_emb = old_emb[:n], new_emb[:n]
 
-    old_mean = np.mean(old_emb, axis=0)
-    new_mean = np.mean(new_emb, axis=0)
+    cosine_drift, jsd, drift_score = semantic_drift_metrics(old_emb, new_emb)
 
-    cosine_drift = cosine(old_mean, new_mean)
-    jsd = jensen_shannon_divergence(np.abs(old_emb.flatten()), np.abs(new_emb.flatten()))
-    drift_score = round((cosine_drift + jsd) / 2, 4)
-
-    # Generate Evidently semantic drift report
+    # Generate semantic drift report (imported lazily: metrics don't need plotting libs)
     try:
+        from analytics.plotly_reports import generate_semantic_drift_report
         html_path = generate_semantic_drift_report(
             topic=topic,
             old_emb_path=old_path,
@@ -74,14 +88,11 @@ def compute_semantic_drift(topic: str, old_path: str, new_path: str, old_date: s
         "drift_score": float(drift_score),
         "old_snapshot": old_path,
         "new_snapshot": new_path,
-        "status": "Significant Drift" if drift_score > 0.25 else "Minor Drift" if drift_score > 0.15 else "Stable"
+        "status": drift_status(drift_score)
     }
 
     ensure_dir("drift_reports/semantic")
-    report_path = os.path.join(
-        "drift_reports/semantic",
-        f"{topic.replace(' ', '_')}_semantic_drift_{new_date}.json"
-    )
+    report_path = semantic_report_path(topic, new_date)
     save_json(result, report_path)
 
     logger.info(f"✅ Semantic drift for '{topic}' saved → {report_path}")
@@ -90,19 +101,25 @@ def compute_semantic_drift(topic: str, old_path: str, new_path: str, old_date: s
 
 
 # ---------- Automatic Runner ----------
-def run_semantic_drift(base_emb_dir="data_pipeline/data/processed/embeddings"):
+def run_semantic_drift(base_emb_dir="data_pipeline/data/processed/embeddings", force: bool = False):
     """
     Detect semantic drift for all topics across all consecutive embedding snapshots.
     Example:
         2025-11-05 → 2025-11-06
         2025-11-06 → 2025-11-07
         etc.
+
+    Pairs whose snapshots (and this code) are unchanged since their report
+    was written are skipped unless `force` is set.
+
+    Returns the results computed in this call (one per topic and date pair).
     """
     logger.info("📈 Running semantic drift detection...")
 
+    results = []
     if not os.path.exists(base_emb_dir):
         logger.error(f"Embedding directory not found: {base_emb_dir}")
-        return
+        return results
 
     # Get all date folders
     date_dirs = sorted(
@@ -110,7 +127,11 @@ def run_semantic_drift(base_emb_dir="data_pipeline/data/processed/embeddings"):
     )
     if len(date_dirs) < 2:
         logger.warning("Not enough embedding snapshots to compute drift (need at least 2 dates).")
-        return
+        return results
+
+    cache = get_stage_cache()
+    code = code_fingerprint(compute_semantic_drift, semantic_drift_metrics, drift_status)
+    skipped = 0
 
     # Iterate through all consecutive pairs
     for i in range(1, len(date_dirs)):
@@ -138,18 +159,31 @@ def run_semantic_drift(base_emb_dir="data_pipeline/data/processed/embeddings"):
 
         for topic_file in common_topics:
             topic_name = topic_file.replace("_", " ")
+            key = f"{topic_file}:{old_date}:{new_date}"
+            fingerprint = cache.fingerprint([old_files[topic_file], new_files[topic_file]], {"code": code})
+            if not force and cache.lookup("semantic_drift", key, fingerprint):
+                skipped += 1
+                continue
             try:
-                compute_semantic_drift(
+                result = compute_semantic_drift(
                     topic=topic_name,
                     old_path=old_files[topic_file],
                     new_path=new_files[topic_file],
                     old_date=old_date,
                     new_date=new_date
                 )
+                if result:
+                    results.append(result)
+                    cache.record("semantic_drift", key, fingerprint,
+                                 [semantic_report_path(topic_name, new_date)], save=False)
             except Exception as e:
                 logger.error(f"❌ Failed to compute semantic drift for {topic_name}: {e}")
+        cache.save()
 
+    if skipped:
+        logger.info(f"⏭️ Skipped {skipped} unchanged snapshot pair(s)")
     logger.info("✅ Semantic drift detection completed successfully.")
+    return results
 
 
 if __name__ == "__main__":
@@ -0,0 +1,167 @@
+"""
+Module: vector_index.py
+Purpose: Per-snapshot vector index for nearest-text search over embedding snapshots.
+
+Small snapshots use an exact (flat) inner-product scan. Larger ones get an
+IVF index: k-means centroids plus rows re-ordered by list, so a query only
+scans the `nprobe` closest lists as contiguous slices of a memory-mapped array.
+
+Layout next to each snapshot (data_pipeline/data/processed/embeddings/<date>/):
+- <Topic>_rows.json            row ids and texts aligned with the .npy rows (record
+                               store ids when embedded from records, else text_id)
+- index/<Topic>_vectors.npy    L2-normalized float32 rows, ordered by IVF list
+- index/<Topic>_ivf.npz        centroids, list offsets, row order
+"""
+
+import os
+import json
+import hashlib
+import logging
+import numpy as np
+from data_pipeline.utils.io_utils import ensure_dir, save_json, save_npy, save_npz
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+FLAT_THRESHOLD = 20000      # below this many rows an exact scan is already sub-millisecond
+KMEANS_ITERATIONS = 10
+KMEANS_TRAIN_SIZE = 50000
+DEFAULT_NPROBE = 16
+
+
+def text_id(text: str) -> str:
+    """Stable id of a text (content hash)."""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def rows_path(date_dir: str, topic_key: str):
+    return os.path.join(date_dir, f"{topic_key}_rows.json")
+
+
+def index_paths(date_dir: str, topic_key: str):
+    index_dir = os.path.join(date_dir, "index")
+    return os.path.join(index_dir, f"{topic_key}_vectors.npy"), os.path.join(index_dir, f"{topic_key}_ivf.npz")
+
+
+def save_rows(texts: list, date_dir: str, topic_key: str, ids: list = None):
+    """Store row ids (record ids if given, else text_id) and texts aligned with the snapshot's embedding rows."""
+    ids = list(ids) if ids is not None else [text_id(t) for t in texts]
+    save_json({"ids": ids, "texts": list(texts)}, rows_path(date_dir, topic_key))
+
+
+def _normalize(x: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float32)
+    norms = np.linalg.norm(x, axis=-1, keepdims=True)
+    return x / np.maximum(norms, 1e-12)
+
+
+def _kmeans(x: np.ndarray, k: int, iterations: int = KMEANS_ITERATIONS, seed: int = 0) -> np.ndarray:
+    """Spherical k-means on normalized rows; returns normalized centroids."""
+    rng = np.random.default_rng(seed)
+    train = x[rng.choice(len(x), size=min(len(x), KMEANS_TRAIN_SIZE), replace=False)]
+    centroids = train[rng.choice(len(train), size=k, replace=False)].copy()
+    for _ in range(iterations):
+        assign = np.argmax(train @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assign, train)
+        empty = np.bincount(assign, minlength=k) == 0
+        sums[empty] = train[rng.choice(len(train), size=int(empty.sum()))]
+        centroids = _normalize(sums)
+    return centroids
+
+
+def _assign(x: np.ndarray, centroids: np.ndarray, chunk_size: int = 65536) -> np.ndarray:
+    out = np.empty(len(x), dtype=np.int32)
+    for i in range(0, len(x), chunk_size):
+        out[i:i + chunk_size] = np.argmax(x[i:i + chunk_size] @ centroids.T, axis=1)
+    return out
+
+
+def build_index(embeddings: np.ndarray, date_dir: str, topic_key: str, nlist: int = None):
+    """Build and persist the snapshot's index. Returns the vectors path."""
+    x = _normalize(embeddings)
+    n = len(x)
+
+    if nlist is None:
+        nlist = 0 if n < FLAT_THRESHOLD else int(4 * np.sqrt(n))
+
+    if nlist:
+        centroids = _kmeans(x, nlist)
+        assign = _assign(x, centroids)
+        order = np.argsort(assign, kind="stable").astype(np.int64)
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(assign, minlength=nlist))]).astype(np.int64)
+        x = x[order]
+    else:
+        centroids = np.empty((0, x.shape[1]), dtype=np.float32)
+        order = np.arange(n, dtype=np.int64)
+        offsets = np.array([0, n], dtype=np.int64)
+
+    vectors_path, ivf_path = index_paths(date_dir, topic_key)
+    ensure_dir(os.path.dirname(vectors_path))
+    save_npy(x, vectors_path)
+    save_npz(ivf_path, centroids=centroids, offsets=offsets, order=order)
+    logger.info(f"🔎 Built {'IVF-' + str(nlist) if nlist else 'flat'} index for '{topic_key}' ({n} rows)")
+    return vectors_path
+
+
+class SnapshotIndex:
+    """Search interface over one snapshot's index (memory-mapped vectors)."""
+
+    def __init__(self, vectors, centroids, offsets, order, ids=None, texts=None):
+        self.vectors = vectors
+        self.centroids = centroids
+        self.offsets = offsets
+        self.order = order
+        self.ids = ids
+        self.texts = texts
+
+    @classmethod
+    def from_embeddings(cls, embeddings: np.ndarray, ids=None, texts=None):
+        """Exact in-memory index for snapshots that were written before indexing existed."""
+        x = _normalize(embeddings)
+        n = len(x)
+        return cls(x, np.empty((0, x.shape[1]), dtype=np.float32),
+                   np.array([0, n]), np.arange(n), ids, texts)
+
+    @classmethod
+    def load(cls, date_dir: str, topic_key: str):
+        """Load the persisted index, or build an exact one from the .npy if it has none."""
+        vectors_path, ivf_path = index_paths(date_dir, topic_key)
+        ids = texts = None
+        rpath = rows_path(date_dir, topic_key)
+        if os.path.exists(rpath):
+            with open(rpath, "r") as f:
+                rows = json.load(f)
+            ids, texts = rows.get("ids"), rows.get("texts")
+
+        if os.path.exists(vectors_path) and os.path.exists(ivf_path):
+            with np.load(ivf_path) as f:
+                return cls(np.load(vectors_path, mmap_mode="r"), f["centroids"], f["offsets"], f["order"], ids, texts)
+
+        emb_path = os.path.join(date_dir, f"{topic_key}.npy")
+        if not os.path.exists(emb_path):
+            return None
+        return cls.from_embeddings(np.load(emb_path), ids, texts)
+
+    def __len__(self):
+        return len(self.order)
+
+    def search(self, query: np.ndarray, k: int = 10, nprobe: int = DEFAULT_NPROBE):
+        """Return [(row, score), ...] of the k nearest rows by cosine similarity."""
+        q = _normalize(np.asarray(query).reshape(-1))
+        if len(self.centroids) == 0:
+            candidates = np.arange(len(self.order))
+            scores = np.asarray(self.vectors @ q)
+        else:
+            lists = np.argsort(-(self.centroids @ q))[:max(1, nprobe)]
+            candidates = np.concatenate([
+                np.arange(self.offsets[l], self.offsets[l + 1]) for l in lists
+            ])
+            scores = np.asarray(self.vectors[candidates] @ q) if len(candidates) else np.empty(0)
+
+        k = min(k, len(scores))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(self.order[candidates[i]]), float(scores[i])) for i in top]
@@ -0,0 +1,330 @@
+"""
+Module: embedding_service.py
+Purpose: Long-lived local embedding worker on a Unix socket.
+
+Keeps the SentenceTransformer model warm in one process and batches requests
+from any number of clients (pipeline runs, the API, ad-hoc scripts).
+`Embedder` and `generate_embeddings_for_topic` use it automatically when it
+is running and fall back to loading the model in-process otherwise.
+
+Usage:
+    python -m api.utils.embedding_service serve [--socket PATH] [--model NAME]
+    python -m api.utils.embedding_service stats [--socket PATH]
+
+Wire format (both directions): 4-byte big-endian header length, JSON header,
+then `nbytes` of raw payload if the header declares one.
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import socket
+import struct
+import argparse
+import threading
+import logging
+import socketserver
+import numpy as np
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+SOCKET_NAME = "intentdriftwatch-embed.sock"
+
+
+def default_socket_path() -> str:
+    """$EMBEDDING_SERVICE_SOCKET, else the per-user $XDG_RUNTIME_DIR, else the data root (never shared /tmp)."""
+    if os.getenv("EMBEDDING_SERVICE_SOCKET"):
+        return os.environ["EMBEDDING_SERVICE_SOCKET"]
+    if os.getenv("XDG_RUNTIME_DIR"):
+        return os.path.join(os.environ["XDG_RUNTIME_DIR"], SOCKET_NAME)
+    data_root = os.getenv("INTENTDRIFTWATCH_DATA_ROOT") or os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(data_root, f".{SOCKET_NAME}")
+
+
+DEFAULT_SOCKET = default_socket_path()
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+
+
+def canonical_model_name(name: str) -> str:
+    return name.split("/")[-1] if name else name
+
+
+# ---------- Framing ----------
+def _recv_exact(sock, n: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(min(n - len(buf), 1 << 20))
+        if not chunk:
+            raise ConnectionError("socket closed")
+        buf.extend(chunk)
+    return bytes(buf)
+
+
+def send_message(sock, header: dict, payload: bytes = b""):
+    if payload:
+        header = dict(header, nbytes=len(payload))
+    raw = json.dumps(header).encode()
+    sock.sendall(struct.pack(">I", len(raw)) + raw + payload)
+
+
+def recv_message(sock):
+    (size,) = struct.unpack(">I", _recv_exact(sock, 4))
+    header = json.loads(_recv_exact(sock, size))
+    payload = _recv_exact(sock, header["nbytes"]) if header.get("nbytes") else b""
+    return header, payload
+
+
+# ---------- Server ----------
+class _Job:
+    __slots__ = ("texts", "normalize", "done", "result", "error")
+
+    def __init__(self, texts, normalize):
+        self.texts = texts
+        self.normalize = normalize
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class EmbeddingServer:
+    """Unix-socket server: one thread per client connection, one batching encode thread."""
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET, model_name: str = DEFAULT_MODEL,
+                 encode_fn=None, max_batch_size: int = 256, max_wait_ms: float = 5):
+        self.socket_path = socket_path
+        self.model_name = canonical_model_name(model_name)
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.jobs = queue.Queue()
+        self.started_at = time.time()
+        self.stats = {"requests": 0, "texts": 0, "batches": 0, "encode_seconds": 0.0, "errors": 0}
+        self._in_flight = 0
+        self._stats_lock = threading.Lock()
+        self._encode_fn = encode_fn
+        self._server = None
+
+    # ----- model -----
+    def _encode(self, texts, normalize):
+        if self._encode_fn is None:
+            from sentence_transformers import SentenceTransformer
+            logger.info(f"Loading embedding model: {self.model_name}")
+            model = SentenceTransformer(self.model_name)
+            self._encode_fn = lambda t, norm: model.encode(
+                t, batch_size=32, convert_to_numpy=True, normalize_embeddings=norm, show_progress_bar=False
+            )
+        return np.asarray(self._encode_fn(texts, normalize), dtype=np.float32)
+
+    # ----- batching loop -----
+    def _batch_loop(self):
+        while True:
+            first = self.jobs.get()
+            if first is None:
+                return
+            batch, size = [first], len(first.texts)
+            deadline = time.perf_counter() + self.max_wait
+            while size < self.max_batch_size:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    job = self.jobs.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if job is None:
+                    self.jobs.put(None)
+                    break
+                batch.append(job)
+                size += len(job.texts)
+
+            # one encode call per normalization mode present in the batch
+            for normalize in {j.normalize for j in batch}:
+                group = [j for j in batch if j.normalize == normalize]
+                texts = [t for j in group for t in j.texts]
+                self._in_flight = len(texts)
+                start = time.perf_counter()
+                try:
+                    emb = self._encode(texts, normalize)
+                    offset = 0
+                    for j in group:
+                        j.result = emb[offset:offset + len(j.texts)]
+                        offset += len(j.texts)
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    for j in group:
+                        j.error = str(e)
+                self.stats["batches"] += 1
+                self.stats["encode_seconds"] += time.perf_counter() - start
+                self._in_flight = 0
+                for j in group:
+                    j.done.set()
+
+    def snapshot_stats(self) -> dict:
+        uptime = time.time() - self.started_at
+        busy = self.stats["encode_seconds"]
+        return {
+            **self.stats,
+            "model": self.model_name,
+            "uptime_seconds": round(uptime, 2),
+            "queue_depth": self.jobs.qsize(),
+            "in_flight_texts": self._in_flight,
+            "avg_batch_texts": round(self.stats["texts"] / self.stats["batches"], 2) if self.stats["batches"] else 0,
+            "texts_per_second": round(self.stats["texts"] / busy, 2) if busy else 0,
+        }
+
+    # ----- request handling -----
+    def handle(self, header: dict, payload: bytes):
+        op = header.get("op")
+        if op == "ping":
+            return {"ok": True, "model": self.model_name}, b""
+        if op == "stats":
+            return {"ok": True, "stats": self.snapshot_stats()}, b""
+        if op == "encode":
+            requested = canonical_model_name(header.get("model") or self.model_name)
+            if requested != self.model_name:
+                return {"ok": False, "error": f"service runs {self.model_name}, not {requested}"}, b""
+            texts = header.get("texts", [])
+            with self._stats_lock:
+                self.stats["requests"] += 1
+                self.stats["texts"] += len(texts)
+            job = _Job(texts, bool(header.get("normalize", True)))
+            self.jobs.put(job)
+            job.done.wait()
+            if job.error:
+                return {"ok": False, "error": job.error}, b""
+            emb = np.ascontiguousarray(job.result, dtype="<f4")
+            return {"ok": True, "shape": list(emb.shape), "dtype": "<f4"}, emb.tobytes()
+        return {"ok": False, "error": f"unknown op: {op}"}, b""
+
+    def serve_forever(self):
+        service = self
+
+        class Server(socketserver.ThreadingUnixStreamServer):
+            # handler threads must not keep the process alive on shutdown
+            daemon_threads = True
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                while True:
+                    try:
+                        header, payload = recv_message(self.request)
+                    except (ConnectionError, struct.error):
+                        return
+                    response, body = service.handle(header, payload)
+                    send_message(self.request, response, body)
+
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        # owner-only socket: created 0600 (umask covers the bind, chmod makes it explicit)
+        old_umask = os.umask(0o177)
+        try:
+            self._server = Server(self.socket_path, Handler)
+        finally:
+            os.umask(old_umask)
+        os.chmod(self.socket_path, 0o600)
+        threading.Thread(target=self._batch_loop, daemon=True).start()
+        logger.info(f"🧠 Embedding service listening on {self.socket_path}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def shutdown(self):
+        self.jobs.put(None)
+        if self._server:
+            self._server.shutdown()
+
+
+# ---------- Client ----------
+class EmbeddingServiceClient:
+    """Blocking client; one connection reused across calls."""
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET, timeout: float = 300):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._sock = None
+        self._lock = threading.Lock()
+
+    def _request(self, header: dict):
+        with self._lock:
+            if self._sock is None:
+                self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self._sock.settimeout(self.timeout)
+                self._sock.connect(self.socket_path)
+            try:
+                send_message(self._sock, header)
+                response, payload = recv_message(self._sock)
+            except Exception:
+                self.close()
+                raise
+        if not response.get("ok"):
+            raise RuntimeError(response.get("error", "embedding service error"))
+        return response, payload
+
+    def encode(self, texts: list[str], normalize: bool = True, model: str = None) -> np.ndarray:
+        if not texts:
+            return np.empty((0, 384), dtype=np.float32)
+        response, payload = self._request({"op": "encode", "texts": list(texts), "normalize": normalize, "model": model})
+        return np.frombuffer(payload, dtype=response["dtype"]).reshape(response["shape"])
+
+    def stats(self) -> dict:
+        return self._request({"op": "stats"})[0]["stats"]
+
+    def ping(self) -> dict:
+        return self._request({"op": "ping"})[0]
+
+    def close(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+
+
+def get_service_client(socket_path: str = None, model: str = None):
+    """Return a connected client if the service is running (and serves `model`), else None."""
+    socket_path = socket_path or os.getenv("EMBEDDING_SERVICE_SOCKET", DEFAULT_SOCKET)
+    if not os.path.exists(socket_path):
+        return None
+    client = EmbeddingServiceClient(socket_path)
+    try:
+        info = client.ping()
+    except (OSError, RuntimeError, ConnectionError):
+        client.close()
+        return None
+    if model and canonical_model_name(model) != info.get("model"):
+        client.close()
+        return None
+    return client
+
+
+# ---------- CLI ----------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="IntentDriftWatch local embedding service")
+    parser.add_argument("command", choices=["serve", "stats"])
+    parser.add_argument("--socket", default=DEFAULT_SOCKET)
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--max-batch-size", type=int, default=256)
+    parser.add_argument("--max-wait-ms", type=float, default=5)
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        server = EmbeddingServer(args.socket, args.model, max_batch_size=args.max_batch_size,
+                                 max_wait_ms=args.max_wait_ms)
+        server._encode([""], True)  # warm the model before accepting clients
+        server.serve_forever()
+    else:
+        client = get_service_client(args.socket)
+        if client is None:
+            print(f"No embedding service running on {args.socket}")
+            sys.exit(1)
+        print(json.dumps(client.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,34 @@ Module: embeddings.py
 Purpose: Centralized embedding generator for IntentDriftWatch.
 """
 
-from sentence_transformers import SentenceTransformer
 import numpy as np
 import logging
+from api.utils.embedding_service import get_service_client
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
 class Embedder:
-    """Wrapper around SentenceTransformer for consistent embedding generation."""
+    """
+    Wrapper around SentenceTransformer for consistent embedding generation.
+    Uses the local embedding service (api/utils/embedding_service.py) when it
+    is running, so the model isn't loaded again in this process.
+    """
 
     def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+        self.model_name = model_name
+        self.model = None
+        self.client = get_service_client(model=model_name)
+        if self.client is not None:
+            logger.info(f"Using local embedding service for {model_name}")
+        else:
+            self._load_model()
+
+    def _load_model(self):
         try:
-            logger.info(f"Loading embedding model: {model_name}")
-            self.model = SentenceTransformer(model_name)
+            from sentence_transformers import SentenceTransformer
+            logger.info(f"Loading embedding model: {self.model_name}")
+            self.model = SentenceTransformer(self.model_name)
         except Exception as e:
             logger.error(f"Failed to load embedding model: {e}")
             raise
@@ -25,6 +39,13 @@ class Embedder:
         """Convert list of texts into dense vector embeddings."""
         if not texts:
             return np.empty((0, 384))
+        if self.client is not None:
+            try:
+                return self.client.encode(texts, normalize=True, model=self.model_name)
+            except Exception as e:
+                logger.warning(f"Embedding service unavailable ({e}); loading model in-process")
+                self.client = None
+                self._load_model()
         try:
             embeddings = self.model.encode(
                 texts,
@@ -0,0 +1,89 @@
+"""
+Module: micro_batcher.py
+Purpose: Merge concurrent embedding requests into single encode calls.
+
+Callers await `encode(texts)`; a background task collects whatever requests
+arrive within `max_wait_ms` (up to `max_batch_size` texts), runs one encode
+call in a worker thread, and hands each caller its slice of the result.
+"""
+
+import time
+import asyncio
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+
+class MicroBatcher:
+    """Async micro-batcher around a blocking `encode_fn(list[str]) -> np.ndarray`."""
+
+    def __init__(self, encode_fn, max_batch_size: int = 256, max_wait_ms: float = 10):
+        self.encode_fn = encode_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.stats = {"requests": 0, "texts": 0, "batches": 0, "encode_seconds": 0.0}
+        self._queue = None
+        self._worker = None
+
+    def _ensure_worker(self):
+        loop = asyncio.get_running_loop()
+        if self._worker is None or self._worker.done() or self._worker.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def encode(self, texts: list[str]) -> np.ndarray:
+        """Embed `texts`, sharing the encode call with concurrent requests."""
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((list(texts), future))
+        self.stats["requests"] += 1
+        self.stats["texts"] += len(texts)
+        return await future
+
+    async def _collect(self):
+        """Wait for one request, then gather more until the batch is full or the window closes."""
+        batch = [await self._queue.get()]
+        size = len(batch[0][0])
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+
+        while size < self.max_batch_size:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            # requests whose caller already gave up (latency budget) are skipped
+            batch = [(texts, fut) for texts, fut in batch if not fut.done()]
+            if not batch:
+                continue
+
+            all_texts = [t for texts, _ in batch for t in texts]
+            start = time.perf_counter()
+            try:
+                embeddings = await loop.run_in_executor(None, self.encode_fn, all_texts)
+            except Exception as e:
+                logger.error(f"Micro-batch encode failed: {e}")
+                for _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(e)
+                continue
+            self.stats["batches"] += 1
+            self.stats["encode_seconds"] += time.perf_counter() - start
+
+            offset = 0
+            for texts, fut in batch:
+                if not fut.done():
+                    fut.set_result(embeddings[offset:offset + len(texts)])
+                offset += len(texts)
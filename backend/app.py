@@ -13,6 +13,14 @@ from backend.routes.topic_history import router as topic_history_router
 from backend.routes.embeddings import router as embeddings_router
 from backend.routes.embeddings_info import router as emb_info_router
 from backend.routes.embeddings_topic import router as emb_topic_router
+from backend.routes.dashboard import router as dashboard_router
+from backend.routes.events import router as events_router
+from backend.routes.drift_score import router as drift_score_router
+from backend.routes.search import router as search_router
+from backend.routes.metrics import router as metrics_router
+
+from backend.utils.http_cache import conditional_get_middleware
+from backend.utils.metrics import metrics_middleware
 
 app = FastAPI(
     title="IntentDriftWatch API",
@@ -27,8 +35,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified", "X-Date", "X-Dtype", "X-Shape", "X-Total-Points"],
 )
 
+# ETag / 304 handling and gzip for polled dashboard routes
+app.middleware("http")(conditional_get_middleware)
+
+# Per-route latency / payload metrics (outermost, so 304s and cached bodies are counted)
+app.middleware("http")(metrics_middleware)
+
 # Register routers
 app.include_router(drift_summary_router)
 app.include_router(alert_router)
@@ -39,6 +54,11 @@ app.include_router(topic_history_router)
 app.include_router(embeddings_router)
 app.include_router(emb_info_router)
 app.include_router(emb_topic_router)
+app.include_router(dashboard_router)
+app.include_router(events_router)
+app.include_router(drift_score_router)
+app.include_router(search_router)
+app.include_router(metrics_router)
 
 @app.get("/")
 def root():
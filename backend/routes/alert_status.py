@@ -1,25 +1,14 @@
 from fastapi import APIRouter
-from pathlib import Path
-import json
+from backend.utils.summary_store import load_latest_summary
 
 router = APIRouter()
 
-BASE_DIR = Path(__file__).resolve().parents[2]
-SUMMARY_DIR = BASE_DIR / "drift_reports" / "summaries"
 
-@router.get("/alert_status")
-def get_alert_status():
-    """
-    Returns alert-level status based on latest drift summary.
-    """
-    files = sorted(SUMMARY_DIR.glob("drift_summary_*.json"))
-    if not files:
+def build_alert_view(data):
+    """Alert-level status for one summary."""
+    if not data:
         return {"status": "No data", "alerts": []}
 
-    latest_file = files[-1]
-    with open(latest_file) as f:
-        data = json.load(f)
-
     alerts = []
     for row in data.get("rows", []):
         if (
@@ -38,3 +27,11 @@ def get_alert_status():
         return {"status": "Drift Detected", "alerts": alerts}
     else:
         return {"status": "Stable", "alerts": []}
+
+
+@router.get("/alert_status")
+def get_alert_status():
+    """
+    Returns alert-level status based on latest drift summary.
+    """
+    return build_alert_view(load_latest_summary())
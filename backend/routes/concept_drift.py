@@ -1,22 +1,10 @@
 from fastapi import APIRouter
-import json
-from pathlib import Path
+from backend.utils.summary_store import load_latest_summary
 
 router = APIRouter()
 
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
-SUMMARY_DIR = BASE_DIR / "drift_reports" / "summaries"
 
-def load_latest_summary():
-    files = sorted(SUMMARY_DIR.glob("drift_summary_*.json"))
-    if not files:
-        return None
-    with open(files[-1]) as f:
-        return json.load(f)
-
-@router.get("/concept_drift")
-def get_concept_drift():
-    data = load_latest_summary()
+def build_concept_items(data):
     if not data:
         return {"items": []}
 
@@ -33,3 +21,8 @@ def get_concept_drift():
         })
 
     return {"items": items}
+
+
+@router.get("/concept_drift")
+def get_concept_drift():
+    return build_concept_items(load_latest_summary())
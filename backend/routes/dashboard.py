@@ -0,0 +1,65 @@
+from fastapi import APIRouter, HTTPException, Query
+from backend.utils.summary_store import load_summary_for_date
+from backend.routes.drift_summary import build_summary_view
+from backend.routes.alert_status import build_alert_view
+from backend.routes.semantic_drift import build_semantic_items
+from backend.routes.concept_drift import build_concept_items
+from backend.routes.drift_history import build_history
+from backend.routes.embeddings import list_embeddings
+
+router = APIRouter()
+
+DASHBOARD_VIEWS = [
+    "drift_summary",
+    "alert_status",
+    "semantic_drift",
+    "concept_drift",
+    "drift_history",
+    "embeddings_info",
+]
+
+# Views built from the single selected summary
+SUMMARY_VIEWS = {
+    "drift_summary": build_summary_view,
+    "alert_status": build_alert_view,
+    "semantic_drift": build_semantic_items,
+    "concept_drift": build_concept_items,
+}
+
+
+@router.get("/dashboard")
+def get_dashboard(
+    fields: str = Query(None, description="Comma-separated subset of: " + ", ".join(DASHBOARD_VIEWS)),
+    date: str = Query(None, description="YYYY-MM-DD (defaults to latest)"),
+):
+    """
+    Returns every view the dashboard needs on page load in one response,
+    built from a single load of the summary data.
+    """
+    if fields:
+        selected = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [f for f in selected if f not in DASHBOARD_VIEWS]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {unknown}. Valid fields: {DASHBOARD_VIEWS}"
+            )
+    else:
+        selected = DASHBOARD_VIEWS
+
+    out = {}
+
+    if "drift_history" in selected:
+        out["drift_history"] = build_history()
+
+    if any(v in SUMMARY_VIEWS for v in selected):
+        summary = load_summary_for_date(date)
+
+    for view in selected:
+        if view in SUMMARY_VIEWS:
+            out[view] = SUMMARY_VIEWS[view](summary)
+
+    if "embeddings_info" in selected:
+        out["embeddings_info"] = list_embeddings()
+
+    return out
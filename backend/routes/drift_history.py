@@ -1,42 +1,78 @@
-from fastapi import APIRouter, Query
-import json
-from pathlib import Path
+from fastapi import APIRouter, HTTPException, Query
+from bisect import bisect_left, bisect_right
+import datetime as dt
+from backend.utils.summary_store import load_rollup
+from monitoring.rollups import bucket_for
 
 router = APIRouter()
 
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
-SUMMARY_DIR = BASE_DIR / "drift_reports" / "summaries"
+DEFAULT_LIMIT = 1000
+MAX_LIMIT = 5000
+GRANULARITY_PATTERN = "^(day|week|month)$"
+
+
+def _check_date(value: str, name: str):
+    if value is None:
+        return
+    try:
+        dt.date.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"'{name}' must be YYYY-MM-DD")
+
+
+def select_buckets(rollup, start=None, end=None, limit=DEFAULT_LIMIT, cursor=None):
+    """
+    Page through a rollup's buckets in date order.
+    Buckets overlapping [start, end] are returned; `cursor` is the last bucket
+    key of the previous page. Returns ([(key, bucket), ...], next_cursor).
+    """
+    granularity = rollup["granularity"]
+    keys = sorted(rollup["buckets"])
+
+    lo = 0
+    if start:
+        lo = bisect_left(keys, bucket_for(start, granularity)[0])
+    if cursor:
+        lo = max(lo, bisect_right(keys, cursor))
+
+    hi = len(keys)
+    if end:
+        hi = bisect_right(keys, bucket_for(end, granularity)[0])
+
+    page = keys[lo:min(hi, lo + limit)]
+    next_cursor = page[-1] if page and lo + limit < hi else None
+    return [(k, rollup["buckets"][k]) for k in page], next_cursor
+
+
+def history_entry(key, bucket, granularity):
+    if granularity == "day":
+        return {"date": key, **bucket["values"]}
+    return {"date": bucket["start"], "period": key, "days": len(bucket["days"]), **bucket["values"]}
+
+
+def build_history(granularity="day", start=None, end=None, limit=DEFAULT_LIMIT, cursor=None):
+    """Average semantic / concept scores per period, served from rollups."""
+    rollup = load_rollup(granularity)
+    page, next_cursor = select_buckets(rollup, start, end, limit, cursor)
+    return {
+        "granularity": granularity,
+        "history": [history_entry(k, b, granularity) for k, b in page],
+        "next_cursor": next_cursor,
+    }
 
-def load_summary_file(path: Path):
-    if not path.exists():
-        return None
-    with open(path) as f:
-        return json.load(f)
 
 @router.get("/drift_history")
-def get_drift_history():
+def get_drift_history(
+    start: str = Query(None, description="YYYY-MM-DD (inclusive)"),
+    end: str = Query(None, description="YYYY-MM-DD (inclusive)"),
+    granularity: str = Query("day", pattern=GRANULARITY_PATTERN),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: str = Query(None, description="next_cursor from the previous page"),
+):
     """
-    Returns drift summary history for all available dates.
+    Returns drift summary history, optionally bounded and paginated.
     Used for line charts and history views.
     """
-    history = []
-
-    for file in sorted(SUMMARY_DIR.glob("drift_summary_*.json")):
-        data = load_summary_file(file)
-        if not data:
-            continue
-        rows = data.get("rows", [])
-        if not rows:
-            continue
-
-        # compute averages
-        semantic_scores = [r.get("semantic_score") for r in rows if isinstance(r.get("semantic_score"), (int, float))]
-        concept_scores = [r.get("test_acc") for r in rows if isinstance(r.get("test_acc"), (int, float))]
-
-        history.append({
-            "date": data.get("date"),
-            "semantic_drift_score": round(sum(semantic_scores)/len(semantic_scores), 4) if semantic_scores else None,
-            "concept_drift_score": round(sum(concept_scores)/len(concept_scores), 4) if concept_scores else None
-        })
-
-    return {"history": history}
+    _check_date(start, "start")
+    _check_date(end, "end")
+    return build_history(granularity, start, end, limit, cursor)
@@ -0,0 +1,56 @@
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+import time
+import asyncio
+from backend.utils import drift_scoring
+from data_pipeline.utils.text_cleaning import clean_texts
+
+router = APIRouter()
+
+MAX_TEXTS = 2000
+
+
+class DriftScoreRequest(BaseModel):
+    texts: list[str] = Field(..., description="Raw texts to score against the topic baseline")
+    budget_ms: int = Field(2000, ge=10, le=60000, description="Latency budget for embedding + scoring")
+
+
+@router.post("/topic/{topic_name}/drift_score")
+async def score_topic_drift(topic_name: str, req: DriftScoreRequest):
+    """
+    Semantic drift of ad-hoc texts versus the topic's latest embedding snapshot.
+    """
+    start = time.perf_counter()
+    topic_key = topic_name.replace(" ", "_")
+
+    # reject oversized requests before doing any work on them
+    if len(req.texts) > MAX_TEXTS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_TEXTS} texts per request")
+    texts = clean_texts(req.texts)
+    texts = [t for t in texts if t]
+    if not texts:
+        raise HTTPException(status_code=400, detail="No non-empty texts to score")
+
+    # loading a cold baseline and the embedding model both block: run them in threads, within the budget
+    deadline = start + req.budget_ms / 1000
+    try:
+        baseline = await asyncio.wait_for(
+            asyncio.to_thread(drift_scoring.baselines.get, topic_key), timeout=req.budget_ms / 1000
+        )
+        if baseline is None:
+            raise HTTPException(status_code=404, detail=f"No embedding baseline for topic '{topic_name}'")
+        new_emb = await asyncio.wait_for(
+            drift_scoring.encode(texts), timeout=max(0.0, deadline - time.perf_counter())
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail=f"Scoring exceeded latency budget of {req.budget_ms} ms")
+
+    result = drift_scoring.score_against_baseline(baseline["sample"], new_emb)
+    return {
+        "topic": topic_name.replace("_", " "),
+        "baseline_date": baseline["date"],
+        "baseline_samples": int(baseline["count"]),
+        "new_samples": len(texts),
+        **result,
+        "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+    }
@@ -1,14 +1,20 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
 import os
+import re
 import json
 import numpy as np
 from pathlib import Path
+from analytics.projection import stratified_sample
 
 router = APIRouter()
 
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
+BASE_DIR = Path(os.getenv("INTENTDRIFTWATCH_DATA_ROOT") or Path(__file__).resolve().parent.parent.parent)
 EMB_DIR = BASE_DIR / "data_pipeline" / "data" / "processed" / "embeddings"
 DRIFT_DIR = BASE_DIR / "data_pipeline" / "data" / "processed" / "drift_history"
+PROJ_DIR = BASE_DIR / "data_pipeline" / "data" / "processed" / "projections"
+
+MAX_PROJECTION_POINTS = 50000
 
 
 @router.get("/embeddings/info")
@@ -91,3 +97,62 @@ def get_topic_history(topic_name: str):
         "topic": topic_name,
         "history": history
     }
+
+
+@router.get("/embeddings/{topic_name}/projection")
+def get_topic_projection(
+    topic_name: str,
+    date: str = Query(None, description="YYYY-MM-DD (defaults to latest projected snapshot)"),
+    max_points: int = Query(2000, ge=1, le=MAX_PROJECTION_POINTS),
+    format: str = Query("binary", pattern="^(binary|json)$"),
+):
+    """
+    Returns the precomputed 2D projection of one snapshot, stratified-downsampled
+    to `max_points`. All dates of a topic share the same projection basis.
+
+    binary: little-endian float16 x,y pairs (row-major, shape in X-Shape header)
+    json:   {"points": [[x, y], ...], "indices": [...]} as a fallback
+    """
+    topic_key = topic_name.replace(" ", "_")
+    if date is not None and not re.fullmatch(r"\d{4}-\d{2}-\d{2}", date):
+        raise HTTPException(status_code=400, detail="Invalid date, expected YYYY-MM-DD")
+
+    if date is None:
+        dates = sorted(
+            d for d in os.listdir(PROJ_DIR)
+            if (PROJ_DIR / d / f"{topic_key}.npy").exists()
+        ) if PROJ_DIR.exists() else []
+        if not dates:
+            raise HTTPException(status_code=404, detail=f"No projections for topic '{topic_name}'")
+        date = dates[-1]
+
+    coords_path = PROJ_DIR / date / f"{topic_key}.npy"
+    strata_path = PROJ_DIR / date / f"{topic_key}_strata.npy"
+    if not coords_path.exists():
+        raise HTTPException(status_code=404, detail=f"No projection for '{topic_name}' on {date}")
+
+    coords = np.load(coords_path, mmap_mode="r")
+    strata = np.load(strata_path, mmap_mode="r") if strata_path.exists() else np.zeros(len(coords), dtype=np.uint8)
+    idx = stratified_sample(np.asarray(strata), max_points)
+    points = np.ascontiguousarray(coords[idx], dtype="<f2")
+
+    if format == "json":
+        return {
+            "topic": topic_name,
+            "date": date,
+            "total_points": int(len(coords)),
+            "points": points.astype(float).round(4).tolist(),
+            "indices": idx.tolist(),
+        }
+
+    return Response(
+        content=points.tobytes(),
+        media_type="application/octet-stream",
+        headers={
+            "X-Topic": topic_key,
+            "X-Date": date,
+            "X-Dtype": "float16",
+            "X-Shape": f"{len(points)},2",
+            "X-Total-Points": str(len(coords)),
+        },
+    )
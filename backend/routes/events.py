@@ -0,0 +1,41 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+import asyncio
+from backend.utils.event_bus import watcher, format_sse, CLOSED
+
+router = APIRouter()
+
+HEARTBEAT_SECONDS = 15
+
+
+@router.get("/events")
+async def stream_events(request: Request):
+    """
+    Server-sent events for new drift results.
+    Events: ready, summary, topic_status, alert.
+    """
+    queue = await watcher.subscribe()
+
+    async def event_stream():
+        try:
+            current = watcher.current_summary or {}
+            yield format_sse("ready", {"date": current.get("date")})
+            while True:
+                if await request.is_disconnected():
+                    break
+                try:
+                    message = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+                    if message is CLOSED:
+                        # dropped as a slow consumer; closing makes EventSource reconnect
+                        break
+                    yield message
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+        finally:
+            watcher.unsubscribe(queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,39 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from backend.utils import http_cache, summary_store, drift_scoring, snapshot_search
+from backend.utils.metrics import registry
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@registry.register_collector
+def collect_cache_stats():
+    """Cache and file I/O counters kept by the modules that own them."""
+    for result, n in http_cache.stats.items():
+        yield ("http_cache_responses_total", "counter",
+               "Conditional-GET middleware outcomes (not_modified, hits, misses, bypassed).",
+               {"result": result}, n)
+    yield ("summary_cache_hits_total", "counter", "Summary/rollup JSON served from the parsed cache.",
+           {}, summary_store.stats["hits"])
+    yield ("summary_cache_misses_total", "counter", "Summary/rollup JSON parsed from disk.",
+           {}, summary_store.stats["misses"])
+    yield ("backend_file_reads_total", "counter", "Data files read from disk by kind.",
+           {"kind": "summary"}, summary_store.stats["file_reads"])
+    yield ("backend_file_reads_total", "counter", "Data files read from disk by kind.",
+           {"kind": "baseline"}, drift_scoring.baselines.stats["loads"])
+    yield ("backend_file_reads_total", "counter", "Data files read from disk by kind.",
+           {"kind": "search_index"}, snapshot_search.indexes.stats["loads"])
+    yield ("http_response_cache_entries", "gauge", "Rendered responses held by the conditional-GET cache.",
+           {}, len(http_cache._response_cache))
+    yield ("summary_cache_entries", "gauge", "Parsed JSON files held by the summary store.",
+           {}, len(summary_store._cache))
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """
+    Prometheus text exposition of request latency / size histograms and cache counters.
+    """
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,78 @@
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+from typing import Optional
+import re
+import time
+import asyncio
+import numpy as np
+from backend.utils import drift_scoring
+from backend.utils.snapshot_search import indexes
+
+router = APIRouter()
+
+MAX_K = 100
+
+
+class SearchRequest(BaseModel):
+    text: Optional[str] = Field(None, description="Query text (embedded with the pipeline's model)")
+    vector: Optional[list[float]] = Field(None, description="Query embedding, instead of text")
+    date: Optional[str] = Field(None, description="Snapshot date (YYYY-MM-DD); latest if omitted")
+    k: int = Field(10, ge=1, le=MAX_K)
+    nprobe: Optional[int] = Field(None, ge=1, le=1024, description="IVF lists to scan (large snapshots only)")
+    budget_ms: int = Field(2000, ge=10, le=60000, description="Latency budget for embedding the query text")
+
+
+@router.post("/topic/{topic_name}/search")
+async def search_topic(topic_name: str, req: SearchRequest):
+    """
+    Nearest stored texts in a topic's embedding snapshot, by cosine similarity.
+    """
+    start = time.perf_counter()
+    topic_key = topic_name.replace(" ", "_")
+
+    if (req.text is None) == (req.vector is None):
+        raise HTTPException(status_code=400, detail="Provide exactly one of 'text' or 'vector'")
+    if req.date and not re.fullmatch(r"\d{4}-\d{2}-\d{2}", req.date):
+        raise HTTPException(status_code=400, detail="Invalid date, expected YYYY-MM-DD")
+
+    date, index = indexes.get(topic_key, req.date)
+    if index is None:
+        raise HTTPException(status_code=404, detail=f"No embedding snapshot for topic '{topic_name}'")
+
+    if req.vector is not None:
+        query = np.asarray(req.vector, dtype=np.float32)
+    else:
+        if not req.text.strip():
+            raise HTTPException(status_code=400, detail="Query text is empty")
+        try:
+            query = (await asyncio.wait_for(
+                drift_scoring.encode([req.text]), timeout=req.budget_ms / 1000
+            ))[0]
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=504, detail=f"Query embedding exceeded latency budget of {req.budget_ms} ms")
+
+    if query.shape[-1] != index.vectors.shape[1]:
+        raise HTTPException(status_code=400, detail=f"Query vector must have {index.vectors.shape[1]} dimensions")
+
+    search_start = time.perf_counter()
+    kwargs = {"nprobe": req.nprobe} if req.nprobe else {}
+    hits = index.search(query, req.k, **kwargs)
+    search_ms = (time.perf_counter() - search_start) * 1000
+
+    results = [
+        {
+            "row": row,
+            "id": index.ids[row] if index.ids else None,
+            "text": index.texts[row] if index.texts else None,
+            "score": round(score, 4),
+        }
+        for row, score in hits
+    ]
+    return {
+        "topic": topic_name.replace("_", " "),
+        "date": date,
+        "snapshot_rows": len(index),
+        "results": results,
+        "search_ms": round(search_ms, 3),
+        "latency_ms": round((time.perf_counter() - start) * 1000, 2),
+    }
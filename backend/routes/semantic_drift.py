@@ -1,22 +1,10 @@
 from fastapi import APIRouter
-import json
-from pathlib import Path
+from backend.utils.summary_store import load_latest_summary
 
 router = APIRouter()
 
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
-SUMMARY_DIR = BASE_DIR / "drift_reports" / "summaries"
 
-def load_latest_summary():
-    files = sorted(SUMMARY_DIR.glob("drift_summary_*.json"))
-    if not files:
-        return None
-    with open(files[-1]) as f:
-        return json.load(f)
-
-@router.get("/semantic_drift")
-def get_semantic_drift():
-    data = load_latest_summary()
+def build_semantic_items(data):
     if not data:
         return {"items": []}
 
@@ -34,3 +22,8 @@ def get_semantic_drift():
         })
 
     return {"items": items}
+
+
+@router.get("/semantic_drift")
+def get_semantic_drift():
+    return build_semantic_items(load_latest_summary())
@@ -1,42 +1,33 @@
-from fastapi import APIRouter
-import json
-from pathlib import Path
+from fastapi import APIRouter, Query
+from backend.utils.summary_store import load_rollup
+from backend.routes.drift_history import (
+    DEFAULT_LIMIT, MAX_LIMIT, GRANULARITY_PATTERN, _check_date, select_buckets, history_entry
+)
 
 router = APIRouter()
 
-BASE_DIR = Path(__file__).resolve().parent.parent.parent
-SUMMARY_DIR = BASE_DIR / "drift_reports" / "summaries"
-
-def load_history():
-    out = []
-    for file in sorted(SUMMARY_DIR.glob("drift_summary_*.json")):
-        with open(file) as f:
-            out.append(json.load(f))
-    return out
-
 @router.get("/topic/{topic_name}/history")
-def topic_history(topic_name: str):
+def topic_history(
+    topic_name: str,
+    start: str = Query(None, description="YYYY-MM-DD (inclusive)"),
+    end: str = Query(None, description="YYYY-MM-DD (inclusive)"),
+    granularity: str = Query("day", pattern=GRANULARITY_PATTERN),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: str = Query(None, description="next_cursor from the previous page"),
+):
     """
     Returns semantic + concept drift over time for one topic.
     """
-    data = load_history()
+    _check_date(start, "start")
+    _check_date(end, "end")
     topic = topic_name.replace("_", " ")
 
-    history = []
-
-    for summary in data:
-        for row in summary.get("rows", []):
-            if row.get("topic") == topic:
-                history.append({
-                    "date": summary.get("date"),
-                    "semantic_score": row.get("semantic_score"),
-                    "cosine_drift": row.get("cosine_drift"),
-                    "jsd_drift": row.get("jsd_drift"),
-                    "concept_accuracy_drop": row.get("accuracy_drop"),
-                    "concept_status": row.get("concept_status")
-                })
+    rollup = load_rollup(granularity, topic)
+    page, next_cursor = select_buckets(rollup, start, end, limit, cursor)
 
     return {
         "topic": topic,
-        "history": history
+        "granularity": granularity,
+        "history": [history_entry(k, b, granularity) for k, b in page],
+        "next_cursor": next_cursor,
     }
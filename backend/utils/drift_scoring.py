@@ -0,0 +1,130 @@
+"""
+Module: drift_scoring.py
+Purpose: On-demand semantic drift scoring of ad-hoc texts against a topic's current baseline.
+
+Scores use the nightly pipeline's metric (`semantic_drift_metrics`) and
+thresholds, so an ad-hoc score means the same as a score in the drift
+reports. Like the pipeline, the metric compares equally sized sets: a
+request of n texts is scored against n baseline rows. Those rows come from a
+fixed-size random sample of the snapshot, drawn once per snapshot with a
+fixed seed (reading only the sampled rows of the memory-mapped array) and
+kept in memory until a newer snapshot lands. The sample is stored in random
+order, so every prefix of it is itself a random sample and no part of the
+snapshot is favoured because of where its rows sit in the file.
+
+Query texts are embedded through a shared MicroBatcher, so concurrent
+requests share `encode` calls.
+"""
+
+import os
+import asyncio
+import logging
+import threading
+import numpy as np
+from pathlib import Path
+from api.utils.micro_batcher import MicroBatcher
+from analytics.semantic_drift import semantic_drift_metrics, drift_status
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(os.getenv("INTENTDRIFTWATCH_DATA_ROOT") or Path(__file__).resolve().parents[2])
+EMB_DIR = BASE_DIR / "data_pipeline" / "data" / "processed" / "embeddings"
+
+MAX_BATCH_SIZE = 256
+MAX_WAIT_MS = 10
+
+# baseline rows kept per snapshot (above the route's MAX_TEXTS, so requests are rarely truncated)
+BASELINE_SAMPLE_SIZE = 4096
+BASELINE_SAMPLE_SEED = 0
+
+_batcher = None
+_batcher_lock = threading.Lock()
+
+
+def get_batcher() -> MicroBatcher:
+    """Process-wide batcher; the embedding model is only loaded on first use (blocking: call off the event loop)."""
+    global _batcher
+    with _batcher_lock:
+        if _batcher is None:
+            from api.utils.embeddings import Embedder
+            embedder = Embedder()
+            _batcher = MicroBatcher(embedder.encode_texts, MAX_BATCH_SIZE, MAX_WAIT_MS)
+        return _batcher
+
+
+async def encode(texts: list) -> np.ndarray:
+    """Embed texts through the shared batcher, loading the model in a worker thread if needed."""
+    batcher = _batcher or await asyncio.to_thread(get_batcher)
+    return await batcher.encode(texts)
+
+
+def baseline_sample(emb: np.ndarray, size: int = BASELINE_SAMPLE_SIZE, seed: int = BASELINE_SAMPLE_SEED):
+    """Seeded random sample of up to `size` rows, in random order; reads only those rows of a memmap."""
+    rng = np.random.default_rng(seed)
+    size = min(size, len(emb))
+    rows = np.sort(rng.choice(len(emb), size=size, replace=False))
+    return np.asarray(emb[rows], dtype=np.float32)[rng.permutation(size)]
+
+
+class BaselineCache:
+    """topic_key -> latest snapshot (date, row count, row sample) kept in memory."""
+
+    def __init__(self, emb_dir: Path = EMB_DIR):
+        self.emb_dir = emb_dir
+        self._baselines = {}
+        self.stats = {"loads": 0}
+        self._lock = threading.Lock()
+
+    def latest_snapshot(self, topic_key: str):
+        if not self.emb_dir.exists():
+            return None, None
+        for date in sorted(os.listdir(self.emb_dir), reverse=True):
+            path = self.emb_dir / date / f"{topic_key}.npy"
+            if path.exists():
+                return date, path
+        return None, None
+
+    def get(self, topic_key: str):
+        """
+        Return {"date", "count", "sample"} for the topic, resampling only when a
+        newer snapshot lands. Blocking (file reads): call off the event loop.
+        """
+        with self._lock:
+            date, path = self.latest_snapshot(topic_key)
+            if path is None:
+                self._baselines.pop(topic_key, None)
+                return None
+
+            st = path.stat()
+            version = (str(path), st.st_mtime_ns, st.st_size)
+            cached = self._baselines.get(topic_key)
+            if cached and cached["version"] == version:
+                return cached
+
+            self.stats["loads"] += 1
+            logger.info(f"🔄 Loading drift baseline for '{topic_key}' from {date}")
+            emb = np.load(path, mmap_mode="r")
+            baseline = {"version": version, "date": date, "count": len(emb), "sample": baseline_sample(emb)}
+            self._baselines[topic_key] = baseline
+            return baseline
+
+
+baselines = BaselineCache()
+
+
+def score_against_baseline(baseline_sample: np.ndarray, new_emb: np.ndarray) -> dict:
+    """
+    Drift of new embeddings versus a baseline sample, with the pipeline's metric.
+    As in the pipeline, both sides are cut to the same number of rows.
+    """
+    new_emb = np.asarray(new_emb, dtype=np.float32)
+    n = min(len(baseline_sample), len(new_emb))
+    cosine_drift, jsd, drift_score = semantic_drift_metrics(baseline_sample[:n], new_emb[:n])
+    return {
+        "cosine_drift": float(cosine_drift),
+        "jsd_drift": float(jsd),
+        "drift_score": float(drift_score),
+        "status": drift_status(drift_score),
+        "compared_samples": n,
+    }
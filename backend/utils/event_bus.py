@@ -0,0 +1,175 @@
+"""
+Module: event_bus.py
+Purpose: Watch the drift summaries and push small change events to subscribers (SSE).
+
+One watcher per process polls the summary directory signature; only when it
+changes is the latest summary loaded and diffed against the previous one.
+Open dashboards just wait on their queue, so idle connections cost nothing
+between pipeline runs. A subscriber that falls a full queue behind is dropped:
+its queue is replaced by a CLOSED marker, its stream ends, and the browser's
+EventSource reconnects and gets a fresh `ready` event. All file system work
+(directory signature, summary loads) runs in worker threads, including the
+initial load when the first subscriber starts the watcher.
+"""
+
+import json
+import asyncio
+import logging
+from backend.utils.summary_store import SUMMARY_DIR, load_latest_summary
+from backend.utils.http_cache import dir_signature, invalidate_data_version
+from backend.routes.alert_status import build_alert_view
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = 2.0
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# queued for a dropped subscriber: its stream should end so the client reconnects
+CLOSED = object()
+
+
+# ---------- Diffing ----------
+def _statuses(summary):
+    if not summary:
+        return {}
+    return {
+        r.get("topic"): (r.get("semantic_status"), r.get("concept_status"))
+        for r in summary.get("rows", [])
+    }
+
+
+def diff_summaries(prev, curr):
+    """
+    Compare two summaries and return a list of (event_name, payload) tuples:
+    - summary:      a new summary date (or regenerated summary) is available
+    - topic_status: a topic's semantic/concept status changed
+    - alert:        a topic entered the alert list
+    """
+    if not curr:
+        return []
+
+    events = []
+    if not prev or prev.get("date") != curr.get("date") or prev.get("generated_at") != curr.get("generated_at"):
+        events.append(("summary", {
+            "date": curr.get("date"),
+            "generated_at": curr.get("generated_at"),
+            "topic_count": len(curr.get("rows", [])),
+        }))
+
+    old_status, new_status = _statuses(prev), _statuses(curr)
+    for topic, (sem, con) in sorted(new_status.items(), key=lambda kv: str(kv[0])):
+        before = old_status.get(topic)
+        if before != (sem, con):
+            events.append(("topic_status", {
+                "topic": topic,
+                "date": curr.get("date"),
+                "semantic_status": sem,
+                "concept_status": con,
+                "previous": {"semantic_status": before[0], "concept_status": before[1]} if before else None,
+            }))
+
+    old_alerts = {a["topic"] for a in build_alert_view(prev)["alerts"]} if prev else set()
+    for alert in build_alert_view(curr)["alerts"]:
+        if alert["topic"] not in old_alerts:
+            events.append(("alert", dict(alert, date=curr.get("date"))))
+
+    return events
+
+
+def format_sse(event: str, payload: dict, event_id: int = None) -> str:
+    """Serialize one event in text/event-stream framing."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(payload, separators=(',', ':'))}")
+    return "\n".join(lines) + "\n\n"
+
+
+# ---------- Watcher ----------
+class SummaryWatcher:
+    """Polls the summary directory and fans change events out to subscriber queues."""
+
+    def __init__(self, poll_interval: float = POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self.subscribers = set()
+        self.event_id = 0
+        self._signature = None
+        self._summary = None
+        self._task = None
+        self._primed = None
+
+    @property
+    def current_summary(self):
+        return self._summary
+
+    async def subscribe(self) -> asyncio.Queue:
+        """Register a subscriber queue; returns once the current summary is loaded."""
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.subscribers.add(queue)
+        await self._ensure_running()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self.subscribers.discard(queue)
+
+    async def _ensure_running(self):
+        if self._task is None or self._task.done():
+            self._primed = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        await self._primed.wait()
+
+    def _load(self):
+        """(summary directory signature, latest summary); blocking I/O."""
+        signature, _ = dir_signature(SUMMARY_DIR)
+        return signature, load_latest_summary()
+
+    def check(self):
+        """Single poll step: returns events if the summaries changed on disk."""
+        signature, _ = dir_signature(SUMMARY_DIR)
+        if signature == self._signature:
+            return []
+        self._signature = signature
+        invalidate_data_version()
+        summary = load_latest_summary()
+        events = diff_summaries(self._summary, summary)
+        self._summary = summary
+        return events
+
+    def publish(self, event: str, payload: dict):
+        self.event_id += 1
+        message = format_sse(event, payload, self.event_id)
+        for queue in list(self.subscribers):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # slow consumer: drop it and end its stream, the client's EventSource will reconnect
+                self.subscribers.discard(queue)
+                self._close(queue)
+
+    @staticmethod
+    def _close(queue: asyncio.Queue):
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(CLOSED)
+
+    async def _run(self):
+        try:
+            self._signature, self._summary = await asyncio.to_thread(self._load)
+        except Exception as e:
+            logger.warning(f"Summary watcher start failed: {e}")
+        finally:
+            self._primed.set()
+        # stops by itself once the last subscriber leaves
+        while self.subscribers:
+            try:
+                # directory walk + summary load are blocking I/O
+                for event, payload in await asyncio.to_thread(self.check):
+                    self.publish(event, payload)
+            except Exception as e:
+                logger.warning(f"Summary watcher poll failed: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+
+watcher = SummaryWatcher()
@@ -0,0 +1,234 @@
+"""
+Module: http_cache.py
+Purpose: Conditional GET (ETag / Last-Modified) and gzip handling for the dashboard API.
+
+The dashboard polls the same endpoints many times between pipeline runs, while the
+files behind them change at most a few times a day. Every GET response carries a
+strong ETag derived from the version of the data directories, so repeat polls are
+answered with 304 before the route runs, and rendered bodies are reused until the
+data changes.
+
+The data version covers every file under the watched directories (path, size,
+mtime), so rewriting any summary or snapshot in place changes it. Walking the
+tree is O(files), so the version is cached for VERSION_TTL_S and refreshed in a
+worker thread, off the event loop; the summary watcher also invalidates it as
+soon as it sees a change.
+"""
+
+import os
+import time
+import gzip
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from fastapi import Request
+from fastapi.responses import Response
+
+# Root of the data tree served by the API; INTENTDRIFTWATCH_DATA_ROOT overrides it
+# (benchmarks, fixtures). Read at import time by every backend module.
+BASE_DIR = Path(os.getenv("INTENTDRIFTWATCH_DATA_ROOT") or Path(__file__).resolve().parents[2])
+
+# Directories whose contents back the API responses
+WATCHED_DIRS = [
+    BASE_DIR / "drift_reports" / "summaries",
+    BASE_DIR / "data_pipeline" / "data" / "processed" / "embeddings",
+    BASE_DIR / "data_pipeline" / "data" / "processed" / "drift_history",
+    BASE_DIR / "data_pipeline" / "data" / "processed" / "projections",
+]
+
+# Paths that must never be buffered or answered from cache
+EXEMPT_PATHS = {"/events", "/metrics"}
+
+GZIP_MIN_SIZE = 1024
+GZIP_LEVEL = 6
+GZIP_SUFFIX = "-gzip"
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+RESPONSE_CACHE_SIZE = 256
+
+# how long a computed data version is reused before the tree is walked again
+VERSION_TTL_S = 1.0
+
+# "<etag>|<encoding>" -> (body, headers); bounded LRU of rendered responses
+_response_cache = OrderedDict()
+
+stats = {"not_modified": 0, "hits": 0, "misses": 0, "bypassed": 0}
+
+# (version, last_modified) and the monotonic time it was computed
+_version = {"value": None, "at": 0.0}
+_version_lock = threading.Lock()
+
+
+# ---------- Data version ----------
+def dir_signature(path: Path):
+    """
+    Signature of a data directory from the (relative path, size, mtime) of
+    every file below it, so adding, removing or rewriting any file changes it.
+
+    Returns (signature_digest, latest_mtime_ns).
+    """
+    if not path.is_dir():
+        return str(path), 0
+
+    entries = []
+    latest = path.stat().st_mtime_ns
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            try:
+                st = os.stat(os.path.join(root, name))
+            except FileNotFoundError:  # replaced while walking
+                continue
+            entries.append((os.path.relpath(os.path.join(root, name), path), st.st_size, st.st_mtime_ns))
+            latest = max(latest, st.st_mtime_ns)
+    digest = hashlib.sha1(repr((str(path), entries)).encode()).hexdigest()
+    return digest, latest
+
+
+def data_version():
+    """Return (version_hash, last_modified_epoch) for all watched directories."""
+    results = [dir_signature(p) for p in WATCHED_DIRS]
+    signatures = [sig for sig, _ in results]
+    digest = hashlib.sha1(repr(signatures).encode()).hexdigest()[:16]
+
+    last_modified = max(mtime for _, mtime in results) / 1e9
+    return digest, last_modified
+
+
+def _fresh_version(ttl: float = VERSION_TTL_S):
+    if _version["value"] is not None and time.monotonic() - _version["at"] < ttl:
+        return _version["value"]
+    return None
+
+
+def cached_data_version(ttl: float = VERSION_TTL_S):
+    """data_version(), reused for `ttl` seconds; concurrent callers share one walk."""
+    with _version_lock:
+        value = _fresh_version(ttl)
+        if value is None:
+            value = data_version()
+            _version.update(value=value, at=time.monotonic())
+        return value
+
+
+def invalidate_data_version():
+    """Force the next request to recompute the data version (e.g. after a watcher event)."""
+    with _version_lock:
+        _version["value"] = None
+
+
+def make_etag(version: str, request: Request) -> str:
+    """Strong ETag for a (data version, path, query) combination."""
+    query = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+    key = f"{version}|{request.url.path}|{query}"
+    return '"' + hashlib.sha1(key.encode()).hexdigest()[:20] + '"'
+
+
+# ---------- Helpers ----------
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    base = etag.strip('"')
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        candidate = candidate.strip('"')
+        if candidate.endswith(GZIP_SUFFIX):
+            candidate = candidate[: -len(GZIP_SUFFIX)]
+        if candidate == base:
+            return True
+    return False
+
+
+def _not_modified(request: Request, etag: str, last_modified: float) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(last_modified) <= int(since)
+    return False
+
+
+def _accepts_gzip(request: Request) -> bool:
+    return "gzip" in request.headers.get("accept-encoding", "").lower()
+
+
+def _cache_headers(etag: str, last_modified: float) -> dict:
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    if last_modified:
+        headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+    return headers
+
+
+def _remember(key: str, body: bytes, headers: dict):
+    _response_cache[key] = (body, headers)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
+
+def clear_response_cache():
+    _response_cache.clear()
+
+
+# ---------- Middleware ----------
+async def conditional_get_middleware(request: Request, call_next):
+    """
+    - 304 when If-None-Match / If-Modified-Since match the current data version
+    - Reuse previously rendered bodies for the same ETag
+    - gzip compressible payloads above GZIP_MIN_SIZE
+    """
+    if request.method != "GET" or request.url.path in EXEMPT_PATHS:
+        stats["bypassed"] += 1
+        return await call_next(request)
+
+    # walking the data tree is blocking I/O: keep it off the event loop
+    version, last_modified = _fresh_version() or await asyncio.to_thread(cached_data_version)
+    etag = make_etag(version, request)
+
+    if _not_modified(request, etag, last_modified):
+        stats["not_modified"] += 1
+        return Response(status_code=304, headers=_cache_headers(etag, last_modified))
+
+    use_gzip = _accepts_gzip(request)
+    cache_key = f"{etag}|{'gzip' if use_gzip else 'identity'}"
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        _response_cache.move_to_end(cache_key)
+        stats["hits"] += 1
+        body, headers = cached
+        return Response(content=body, status_code=200, headers=headers)
+
+    stats["misses"] += 1
+    response = await call_next(request)
+    content_type = response.headers.get("content-type", "")
+    if response.status_code != 200 or content_type.startswith("text/event-stream"):
+        return response
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    headers = {
+        k: v for k, v in response.headers.items()
+        if k.lower() not in ("content-length", "etag", "last-modified", "cache-control", "vary")
+    }
+
+    if use_gzip and len(body) >= GZIP_MIN_SIZE and content_type.startswith(COMPRESSIBLE_TYPES):
+        body = gzip.compress(body, compresslevel=GZIP_LEVEL)
+        headers["Content-Encoding"] = "gzip"
+        etag = etag[:-1] + GZIP_SUFFIX + '"'
+
+    headers.update(_cache_headers(etag, last_modified))
+    _remember(cache_key, body, headers)
+    return Response(content=body, status_code=200, headers=headers)
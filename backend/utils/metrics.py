@@ -0,0 +1,162 @@
+"""
+Module: metrics.py
+Purpose: In-process request metrics for the backend, rendered in Prometheus text format.
+
+Recording is a dict lookup plus a bisect per observation. Cache and file I/O
+counters are not duplicated here: the modules that own them keep plain `stats`
+dicts, which are read only when /metrics is scraped.
+"""
+
+import time
+from bisect import bisect_left
+from fastapi import Request
+from starlette.routing import Match
+
+# Seconds; covers cached 304s (sub-ms) up to slow history/projection reads
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# Bytes
+SIZE_BUCKETS = (128, 512, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)   # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """Labelled counters and histograms, keyed by (name, sorted label items)."""
+
+    def __init__(self):
+        self.help = {}
+        self.counters = {}
+        self.histograms = {}
+        self.collectors = []
+
+    def describe(self, name: str, kind: str, text: str):
+        self.help[name] = (kind, text)
+
+    def inc(self, name: str, labels: dict = None, amount: float = 1):
+        key = (name, tuple(sorted((labels or {}).items())))
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name: str, labels: dict, value: float, buckets):
+        key = (name, tuple(sorted(labels.items())))
+        hist = self.histograms.get(key)
+        if hist is None:
+            hist = self.histograms[key] = Histogram(buckets)
+        hist.observe(value)
+
+    def register_collector(self, fn):
+        """fn() -> iterable of (name, kind, help, labels, value), evaluated at scrape time."""
+        self.collectors.append(fn)
+        return fn
+
+    def clear(self):
+        self.counters.clear()
+        self.histograms.clear()
+
+    def render(self) -> str:
+        families = {}
+        for (name, labels), value in self.counters.items():
+            families.setdefault(name, []).append(_sample(name, labels, value))
+
+        for (name, labels), hist in self.histograms.items():
+            lines = families.setdefault(name, [])
+            cumulative = 0
+            for bound, n in zip(self.buckets_with_inf(hist.buckets), hist.counts):
+                cumulative += n
+                lines.append(_sample(f"{name}_bucket", labels + (("le", bound),), cumulative))
+            lines.append(_sample(f"{name}_sum", labels, hist.sum))
+            lines.append(_sample(f"{name}_count", labels, hist.count))
+
+        help_text = dict(self.help)
+        for collect in self.collectors:
+            for name, kind, text, labels, value in collect():
+                help_text.setdefault(name, (kind, text))
+                families.setdefault(name, []).append(_sample(name, tuple(sorted(labels.items())), value))
+
+        out = []
+        for name in sorted(families):
+            if name in help_text:
+                kind, text = help_text[name]
+                out.append(f"# HELP {name} {text}")
+                out.append(f"# TYPE {name} {kind}")
+            out.extend(families[name])
+        return "\n".join(out) + "\n"
+
+    @staticmethod
+    def buckets_with_inf(buckets):
+        return [_format_value(b) for b in buckets] + ["+Inf"]
+
+
+def _format_value(v) -> str:
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v)) if abs(v) < 1e15 else repr(v)
+    return str(v)
+
+
+def _escape(v) -> str:
+    return str(v).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _sample(name: str, labels: tuple, value) -> str:
+    if labels:
+        inner = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+        return f"{name}{{{inner}}} {_format_value(value)}"
+    return f"{name} {_format_value(value)}"
+
+
+registry = MetricsRegistry()
+registry.describe("http_requests_total", "counter", "HTTP requests by route template, method and status.")
+registry.describe("http_request_duration_seconds", "histogram", "Time from request received to response headers.")
+registry.describe("http_response_size_bytes", "histogram", "Response body size (when known up front).")
+
+
+# ---------- Middleware ----------
+def _iter_routes(routes):
+    """Leaf routes, descending into included routers when the router keeps them nested."""
+    for route in routes:
+        if hasattr(route, "path"):
+            yield route
+        else:
+            yield from _iter_routes(getattr(getattr(route, "original_router", route), "routes", []))
+
+
+def route_label(request: Request) -> str:
+    """Route template (e.g. /topic/{topic_name}/history) to keep label cardinality bounded."""
+    route = request.scope.get("route")
+    if route is None:
+        # answered by an outer middleware (304 / cached body) before routing ran
+        for candidate in _iter_routes(request.app.router.routes):
+            if candidate.matches(request.scope)[0] == Match.FULL:
+                route = candidate
+                break
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+async def metrics_middleware(request: Request, call_next):
+    start = time.perf_counter()
+    response = await call_next(request)
+    elapsed = time.perf_counter() - start
+
+    route = route_label(request)
+    method = request.method
+    registry.inc("http_requests_total", {"route": route, "method": method, "status": str(response.status_code)})
+    registry.observe("http_request_duration_seconds", {"route": route, "method": method}, elapsed, LATENCY_BUCKETS)
+
+    size = response.headers.get("content-length")
+    if size is not None:
+        registry.observe("http_response_size_bytes", {"route": route, "method": method}, int(size), SIZE_BUCKETS)
+    return response
@@ -0,0 +1,69 @@
+"""
+Module: snapshot_search.py
+Purpose: Cached per-snapshot vector indexes for nearest-text search.
+
+Indexes are opened once (vectors memory-mapped) and kept until the snapshot
+files change; only the most recently used few are held open.
+"""
+
+import os
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from analytics.vector_index import SnapshotIndex, index_paths, rows_path
+from backend.utils.drift_scoring import EMB_DIR
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+MAX_OPEN_INDEXES = 8
+
+
+class IndexCache:
+    """(date, topic_key) -> SnapshotIndex, LRU-bounded and invalidated on file changes."""
+
+    def __init__(self, emb_dir: Path = EMB_DIR, max_size: int = MAX_OPEN_INDEXES):
+        self.emb_dir = emb_dir
+        self.max_size = max_size
+        self._indexes = OrderedDict()
+        self.stats = {"loads": 0}
+
+    def latest_date(self, topic_key: str):
+        if not self.emb_dir.exists():
+            return None
+        for date in sorted(os.listdir(self.emb_dir), reverse=True):
+            if (self.emb_dir / date / f"{topic_key}.npy").exists():
+                return date
+        return None
+
+    def _version(self, date_dir: str, topic_key: str):
+        paths = [os.path.join(date_dir, f"{topic_key}.npy"), rows_path(date_dir, topic_key), *index_paths(date_dir, topic_key)]
+        return tuple(os.stat(p).st_mtime_ns if os.path.exists(p) else None for p in paths)
+
+    def get(self, topic_key: str, date: str = None):
+        """Return (date, SnapshotIndex) for the requested or latest snapshot, or (date, None)."""
+        date = date or self.latest_date(topic_key)
+        if date is None:
+            return None, None
+        date_dir = str(self.emb_dir / date)
+        if not os.path.exists(os.path.join(date_dir, f"{topic_key}.npy")):
+            return date, None
+
+        key = (date, topic_key)
+        version = self._version(date_dir, topic_key)
+        cached = self._indexes.get(key)
+        if cached and cached[0] == version:
+            self._indexes.move_to_end(key)
+            return date, cached[1]
+
+        self.stats["loads"] += 1
+        logger.info(f"🔎 Opening search index for '{topic_key}' ({date})")
+        index = SnapshotIndex.load(date_dir, topic_key)
+        self._indexes[key] = (version, index)
+        self._indexes.move_to_end(key)
+        while len(self._indexes) > self.max_size:
+            self._indexes.popitem(last=False)
+        return date, index
+
+
+indexes = IndexCache()
@@ -0,0 +1,123 @@
+"""
+Module: summary_store.py
+Purpose: Shared, cached access to drift summary files for all backend routes.
+
+Summaries are parsed once and reused until the file's (mtime, size) changes,
+so routes and the bundled /dashboard view don't re-read the same JSON.
+"""
+
+import os
+import json
+from pathlib import Path
+from backend.utils.http_cache import dir_signature
+from monitoring.rollups import rollup_path, empty_rollup, build_overall_rollup, build_topic_rollup
+
+BASE_DIR = Path(os.getenv("INTENTDRIFTWATCH_DATA_ROOT") or Path(__file__).resolve().parents[2])
+SUMMARY_DIR = BASE_DIR / "drift_reports" / "summaries"
+ROLLUP_DIR = BASE_DIR / "drift_reports" / "rollups"
+
+# path -> (mtime_ns, size, parsed JSON)
+_cache = {}
+
+# (granularity, topic, summary dir signature) -> rollup built in memory
+_fallback_rollups = {}
+
+stats = {"hits": 0, "misses": 0, "file_reads": 0}
+
+
+def summary_files():
+    """All summary JSON files, oldest first (dates sort lexically)."""
+    return sorted(SUMMARY_DIR.glob("drift_summary_*.json"))
+
+
+def load_json_cached(path: Path):
+    """Load a JSON file, served from cache while unchanged on disk."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        _cache.pop(path, None)
+        return None
+
+    cached = _cache.get(path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        stats["hits"] += 1
+        return cached[2]
+
+    stats["misses"] += 1
+    stats["file_reads"] += 1
+    with open(path) as f:
+        data = json.load(f)
+    _cache[path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def load_summary(path: Path):
+    """Load one summary file."""
+    return load_json_cached(path)
+
+
+def load_latest_summary():
+    files = summary_files()
+    if not files:
+        return None
+    return load_summary(files[-1])
+
+
+def load_summary_for_date(date: str = None):
+    """Summary for a specific date, falling back to the latest one."""
+    if date:
+        target = SUMMARY_DIR / f"drift_summary_{date}.json"
+        if target.exists():
+            return load_summary(target)
+    return load_latest_summary()
+
+
+def load_all_summaries():
+    """All parsed summaries, oldest first."""
+    out = []
+    for path in summary_files():
+        data = load_summary(path)
+        if data:
+            out.append(data)
+    return out
+
+
+def _summary_date(path: Path):
+    return path.stem.replace("drift_summary_", "")
+
+
+def load_rollup(granularity: str, topic: str = None):
+    """
+    Persisted rollup written by monitoring/rollups.py. If it doesn't cover
+    every summary on disk yet (e.g. summaries copied in by hand), an
+    equivalent rollup is built in memory from the cached summaries.
+    """
+    files = summary_files()
+    if not files:
+        return empty_rollup(granularity)
+
+    overall = load_json_cached(Path(rollup_path(granularity, rollup_dir=ROLLUP_DIR)))
+    dates = (overall or {}).get("dates", [])
+    if dates and dates[-1] == _summary_date(files[-1]) and len(dates) >= len(files):
+        if topic is None:
+            return overall
+        rollup = load_json_cached(Path(rollup_path(granularity, topic, ROLLUP_DIR)))
+        return rollup or empty_rollup(granularity)
+
+    signature = dir_signature(SUMMARY_DIR)[0]
+    key = (granularity, topic, signature)
+    if key not in _fallback_rollups:
+        # drop rollups built for an older state of the summary directory
+        for stale in [k for k in _fallback_rollups if k[2] != signature]:
+            del _fallback_rollups[stale]
+        summaries = load_all_summaries()
+        if topic is None:
+            _fallback_rollups[key] = build_overall_rollup(summaries, granularity)
+        else:
+            _fallback_rollups[key] = build_topic_rollup(summaries, topic, granularity)
+    return _fallback_rollups[key]
+
+
+def clear_cache():
+    _cache.clear()
+    _fallback_rollups.clear()
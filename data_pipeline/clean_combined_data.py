@@ -9,34 +9,73 @@ import logging
 import datetime as dt
 from glob import glob
 from data_pipeline.utils.io_utils import ensure_dir, save_json
-from data_pipeline.utils.text_cleaning import clean_texts
+from data_pipeline.utils.text_cleaning import clean_batch, clean_text, CLEANING_VERSION
+from data_pipeline.utils.stage_cache import get_stage_cache, code_fingerprint
+from data_pipeline.utils.near_dedup import dedupe, find_near_duplicates, DEFAULT_THRESHOLD
+from data_pipeline.utils import record_store
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def clean_combined_topic(topic: str):
-    """Load latest combined data, clean texts, and save a date-versioned cleaned file."""
-    # find the latest combined file (non-dated, always overwritten)
-    pattern = os.path.join("data_pipeline/data/processed/combined", f"{topic.replace(' ', '_')}_combined*.json")
-    files = sorted(glob(pattern))
-    if not files:
-        logger.warning(f"No combined data found for {topic}")
-        return None
+# Jaccard similarity (over 5-byte shingles) above which a text is dropped as a near-duplicate
+DEDUP_THRESHOLD = DEFAULT_THRESHOLD
 
-    latest_file = files[-1]
-    with open(latest_file, "r") as f:
-        data = json.load(f)
 
+def records_from_combined(data: dict, topic: str) -> list:
+    """
+    One record per combined text with its provenance. Combined files written
+    before provenance was tracked fall back to source=None and the file's
+    collected_at.
+    """
     texts = data.get("texts", [])
-    if not texts:
-        logger.warning(f"No texts to clean for {topic}")
-        return None
+    provenance = data.get("provenance") or {}
+    ids = provenance.get("id") or [None] * len(texts)
+    sources = provenance.get("source") or [None] * len(texts)
+    collected = provenance.get("collected_at") or [data.get("collected_at")] * len(texts)
+    return [
+        {"id": rid or record_store.record_id(source or "", text), "topic": topic, "source": source,
+         "collected_at": collected_at, "raw_text": text}
+        for text, rid, source, collected_at in zip(texts, ids, sources, collected)
+        if text and isinstance(text, str)
+    ]
+
 
-    cleaned = clean_texts(texts)
+def clean_records(records: list, already_clean: bool = False, dedup_threshold: float = DEDUP_THRESHOLD):
+    """
+    Fill clean_text / content_hash on each record and drop near-duplicates
+    (MinHash/LSH; dedup_threshold=None keeps them). Returns (kept records,
+    dedup stats or None).
+    """
+    raw = [r["raw_text"] for r in records]
+    # collectors may have cleaned these with the current rules already; cleaning is idempotent
+    cleaned = raw if already_clean else clean_batch(raw)
+    for record, text in zip(records, cleaned):
+        record["clean_text"] = text
+        record["content_hash"] = record_store.content_hash(text)
 
-    # update fields
-    data["texts"] = cleaned
-    data["num_cleaned_texts"] = len(cleaned)
+    # syndicated headlines / cross-posts: keep the first of each near-duplicate group
+    if dedup_threshold is None:
+        return records, None
+    kept, stats = dedupe(cleaned, threshold=dedup_threshold)
+    return [records[i] for i in kept], stats
+
+
+def write_cleaned(topic: str, data: dict, records: list, dedup_stats: dict = None, store: bool = True) -> list:
+    """
+    Save the date-versioned cleaned JSON built from `data` (the combined
+    document) and, if `store` and pyarrow is available, the records to the
+    Parquet record store. Returns the written paths, cleaned JSON first.
+    """
+    data = dict(data)
+    # per-record provenance lives in the record store
+    data.pop("provenance", None)
+    if dedup_stats:
+        data["dedup"] = dedup_stats
+    data["texts"] = [r["clean_text"] for r in records]
+    # record ids aligned with texts, so embedding rows can be joined back to their records
+    data["ids"] = [r["id"] for r in records]
+    data["num_cleaned_texts"] = len(records)
+    data["cleaning_version"] = CLEANING_VERSION
     data["cleaned_at"] = str(dt.datetime.utcnow())
 
     # make sure output dir exists
@@ -49,9 +88,61 @@ def clean_combined_topic(topic: str):
         f"{topic.replace(' ', '_')}_cleaned_{today}.json"
     )
 
+    outputs = [output_path]
+    if store and record_store.available():
+        store_path = record_store.write_records(records, topic, today)
+        data["records_path"] = store_path
+        outputs.append(store_path)
+
     save_json(data, output_path)
-    logger.info(f"✅ Cleaned data for '{topic}' → {output_path}")
-    return output_path
+    return outputs
+
+
+def clean_combined_topic(topic: str, force: bool = False, dedup_threshold: float = DEDUP_THRESHOLD):
+    """
+    Load latest combined data, clean texts, drop near-duplicates (MinHash/LSH;
+    dedup_threshold=None keeps them) and save a date-versioned cleaned file.
+    With pyarrow installed, the cleaned records and their provenance are also
+    written to the Parquet record store.
+    """
+    # find the latest combined file (non-dated, always overwritten)
+    pattern = os.path.join("data_pipeline/data/processed/combined", f"{topic.replace(' ', '_')}_combined*.json")
+    files = sorted(glob(pattern))
+    if not files:
+        logger.warning(f"No combined data found for {topic}")
+        return None
+
+    latest_file = files[-1]
+    cache = get_stage_cache()
+    fingerprint = cache.fingerprint([latest_file], {
+        "dedup_threshold": dedup_threshold,
+        "record_store": record_store.available(),
+        "code": code_fingerprint(clean_combined_topic, records_from_combined, clean_records, clean_text,
+                                 dedupe, find_near_duplicates, write_cleaned, record_store.write_records),
+    })
+    cached = None if force else cache.lookup("clean", topic, fingerprint)
+    if cached:
+        logger.info(f"⏭️ Combined data for '{topic}' unchanged, keeping {cached[0]}")
+        return cached[0]
+
+    with open(latest_file, "r") as f:
+        data = json.load(f)
+
+    records = records_from_combined(data, topic)
+    if not records:
+        logger.warning(f"No texts to clean for {topic}")
+        return None
+
+    already_clean = data.get("cleaning_version") == CLEANING_VERSION
+    records, dedup_stats = clean_records(records, already_clean, dedup_threshold)
+    if dedup_stats:
+        logger.info(f"🧹 Dropped {dedup_stats['exact_duplicates']} exact and {dedup_stats['near_duplicates']} "
+                    f"near-duplicate texts for '{topic}'")
+
+    outputs = write_cleaned(topic, data, records, dedup_stats)
+    cache.record("clean", topic, fingerprint, outputs)
+    logger.info(f"✅ Cleaned data for '{topic}' → {outputs[0]}")
+    return outputs[0]
 
 
 if __name__ == "__main__":
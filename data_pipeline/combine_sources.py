@@ -12,6 +12,8 @@ import logging
 from glob import glob
 from data_pipeline.utils.io_utils import save_json, ensure_dir
 from data_pipeline.utils.log_data_collection import log_collection_event
+from data_pipeline.utils.stage_cache import get_stage_cache, code_fingerprint
+from data_pipeline.utils.record_store import record_id
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -24,52 +26,98 @@ RAW_PATHS = {
 }
 
 
-def load_texts_from_json(path):
+def load_source_records(topic: str, source: str, path: str):
+    """
+    (records, cleaning_version) of a raw source file. Each record keeps its
+    provenance (id, source, collected_at); version is None if not marked clean.
+    """
     try:
         with open(path, "r") as f:
             data = json.load(f)
-            return data.get("texts", [])
     except Exception as e:
         logger.error(f"Failed to read {path}: {e}")
-        return []
-
+        return [], None
+    collected_at = data.get("collected_at")
+    records = [
+        {"id": record_id(source, text), "topic": topic, "source": source,
+         "collected_at": collected_at, "raw_text": text}
+        for text in data.get("texts", []) if text and isinstance(text, str)
+    ]
+    return records, data.get("cleaning_version")
 
-def combine_topic_data(topic: str):
-    """Merge all available source files for a topic into one combined dataset (overwrite mode)."""
-    combined_texts = []
-    found_sources = []
 
+def latest_source_files(topic: str):
+    """{source: latest raw file} for every source that has data for the topic."""
+    latest = {}
     for source, dir_path in RAW_PATHS.items():
         pattern = os.path.join(dir_path, f"{topic.replace(' ', '_')}_*.json")
         files = glob(pattern)
-        if not files:
-            continue
-
-        latest_file = sorted(files)[-1]  # pick the latest file by date
-        texts = load_texts_from_json(latest_file)
-        if texts:
-            combined_texts.extend(texts)
+        if files:
+            latest[source] = sorted(files)[-1]  # pick the latest file by date
+    return latest
+
+
+def combine_topic_records(topic: str, latest_files: dict = None):
+    """
+    (records, found sources, cleaning_version) merged from the latest file of
+    every source. cleaning_version is set only if every source was cleaned
+    with the same rules.
+    """
+    latest_files = latest_source_files(topic) if latest_files is None else latest_files
+    records, found_sources, versions = [], [], set()
+    for source, latest_file in latest_files.items():
+        source_records, cleaning_version = load_source_records(topic, source, latest_file)
+        if source_records:
+            records.extend(source_records)
             found_sources.append(source)
+            versions.add(cleaning_version)
+    return records, found_sources, versions.pop() if len(versions) == 1 else None
 
-    if not combined_texts:
-        logger.warning(f"No data found for topic '{topic}' in any source.")
-        return None
 
-    ensure_dir("data_pipeline/data/processed/combined")
-    combined_data = {
+def combined_payload(topic: str, records: list, found_sources: list, cleaning_version=None) -> dict:
+    """The combined JSON document for a topic's records."""
+    return {
         "topic": topic,
         "sources": found_sources,
         "collected_at": str(dt.datetime.utcnow()),
-        "total_texts": len(combined_texts),
-        "texts": combined_texts
+        "total_texts": len(records),
+        "cleaning_version": cleaning_version,
+        "texts": [r["raw_text"] for r in records],
+        # per-text provenance, aligned with `texts`
+        "provenance": {field: [r[field] for r in records] for field in ("id", "source", "collected_at")},
     }
 
+
+def combined_path(topic: str) -> str:
     # overwrite each run → no date suffix
-    filename = f"{topic.replace(' ', '_')}_combined.json"
-    path = os.path.join("data_pipeline/data/processed/combined", filename)
+    return os.path.join("data_pipeline/data/processed/combined", f"{topic.replace(' ', '_')}_combined.json")
+
+
+def combine_topic_data(topic: str, force: bool = False):
+    """Merge all available source files for a topic into one combined dataset (overwrite mode)."""
+    latest_files = latest_source_files(topic)
+    cache = get_stage_cache()
+    fingerprint = cache.fingerprint(
+        list(latest_files.values()),
+        {"sources": sorted(latest_files),
+         "code": code_fingerprint(combine_topic_data, combine_topic_records, load_source_records, combined_payload)}
+    ) if latest_files else None
+    cached = cache.lookup("combine", topic, fingerprint) if fingerprint and not force else None
+    if cached:
+        logger.info(f"⏭️ Raw inputs for '{topic}' unchanged, keeping {cached[0]}")
+        return cached[0]
+
+    records, found_sources, cleaning_version = combine_topic_records(topic, latest_files)
+    if not records:
+        logger.warning(f"No data found for topic '{topic}' in any source.")
+        return None
 
+    combined_data = combined_payload(topic, records, found_sources, cleaning_version)
+    path = combined_path(topic)
+    ensure_dir(os.path.dirname(path))
     save_json(combined_data, path)
     log_collection_event(topic, "combined", path)
+    cache.record("combine", topic, fingerprint, [path])
 
     logger.info(f"✅ Combined data for '{topic}' from {found_sources} → {path}")
     return path
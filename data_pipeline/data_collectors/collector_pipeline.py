@@ -5,11 +5,11 @@ Purpose: Unified entry point to collect data from all sources
 """
 
 import logging
-import time
 from data_pipeline.data_collectors.reddit_scraper import fetch_reddit_posts
 from data_pipeline.data_collectors.wiki_scraper import fetch_wiki_page
 from data_pipeline.data_collectors.twitter_scraper import fetch_twitter_posts
 from data_pipeline.data_collectors.rss_scraper import fetch_rss_articles
+from data_pipeline.data_collectors.scheduler import CollectorScheduler, CollectionJob, results_by_topic
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -24,42 +24,32 @@ TOPICS = [
     "Elections"
 ]
 
-def run_collector_pipeline(topics=TOPICS, sleep_gap=10):
-    """
-    Run all available data collectors (Reddit, Wiki, X, RSS)
-    for each topic sequentially.
-    """
+def collection_jobs(topics):
+    """One job per (source, topic)."""
+    jobs = []
     for topic in topics:
-        logger.info(f"\n🚀 Starting data collection for: {topic}\n")
-
-        # Reddit
-        try:
-            fetch_reddit_posts(topic, limit=100)
-        except Exception as e:
-            logger.error(f"❌ Reddit collection failed for {topic}: {e}")
-
-        # Wikipedia
-        try:
-            fetch_wiki_page(topic)
-        except Exception as e:
-            logger.error(f"❌ Wikipedia collection failed for {topic}: {e}")
+        jobs.append(CollectionJob("reddit", topic, fetch_reddit_posts, {"limit": 100}, paged=True))
+        jobs.append(CollectionJob("wikipedia", topic, fetch_wiki_page))
+        # jobs.append(CollectionJob("x", topic, fetch_twitter_posts, {"limit": 50}, paged=True))
+        jobs.append(CollectionJob("rss", topic, fetch_rss_articles, {"limit": 30}))
+    return jobs
 
-        # Twitter (X)
-        # try:
-            # fetch_twitter_posts(topic, limit=50)
-            # logger.info("⏳ Waiting before next API call to avoid rate limit...")
-            # time.sleep(sleep_gap)
-        # except Exception as e:
-            # logger.error(f"Twitter collection failed for {topic}: {e}")
 
-        # RSS
-        try:
-            fetch_rss_articles(topic, limit=30)
-        except Exception as e:
-            logger.error(f"RSS collection failed for {topic}: {e}")
-
-        logger.info(f"✅ Completed data collection for topic: {topic}\n")
-        time.sleep(5)  # small gap between topics
+def run_collector_pipeline(topics=TOPICS, limits=None):
+    """
+    Run all available data collectors (Reddit, Wiki, X, RSS) for every topic.
+    Sources run concurrently, each under its own rate limit (see scheduler.SOURCE_LIMITS).
+    """
+    logger.info(f"\n🚀 Starting data collection for {len(topics)} topic(s)\n")
+    results = CollectorScheduler(limits).run(collection_jobs(topics))
+
+    for topic, topic_results in results_by_topic(results).items():
+        failed = [r["source"] for r in topic_results if r["status"] == "failed"]
+        if failed:
+            logger.error(f"❌ Collection incomplete for {topic}: {', '.join(failed)} failed")
+        else:
+            logger.info(f"✅ Completed data collection for topic: {topic}")
+    return results
 
 
 if __name__ == "__main__":
@@ -0,0 +1,158 @@
+"""
+Module: incremental.py
+Purpose: Shared helpers for incremental collection.
+
+- per-(source, topic) state files under data_pipeline/data/state/<source>/,
+  one file per topic so concurrently running collectors never share a file
+- conditional HTTP GET (ETag / Last-Modified)
+- a bounded seen-id index, and a Bloom filter for large cross-day seen sets
+- appending new texts to today's raw file instead of overwriting it
+"""
+
+import os
+import math
+import zlib
+import base64
+import hashlib
+import datetime as dt
+import logging
+import urllib.request
+import urllib.error
+from data_pipeline.utils.io_utils import save_json, load_json
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+STATE_DIR = "data_pipeline/data/state"
+USER_AGENT = "IntentDriftWatch/0.1 (https://github.com/sriksven/IntentDriftWatch)"
+HTTP_TIMEOUT_S = 30
+MAX_SEEN_IDS = 5000
+BLOOM_CAPACITY = 50000
+BLOOM_ERROR_RATE = 0.01
+
+
+def state_path(source: str, topic: str) -> str:
+    return os.path.join(STATE_DIR, source, f"{topic.replace(' ', '_')}.json")
+
+
+def load_state(source: str, topic: str) -> dict:
+    path = state_path(source, topic)
+    return load_json(path) if os.path.exists(path) else {}
+
+
+def save_state(source: str, topic: str, state: dict):
+    save_json(state, state_path(source, topic))
+
+
+def conditional_get(url: str, etag: str = None, modified: str = None, timeout: float = HTTP_TIMEOUT_S):
+    """
+    GET `url`, sending If-None-Match / If-Modified-Since when validators are known.
+    Returns (status, body, headers); body is None on 304 Not Modified. Other
+    HTTP errors raise, so the collection scheduler can retry them.
+    """
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    if etag:
+        request.add_header("If-None-Match", etag)
+    if modified:
+        request.add_header("If-Modified-Since", modified)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as resp:
+            return resp.status, resp.read(), resp.headers
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return 304, None, e.headers
+        raise
+
+
+class SeenIds:
+    """Insertion-ordered set of item ids that keeps only the newest `max_size`."""
+
+    def __init__(self, ids=(), max_size: int = MAX_SEEN_IDS):
+        self.max_size = max_size
+        self._ids = dict.fromkeys(ids)
+
+    def __contains__(self, item_id) -> bool:
+        return item_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, item_id):
+        self._ids.pop(item_id, None)
+        self._ids[item_id] = None
+        while len(self._ids) > self.max_size:
+            del self._ids[next(iter(self._ids))]
+
+    def to_list(self) -> list:
+        return list(self._ids)
+
+
+class BloomFilter:
+    """
+    Compact seen-set: membership tests may return false positives (at most
+    `error_rate` while under capacity) but never false negatives. Once
+    `capacity` items have been added it starts over empty; the collectors'
+    cursors keep old items out, so the filter only has to cover recent overlap.
+    """
+
+    def __init__(self, capacity: int = BLOOM_CAPACITY, error_rate: float = BLOOM_ERROR_RATE,
+                 bits: bytes = None, count: int = 0):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray(bits) if bits else bytearray((self.size + 7) // 8)
+        self.count = count
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(str(item).encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def __contains__(self, item) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(item))
+
+    def add(self, item):
+        if self.count >= self.capacity:
+            self.bits = bytearray(len(self.bits))
+            self.count = 0
+        for p in self._positions(item):
+            self.bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "capacity": self.capacity,
+            "error_rate": self.error_rate,
+            "count": self.count,
+            "bits": base64.b64encode(zlib.compress(bytes(self.bits))).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict = None) -> "BloomFilter":
+        if not data:
+            return cls()
+        return cls(data["capacity"], data["error_rate"],
+                   zlib.decompress(base64.b64decode(data["bits"])), data["count"])
+
+
+def save_daily_texts(raw_dir: str, topic: str, source: str, texts: list, cleaning_version: int = None) -> str:
+    """
+    Append texts to today's raw file for the topic (creating it if needed);
+    returns its path. `cleaning_version` marks the texts as already cleaned,
+    and is kept only if the existing file was cleaned with the same version.
+    """
+    filename = f"{topic.replace(' ', '_')}_{dt.datetime.utcnow().strftime('%Y-%m-%d')}.json"
+    path = os.path.join(raw_dir, filename)
+    previous = load_json(path) if os.path.exists(path) else {}
+    if previous and previous.get("cleaning_version") != cleaning_version:
+        cleaning_version = None
+    save_json({
+        "topic": topic,
+        "source": source,
+        "collected_at": str(dt.datetime.utcnow()),
+        "cleaning_version": cleaning_version,
+        "texts": previous.get("texts", []) + list(texts),
+    }, path)
+    return path
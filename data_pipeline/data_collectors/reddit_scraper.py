@@ -1,69 +1,113 @@
 """
 Module: reddit_scraper.py
 Purpose: Fetch Reddit posts using the official Reddit API (PRAW) — no Pushshift dependency.
+
+Collection is incremental: each topic keeps a cursor (newest submission id and
+time seen) and a Bloom-filter seen-set in data_pipeline/data/state/reddit/.
+Search results (newest first) are paged through until the cursor is reached,
+so only posts not collected before are appended to today's raw file.
+PRAW fetches the listing lazily, one request per 100 posts: under the
+collection scheduler each request after the first waits for its own
+rate-limit token (`acquire`).
 """
 
-import praw
 import datetime as dt
+import itertools
 import logging
 import os
 from dotenv import load_dotenv
-from data_pipeline.utils.io_utils import save_json, ensure_dir
-from data_pipeline.utils.text_cleaning import clean_texts
+from data_pipeline.utils.io_utils import ensure_dir
+from data_pipeline.utils.text_cleaning import clean_texts, CLEANING_VERSION
 from data_pipeline.utils.log_data_collection import log_collection_event
+from data_pipeline.data_collectors.incremental import load_state, save_state, BloomFilter, save_daily_texts
 
 # ---------------- Logging ----------------
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# ---------------- Load environment variables ----------------
-load_dotenv()
+RAW_DIR = "data_pipeline/data/raw/reddit"
+MAX_ITEMS = 1000  # upper bound when paging back to the cursor
+PAGE_SIZE = 100   # posts per listing request (PRAW's maximum)
+
+_reddit = None
+
+
+def get_reddit_client():
+    """PRAW client, created on first use from the environment (.env)."""
+    global _reddit
+    if _reddit is None:
+        import praw
+        load_dotenv()
+        _reddit = praw.Reddit(
+            client_id=os.getenv("REDDIT_CLIENT_ID"),
+            client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
+            user_agent=os.getenv("REDDIT_USER_AGENT")
+        )
+    return _reddit
 
-reddit = praw.Reddit(
-    client_id=os.getenv("REDDIT_CLIENT_ID"),
-    client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
-    user_agent=os.getenv("REDDIT_USER_AGENT")
-)
+
+def paced(listing, acquire=None, page_size: int = PAGE_SIZE):
+    """Iterate a lazily paged listing, calling `acquire()` before each page after the first."""
+    items = iter(listing)
+    for n in itertools.count():
+        if acquire and n and n % page_size == 0:
+            acquire()
+        try:
+            yield next(items)
+        except StopIteration:
+            return
 
 
 # ---------------- Main Function ----------------
-def fetch_reddit_posts(topic: str, subreddit: str = "all", limit: int = 200):
-    """Fetch recent Reddit submissions containing the topic."""
-    raw_dir = "data_pipeline/data/raw/reddit"
-    ensure_dir(raw_dir)
+def fetch_reddit_posts(topic: str, subreddit: str = "all", limit: int = 200, max_items: int = MAX_ITEMS,
+                       acquire=None):
+    """
+    Fetch Reddit submissions containing the topic that are newer than the
+    topic's cursor. The first run takes the newest `limit` posts.
+    `acquire()` is called before every listing request after the first.
+    """
+    ensure_dir(RAW_DIR)
+    state = load_state("reddit", topic)
+    cursor = state.get("cursor")
+    seen = BloomFilter.from_dict(state.get("seen"))
 
     posts = []
+    newest = None
     try:
-        for submission in reddit.subreddit(subreddit).search(topic, limit=limit, sort="new"):
+        results = get_reddit_client().subreddit(subreddit).search(
+            topic, limit=max_items if cursor else limit, sort="new"
+        )
+        for submission in paced(results, acquire):
+            if newest is None:
+                newest = {"id": submission.id, "created_utc": submission.created_utc}
+            if cursor and (submission.id == cursor["id"] or submission.created_utc < cursor["created_utc"]):
+                break
+            if submission.id in seen:
+                continue
+            seen.add(submission.id)
             text = f"{submission.title} {submission.selftext}"
             if text.strip():
                 posts.append(text.strip())
 
+        state["cursor"] = newest or cursor
+        state["seen"] = seen.to_dict()
+        state["checked_at"] = str(dt.datetime.utcnow())
         if not posts:
-            logger.warning(f"No Reddit posts found for topic '{topic}'.")
+            save_state("reddit", topic, state)
+            logger.info(f"⏭️ No new Reddit posts for topic '{topic}'.")
             return None
 
         cleaned = clean_texts(posts)
-
-        data = {
-            "topic": topic,
-            "source": "reddit",
-            "collected_at": str(dt.datetime.utcnow()),
-            "texts": cleaned
-        }
-
-        filename = f"{topic.replace(' ', '_')}_{dt.datetime.utcnow().strftime('%Y-%m-%d')}.json"
-        path = os.path.join(raw_dir, filename)
-        save_json(data, path)
+        path = save_daily_texts(RAW_DIR, topic, "reddit", cleaned, CLEANING_VERSION)
+        save_state("reddit", topic, state)
         log_collection_event(topic, "reddit", path)
 
-        logger.info(f"✅ Collected {len(cleaned)} Reddit posts for '{topic}' → {path}")
+        logger.info(f"✅ Collected {len(cleaned)} new Reddit posts for '{topic}' → {path}")
         return path
 
     except Exception as e:
         logger.error(f"❌ Error fetching Reddit posts for '{topic}': {e}")
-        log_collection_event(topic, "reddit", f"failed: {e}")
-        return None
+        raise  # the collection scheduler retries and logs the final failure
 
 
 # ---------------- CLI Runner ----------------
@@ -1,48 +1,90 @@
+"""
+Module: rss_scraper.py
+Purpose: Incremental Google News RSS collection.
+
+Each topic's feed is fetched conditionally: the ETag / Last-Modified of the
+last response are stored in data_pipeline/data/state/rss/<Topic>.json and
+sent back, so an unchanged feed costs a 304 and nothing is written. Entry ids
+already stored are remembered in the same file, and only new articles are
+appended to today's raw file. Set RSS_FEED_URL (a template with `{query}`) to
+point the collector at another feed service.
+"""
+
 import feedparser
 import datetime as dt
 import logging
 import os
 from urllib.parse import quote_plus
-from data_pipeline.utils.io_utils import save_json, ensure_dir
-from data_pipeline.utils.text_cleaning import clean_texts
+from data_pipeline.utils.io_utils import ensure_dir
+from data_pipeline.utils.text_cleaning import clean_texts, CLEANING_VERSION
 from data_pipeline.utils.log_data_collection import log_collection_event
+from data_pipeline.data_collectors.incremental import (
+    load_state, save_state, conditional_get, SeenIds, save_daily_texts
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def fetch_rss_articles(topic: str, limit: int = 30):
-    """Fetch latest Google News RSS articles for a given topic."""
-    ensure_dir("data_pipeline/data/raw/news")
+RAW_DIR = "data_pipeline/data/raw/news"
+RSS_FEED_URL = os.getenv(
+    "RSS_FEED_URL", "https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"
+)
+
+
+def feed_url(topic: str) -> str:
+    return RSS_FEED_URL.format(query=quote_plus(topic))
+
+
+def entry_id(entry) -> str:
+    return entry.get("id") or entry.get("link") or entry.get("title", "")
+
 
-    encoded_topic = quote_plus(topic)
-    url = f"https://news.google.com/rss/search?q={encoded_topic}&hl=en-US&gl=US&ceid=US:en"
+def fetch_rss_articles(topic: str, limit: int = 30, force: bool = False):
+    """Fetch new Google News RSS articles for a topic; returns today's raw file or None if nothing is new."""
+    ensure_dir(RAW_DIR)
+    url = feed_url(topic)
+    state = load_state("rss", topic)
+    # validators only apply to the URL they came from
+    validators = state if state.get("url") == url and not force else {}
 
     try:
-        feed = feedparser.parse(url)
+        status, body, headers = conditional_get(url, validators.get("etag"), validators.get("modified"))
+        state.update(url=url, checked_at=str(dt.datetime.utcnow()))
+        if status == 304:
+            save_state("rss", topic, state)
+            logger.info(f"⏭️ RSS feed for '{topic}' not modified since last fetch")
+            return None
+        state["etag"] = headers.get("ETag")
+        state["modified"] = headers.get("Last-Modified")
+
+        feed = feedparser.parse(body)
         if not feed.entries:
             logger.warning(f"No RSS entries found for {topic}.")
+            save_state("rss", topic, state)
             return None
 
-        articles = [entry.title + " " + entry.description for entry in feed.entries[:limit]]
-        cleaned = clean_texts(articles)
-
-        data = {
-            "topic": topic,
-            "source": "rss",
-            "collected_at": str(dt.datetime.utcnow()),
-            "texts": cleaned
-        }
+        seen = SeenIds(state.get("seen", []))
+        new_entries = [e for e in feed.entries[:limit] if entry_id(e) not in seen]
+        for entry in new_entries:
+            seen.add(entry_id(entry))
+        state["seen"] = seen.to_list()
+        if not new_entries:
+            logger.info(f"⏭️ No new RSS articles for '{topic}'")
+            save_state("rss", topic, state)
+            return None
 
-        filename = f"{topic.replace(' ', '_')}_{dt.datetime.utcnow().strftime('%Y-%m-%d')}.json"
-        path = os.path.join("data_pipeline/data/raw/news", filename)
-        save_json(data, path)
+        articles = [entry.get("title", "") + " " + entry.get("description", "") for entry in new_entries]
+        cleaned = clean_texts(articles)
+        path = save_daily_texts(RAW_DIR, topic, "rss", cleaned, CLEANING_VERSION)
+        # state last: a crash before this point refetches rather than loses articles
+        save_state("rss", topic, state)
         log_collection_event(topic, "rss", path)
 
-        logger.info(f"✅ Collected {len(cleaned)} RSS articles for '{topic}' → {path}")
+        logger.info(f"✅ Collected {len(cleaned)} new RSS articles for '{topic}' → {path}")
         return path
     except Exception as e:
         logger.error(f"❌ Failed to fetch RSS for {topic}: {e}")
-        return None
+        raise
 
 
 if __name__ == "__main__":
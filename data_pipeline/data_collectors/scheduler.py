@@ -0,0 +1,165 @@
+"""
+Module: scheduler.py
+Purpose: Concurrent collection engine with per-source rate limits.
+
+Every source (Reddit, Wikipedia, RSS, X) gets its own thread pool, sized by
+the source's concurrency cap, and its own token bucket. Sources therefore run
+in parallel at their own pace: a slow or rate-limited API doesn't hold up the
+others, and no API sees more than its configured requests/s. Buckets and
+concurrency caps belong to the scheduler, so they also hold when several
+threads call `run()` on the same scheduler at once. Failed jobs are
+retried with exponential backoff and jitter; each retry takes a fresh token.
+Paged jobs (`paged=True`) get an `acquire` callback and take one more token
+before every page after the first, so the limits count API requests, not jobs.
+A job that still fails after its last attempt is recorded once in the data
+collection log (collectors themselves only raise).
+
+Usage:
+    scheduler = CollectorScheduler()
+    results = scheduler.run([CollectionJob("rss", topic, fetch_rss_articles) for topic in topics])
+"""
+
+import time
+import random
+import threading
+import logging
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from data_pipeline.utils.log_data_collection import log_collection_event
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# rate = sustained requests/s, burst = bucket size, concurrency = parallel requests
+SOURCE_LIMITS = {
+    "reddit": {"rate": 1.0, "burst": 2, "concurrency": 2},        # OAuth API: 60 requests/min
+    "wikipedia": {"rate": 10.0, "burst": 10, "concurrency": 4},
+    "rss": {"rate": 2.0, "burst": 4, "concurrency": 4},
+    "x": {"rate": 0.1, "burst": 1, "concurrency": 1},             # recent search: ~1 request / 10s
+}
+DEFAULT_LIMITS = {"rate": 1.0, "burst": 1, "concurrency": 1}
+
+MAX_ATTEMPTS = 3
+BACKOFF_S = 2.0
+MAX_BACKOFF_S = 60.0
+
+# paged: fn(topic, acquire=..., **kwargs) calls acquire() before each request after its first
+CollectionJob = namedtuple("CollectionJob", ["source", "topic", "fn", "kwargs", "paged"], defaults=[None, False])
+
+
+class TokenBucket:
+    """Thread-safe token bucket; `acquire()` blocks until a request may be sent."""
+
+    def __init__(self, rate: float, burst: int = 1, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token, sleeping until it is available. Returns the time waited."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # reserve the token now (the balance may go negative) and wait outside the lock
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+class CollectorScheduler:
+    """Runs collection jobs concurrently under per-source token buckets and concurrency caps."""
+
+    def __init__(self, limits: dict = None, max_attempts: int = MAX_ATTEMPTS,
+                 backoff_s: float = BACKOFF_S, max_backoff_s: float = MAX_BACKOFF_S):
+        self.limits = {**SOURCE_LIMITS, **(limits or {})}
+        self.max_attempts = max_attempts
+        self.backoff_s = backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.buckets = {}
+        self.slots = {}
+        self._lock = threading.Lock()
+
+    def _limits(self, source: str) -> dict:
+        return {**DEFAULT_LIMITS, **self.limits.get(source, {})}
+
+    def _bucket(self, source: str) -> TokenBucket:
+        with self._lock:
+            if source not in self.buckets:
+                lim = self._limits(source)
+                self.buckets[source] = TokenBucket(lim["rate"], lim["burst"])
+                self.slots[source] = threading.BoundedSemaphore(lim["concurrency"])
+            return self.buckets[source]
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.max_backoff_s, self.backoff_s * 2 ** (attempt - 1))
+        return delay * (0.5 + random.random() / 2)
+
+    def _execute(self, job: CollectionJob) -> dict:
+        bucket = self._bucket(job.source)
+        start = time.perf_counter()
+        result = {"source": job.source, "topic": job.topic, "status": "ok", "path": None,
+                  "attempts": 0, "waited_s": 0.0, "error": None}
+
+        def acquire():
+            result["waited_s"] += bucket.acquire()
+
+        kwargs = {**(job.kwargs or {}), **({"acquire": acquire} if job.paged else {})}
+        for attempt in range(1, self.max_attempts + 1):
+            result["attempts"] = attempt
+            acquire()
+            try:
+                with self.slots[job.source]:
+                    result["path"] = job.fn(job.topic, **kwargs)
+                result["error"] = None
+                break
+            except Exception as e:
+                result["error"] = str(e)
+                if attempt == self.max_attempts:
+                    result["status"] = "failed"
+                    logger.error(f"❌ {job.source} collection failed for {job.topic} after {attempt} attempts: {e}")
+                    log_collection_event(job.topic, job.source, f"failed after {attempt} attempts: {e}")
+                else:
+                    delay = self._backoff(attempt)
+                    logger.warning(f"⚠️ {job.source} collection for {job.topic} failed ({e}); retrying in {delay:.1f}s")
+                    time.sleep(delay)
+        result["elapsed_s"] = round(time.perf_counter() - start, 4)
+        result["waited_s"] = round(result["waited_s"], 4)
+        return result
+
+    def run(self, jobs: list) -> list:
+        """Run all jobs; returns one result dict per job, in job order."""
+        jobs = list(jobs)
+        pools = {}
+        futures = []
+        try:
+            for job in jobs:
+                if job.source not in pools:
+                    pools[job.source] = ThreadPoolExecutor(
+                        max_workers=self._limits(job.source)["concurrency"],
+                        thread_name_prefix=f"collect-{job.source}",
+                    )
+                futures.append(pools[job.source].submit(self._execute, job))
+            results = [f.result() for f in futures]
+        finally:
+            for pool in pools.values():
+                pool.shutdown(wait=True)
+
+        failed = sum(r["status"] == "failed" for r in results)
+        logger.info(f"📡 Collection finished: {len(results) - failed}/{len(results)} jobs succeeded "
+                    f"across {len(pools)} source(s)")
+        return results
+
+
+def results_by_topic(results: list) -> dict:
+    """{topic: [result, ...]} preserving topic order."""
+    grouped = {}
+    for r in results:
+        grouped.setdefault(r["topic"], []).append(r)
+    return grouped
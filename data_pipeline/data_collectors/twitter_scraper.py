@@ -1,75 +1,107 @@
 """
 Module: twitter_scraper.py
 Purpose: Fetch recent tweets for given topics using Twitter v2 API via Tweepy.
+
+Collection is incremental: each topic keeps a cursor (newest tweet id) and a
+Bloom-filter seen-set in data_pipeline/data/state/x/. Searches pass the cursor
+as `since_id` and page through `next_token` until no newer tweets remain.
+Every page is a separate API request: under the collection scheduler each one
+after the first waits for its own rate-limit token (`acquire`).
 """
 
-import tweepy
 import datetime as dt
 import logging
 import os
-from data_pipeline.utils.io_utils import save_json, ensure_dir
-from data_pipeline.utils.text_cleaning import clean_texts
+from data_pipeline.utils.io_utils import ensure_dir
+from data_pipeline.utils.text_cleaning import clean_texts, CLEANING_VERSION
 from data_pipeline.utils.log_data_collection import log_collection_event
+from data_pipeline.data_collectors.incremental import load_state, save_state, BloomFilter, save_daily_texts
 from dotenv import load_dotenv
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Set up Twitter API
-load_dotenv()
-BEARER_TOKEN = os.getenv("X_BEARER_TOKEN")
-client = tweepy.Client(bearer_token=os.getenv("X_BEARER_TOKEN"))
+RAW_DIR = "data_pipeline/data/raw/x"
+MAX_PAGES = 10  # upper bound when paging back to the cursor
+
+_client = None
+
+
+def get_twitter_client():
+    """Tweepy client, created on first use from X_BEARER_TOKEN (.env)."""
+    global _client
+    if _client is None:
+        import tweepy
+        load_dotenv()
+        _client = tweepy.Client(bearer_token=os.getenv("X_BEARER_TOKEN"))
+    return _client
+
 
-    
-def fetch_twitter_posts(topic: str, limit: int = 100):
-    """Fetch up to `limit` recent tweets for a topic."""
-    ensure_dir("data_pipeline/data/raw/x")
+def fetch_twitter_posts(topic: str, limit: int = 100, max_pages: int = MAX_PAGES, acquire=None):
+    """
+    Fetch tweets for a topic newer than its cursor (the newest `limit` on the
+    first run). `acquire()` is called before every page request after the first.
+    """
+    ensure_dir(RAW_DIR)
+    state = load_state("x", topic)
+    cursor = state.get("cursor")
+    seen = BloomFilter.from_dict(state.get("seen"))
 
     tweets = []
+    newest_id = None
     try:
-        query = f"{topic} lang:en -is:retweet"
-        response = client.search_recent_tweets(
-            query=query,
-            max_results=min(limit, 100),
-            tweet_fields=["created_at", "lang", "text"]
-        )
-
-        if response.data:
-            tweets = [tweet.text for tweet in response.data]
+        params = {
+            "query": f"{topic} lang:en -is:retweet",
+            "max_results": min(limit, 100),
+            "tweet_fields": ["created_at", "lang", "text"],
+        }
+        if cursor:
+            params["since_id"] = cursor["id"]
+
+        next_token = None
+        for _ in range(max_pages if cursor else 1):
+            if next_token:
+                if acquire:
+                    acquire()
+                params["next_token"] = next_token
+            response = get_twitter_client().search_recent_tweets(**params)
+            meta = response.meta or {}
+            newest_id = newest_id or meta.get("newest_id")
+            for tweet in response.data or []:
+                if tweet.id in seen:
+                    continue
+                seen.add(tweet.id)
+                tweets.append(tweet.text)
+            next_token = meta.get("next_token")
+            if not next_token:
+                break
     except Exception as e:
         logger.error(f"❌ Error fetching tweets for {topic}: {e}")
+        raise  # let the collection scheduler retry
+
+    state["cursor"] = {"id": str(newest_id)} if newest_id else cursor
+    state["seen"] = seen.to_dict()
+    state["checked_at"] = str(dt.datetime.utcnow())
+    if not tweets:
+        save_state("x", topic, state)
+        logger.info(f"⏭️ No new tweets for {topic}")
         return None
 
     cleaned = clean_texts(tweets)
-    data = {
-        "topic": topic,
-        "source": "x",
-        "collected_at": str(dt.datetime.utcnow()),
-        "texts": cleaned
-    }
-
-    filename = f"{topic.replace(' ', '_')}_{dt.datetime.utcnow().strftime('%Y-%m-%d')}.json"
-    path = os.path.join("data_pipeline/data/raw/x", filename)
-    save_json(data, path)
+    path = save_daily_texts(RAW_DIR, topic, "x", cleaned, CLEANING_VERSION)
+    save_state("x", topic, state)
     log_collection_event(topic, "x", path)
 
-    logger.info(f"✅ Collected {len(cleaned)} tweets for '{topic}' → {path}")
+    logger.info(f"✅ Collected {len(cleaned)} new tweets for '{topic}' → {path}")
     return path
 
 
 if __name__ == "__main__":
-    import time
-
     topics = [
     "Artificial Intelligence", "Climate Change", "Space Exploration", "Cryptocurrency",
     "Electric Vehicles", "Elections"
-    ]   
-
-    for t in topics:
-        try:
-            fetch_twitter_posts(t, limit=100)
-            logger.info(f"⏳ Waiting 10 seconds before next topic...")
-            time.sleep(10)  # wait to stay below rate limit
-        except Exception as e:
-            logger.error(f"❌ Failed for {t}: {e}")
+    ]
 
+    # one request (page) every 10s is enforced by the collection scheduler's "x" limit
+    from data_pipeline.data_collectors.scheduler import CollectorScheduler, CollectionJob
+    CollectorScheduler().run([CollectionJob("x", t, fetch_twitter_posts, {"limit": 100}, paged=True) for t in topics])
@@ -1,47 +1,93 @@
 """
 Module: wiki_scraper.py
 Purpose: Fetch Wikipedia article text for a topic and store locally.
+
+Collection is revision-aware: a cheap MediaWiki query returns the page's
+current revision id. If it matches the revision stored last time
+(data_pipeline/data/state/wikipedia/<Topic>.json), the article is not
+downloaded or re-saved. The previous raw file is returned unchanged. If no
+other source of the topic changed either, combine/clean/embed reuse their
+cached outputs. Those caches are per topic, so a Reddit or RSS change still
+reruns them, but the embedding step reuses the article's rows by content hash
+and only encodes the new texts.
+Set WIKIPEDIA_API_URL to use another MediaWiki endpoint.
 """
 
-import wikipediaapi
+import os
+import json
 import datetime as dt
 import logging
-import os
+from urllib.parse import urlencode
 from data_pipeline.utils.io_utils import save_json, ensure_dir
-from data_pipeline.utils.text_cleaning import clean_text
+from data_pipeline.utils.text_cleaning import clean_text, CLEANING_VERSION
 from data_pipeline.utils.log_data_collection import log_collection_event
+from data_pipeline.data_collectors.incremental import load_state, save_state, conditional_get
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def fetch_wiki_page(topic: str):
-    """Fetch and store Wikipedia article text for a topic."""
-    wiki = wikipediaapi.Wikipedia(
-        language='en',
-        user_agent='IntentDriftWatch/0.1 (https://github.com/sriksven/IntentDriftWatch)'
-    )
+RAW_DIR = "data_pipeline/data/raw/wiki"
+WIKIPEDIA_API_URL = os.getenv("WIKIPEDIA_API_URL", "https://en.wikipedia.org/w/api.php")
+MAX_CHARS = 20000  # limit text length to 20k chars
 
-    page = wiki.page(topic)
 
-    if not page.exists():
+def query_api(**params) -> dict:
+    """GET a MediaWiki API query (JSON, formatversion 2, redirects followed)."""
+    params = {"action": "query", "format": "json", "formatversion": 2, "redirects": 1, **params}
+    _, body, _ = conditional_get(f"{WIKIPEDIA_API_URL}?{urlencode(params)}")
+    return json.loads(body)
+
+
+def latest_revision(topic: str):
+    """(title, revision id, revision timestamp) of the page, or None if it doesn't exist."""
+    pages = query_api(titles=topic, prop="revisions", rvprop="ids|timestamp")["query"]["pages"]
+    if not pages or pages[0].get("missing") or not pages[0].get("revisions"):
+        return None
+    rev = pages[0]["revisions"][0]
+    return pages[0]["title"], rev["revid"], rev["timestamp"]
+
+
+def fetch_page_text(title: str) -> str:
+    pages = query_api(titles=title, prop="extracts", explaintext=1)["query"]["pages"]
+    return pages[0].get("extract", "") if pages else ""
+
+
+def fetch_wiki_page(topic: str, force: bool = False):
+    """Fetch and store Wikipedia article text for a topic (skipped if its revision is unchanged)."""
+    revision = latest_revision(topic)
+    if revision is None:
         logger.warning(f"No Wikipedia page found for topic '{topic}'.")
         return None
+    title, revid, rev_timestamp = revision
+
+    state = load_state("wikipedia", topic)
+    if not force and state.get("revision_id") == revid and os.path.exists(state.get("path", "")):
+        state["checked_at"] = str(dt.datetime.utcnow())
+        save_state("wikipedia", topic, state)
+        logger.info(f"⏭️ Wikipedia article for '{topic}' unchanged (revision {revid}), keeping {state['path']}")
+        return state["path"]
 
-    text = clean_text(page.text[:20000])  # limit text length to 20k chars
+    text = clean_text(fetch_page_text(title)[:MAX_CHARS])
     data = {
         "topic": topic,
         "source": "wikipedia",
         "collected_at": str(dt.datetime.utcnow()),
+        "title": title,
+        "revision_id": revid,
+        "revision_timestamp": rev_timestamp,
+        "cleaning_version": CLEANING_VERSION,
         "texts": [text]
     }
 
-    ensure_dir("data_pipeline/data/raw/wiki")
+    ensure_dir(RAW_DIR)
     filename = f"{topic.replace(' ', '_')}_{dt.datetime.utcnow().strftime('%Y-%m-%d')}.json"
-    path = os.path.join("data_pipeline/data/raw/wiki", filename)
+    path = os.path.join(RAW_DIR, filename)
     save_json(data, path)
+    save_state("wikipedia", topic, {"title": title, "revision_id": revid, "revision_timestamp": rev_timestamp,
+                                    "path": path, "checked_at": str(dt.datetime.utcnow())})
     log_collection_event(topic, "wikipedia", path)
 
-    logger.info(f"✅ Saved Wikipedia article for '{topic}' → {path}")
+    logger.info(f"✅ Saved Wikipedia article for '{topic}' (revision {revid}) → {path}")
     return path
 
 
@@ -1,6 +1,10 @@
 """
 Module: feature_engineering.py
 Purpose: Generate sentence embeddings from CLEANED topic data using SentenceTransformer.
+
+Texts are only encoded if they are new: rows of the topic's previous
+snapshot (same model) are reused for texts with the same content hash, so a
+rerun triggered by one changed source re-encodes just that source's new texts.
 """
 
 import os
@@ -9,51 +13,109 @@ import datetime as dt
 import logging
 from glob import glob
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from data_pipeline.utils.io_utils import ensure_dir, save_json
+from data_pipeline.utils.io_utils import ensure_dir, save_json, save_npy
+from api.utils.embedding_service import get_service_client
+from analytics.vector_index import save_rows, build_index, rows_path
+from data_pipeline.utils.stage_cache import get_stage_cache
+from data_pipeline.utils import record_store
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Load embedding model once
-model = SentenceTransformer("all-MiniLM-L6-v2")
+MODEL_NAME = "all-MiniLM-L6-v2"
+EMB_ROOT = os.path.join("data_pipeline", "data", "processed", "embeddings")
 
+# Loaded once, and only if the local embedding service isn't running
+model = None
 
-def generate_embeddings_for_topic(topic: str):
-    """Load the latest cleaned JSON for a topic and generate dated embeddings."""
-    pattern = os.path.join(
-        "data_pipeline/data/processed/cleaned",
-        f"{topic.replace(' ', '_')}_cleaned_*.json"
-    )
-    files = sorted(glob(pattern))
-    if not files:
-        logger.warning(f"No cleaned data found for {topic}")
-        return None
 
-    latest_file = files[-1]  # pick newest by filename/date
-    with open(latest_file, "r") as f:
-        data = json.load(f)
+def get_model():
+    global model
+    if model is None:
+        from sentence_transformers import SentenceTransformer
+        model = SentenceTransformer(MODEL_NAME)
+    return model
+
+
+def encode_texts(texts: list[str]) -> np.ndarray:
+    """Embed texts via the warm local embedding service if available, else in-process."""
+    client = get_service_client(model=MODEL_NAME)
+    if client is not None:
+        try:
+            logger.info("🔌 Using local embedding service")
+            return client.encode(texts, normalize=False, model=MODEL_NAME)
+        except Exception as e:
+            logger.warning(f"Embedding service failed ({e}); falling back to in-process model")
+        finally:
+            client.close()
+    return get_model().encode(texts, batch_size=32, show_progress_bar=True)
+
+
+def previous_snapshot(topic: str):
+    """
+    (embeddings memmap, {content_hash: row}) of the topic's newest snapshot
+    encoded with MODEL_NAME, or (None, {}) if there is none.
+    """
+    topic_key = topic.replace(' ', '_')
+    for date_dir in sorted(glob(os.path.join(EMB_ROOT, "*")), reverse=True):
+        npy_path = os.path.join(date_dir, f"{topic_key}.npy")
+        meta_path = os.path.join(date_dir, f"{topic_key}_meta.json")
+        rows_file = rows_path(date_dir, topic_key)
+        if not all(os.path.exists(p) for p in (npy_path, meta_path, rows_file)):
+            continue
+        try:
+            with open(meta_path) as f:
+                if json.load(f).get("model") != MODEL_NAME:
+                    return None, {}
+            with open(rows_file) as f:
+                texts = json.load(f)["texts"]
+            emb = np.load(npy_path, mmap_mode="r")
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"⚠️ Can't reuse embeddings from {date_dir}: {e}")
+            return None, {}
+        if len(texts) != len(emb):
+            return None, {}
+        return emb, {record_store.content_hash(t): i for i, t in enumerate(texts)}
+    return None, {}
 
-    texts = data.get("texts", [])
-    if not texts:
-        logger.warning(f"No texts to embed for {topic}")
-        return None
 
-    logger.info(f"🔹 Generating embeddings for '{topic}' from {os.path.basename(latest_file)} ({len(texts)} texts)...")
-    embeddings = model.encode(texts, batch_size=32, show_progress_bar=True)
+def encode_reusing(texts: list, previous=(None, {})) -> np.ndarray:
+    """Embed texts, copying rows of `previous` (see previous_snapshot) for texts it already has."""
+    emb, rows = previous
+    hashes = [record_store.content_hash(t) for t in texts]
+    reused = [i for i, h in enumerate(hashes) if h in rows]
+    if emb is None or not reused:
+        return np.asarray(encode_texts(texts))
 
+    out = np.empty((len(texts), emb.shape[1]), dtype=emb.dtype)
+    out[reused] = emb[[rows[hashes[i]] for i in reused]]
+    missing = [i for i, h in enumerate(hashes) if h not in rows]
+    if missing:
+        out[missing] = encode_texts([texts[i] for i in missing])
+    logger.info(f"♻️ Reused {len(reused)} embedding(s), encoded {len(missing)} new text(s)")
+    return out
+
+
+def save_embeddings(topic: str, texts: list, embeddings: np.ndarray, ids: list = None, **meta_fields):
+    """
+    Write a topic's dated embeddings, metadata, row ids/texts and search index.
+    `ids` are the record store ids of the rows, so search hits join back to
+    their records (content hashes of the texts if not given).
+    Returns (npy path, meta path).
+    """
     # date tag derived from cleaned file name or current date
     date_tag = dt.datetime.utcnow().strftime("%Y-%m-%d")
 
-    emb_dir = os.path.join("data_pipeline", "data", "processed", "embeddings", date_tag)
+    emb_dir = os.path.join(EMB_ROOT, date_tag)
     ensure_dir(emb_dir)
 
     npy_path = os.path.join(emb_dir, f"{topic.replace(' ', '_')}.npy")
-    np.save(npy_path, embeddings)
+    save_npy(embeddings, npy_path)
 
     meta = {
         "topic": topic,
-        "source_cleaned_file": os.path.basename(latest_file),
+        "model": MODEL_NAME,
+        **meta_fields,
         "timestamp": str(dt.datetime.utcnow()),
         "num_texts": len(texts),
         "embedding_shape": embeddings.shape
@@ -61,6 +123,80 @@ def generate_embeddings_for_topic(topic: str):
     meta_path = os.path.join(emb_dir, f"{topic.replace(' ', '_')}_meta.json")
     save_json(meta, meta_path)
 
+    # text ids/texts aligned with embedding rows + search index for /topic/{topic}/search
+    save_rows(texts, emb_dir, topic.replace(' ', '_'), ids)
+    try:
+        build_index(embeddings, emb_dir, topic.replace(' ', '_'))
+    except Exception as e:
+        logger.warning(f"⚠️ Could not build search index for '{topic}': {e}")
+    return npy_path, meta_path
+
+
+def records_file_for(cleaned_file: str, topic: str):
+    """The record store file written with a cleaned JSON snapshot, if pyarrow is available and it exists."""
+    if not record_store.available():
+        return None
+    date = os.path.basename(cleaned_file).rsplit("_", 1)[-1].removesuffix(".json")
+    path = record_store.record_path(topic, date)
+    return path if os.path.exists(path) else None
+
+
+def read_and_encode(records_file: str, previous=(None, {})):
+    """(record ids, texts, embeddings) streamed from a record file, one row group per encode call."""
+    ids, texts, chunks = [], [], []
+    for group in record_store.iter_columns(records_file, ["id", "clean_text"]):
+        if group["clean_text"]:
+            ids += group["id"]
+            texts += group["clean_text"]
+            chunks.append(encode_reusing(group["clean_text"], previous))
+    return ids, texts, (np.vstack(chunks) if chunks else None)
+
+
+def generate_embeddings_for_topic(topic: str, force: bool = False):
+    """
+    Generate dated embeddings from the latest cleaned snapshot of a topic:
+    its record store file (streamed by row group) when pyarrow is installed,
+    else the cleaned JSON.
+    """
+    pattern = os.path.join(
+        "data_pipeline/data/processed/cleaned",
+        f"{topic.replace(' ', '_')}_cleaned_*.json"
+    )
+    files = sorted(glob(pattern))
+    if not files:
+        logger.warning(f"No cleaned data found for {topic}")
+        return None
+
+    latest_file = files[-1]  # pick newest by filename/date
+    records_file = records_file_for(latest_file, topic)
+    source_file = records_file or latest_file
+    cache = get_stage_cache()
+    fingerprint = cache.fingerprint([source_file], {"model": MODEL_NAME})
+    cached = None if force else cache.lookup("embed", topic, fingerprint)
+    if cached:
+        logger.info(f"⏭️ Cleaned texts for '{topic}' unchanged, keeping {cached[0]}")
+        return cached[0]
+
+    logger.info(f"🔹 Generating embeddings for '{topic}' from {os.path.basename(source_file)}...")
+    previous = previous_snapshot(topic)
+    if records_file:
+        ids, texts, embeddings = read_and_encode(records_file, previous)
+    else:
+        with open(latest_file, "r") as f:
+            data = json.load(f)
+        texts = data.get("texts", [])
+        # cleaned files written before record ids were kept fall back to content hashes
+        ids = data.get("ids") if len(data.get("ids") or []) == len(texts) else None
+        embeddings = encode_reusing(texts, previous) if texts else None
+
+    if not texts:
+        logger.warning(f"No texts to embed for {topic}")
+        return None
+
+    npy_path, meta_path = save_embeddings(topic, texts, embeddings, ids, source_cleaned_file=os.path.basename(latest_file),
+                                          records_file=records_file)
+    cache.record("embed", topic, fingerprint, [npy_path, meta_path])
+
     logger.info(f"✅ Saved embeddings for '{topic}' → {npy_path}")
     return npy_path
 
@@ -0,0 +1,108 @@
+"""
+Module: process_topic.py
+Purpose: Fused per-topic pass: combine → clean → embed in memory.
+
+The staged path writes a combined JSON, reads it back to write a cleaned
+JSON, then reads that back to embed. Here the records from the latest raw
+files go straight through cleaning, near-dedup and embedding, and only the
+final artifacts (embeddings, meta, rows, search index and, with pyarrow, the
+record store) are written. Only texts missing from the topic's previous
+snapshot are encoded. `materialize=True` also writes the combined and
+cleaned JSON files for debugging or lineage.
+
+The pass is skipped when the raw inputs, parameters and code are unchanged
+since the last fused run for the topic.
+"""
+
+import os
+import logging
+import datetime as dt
+from data_pipeline.utils.io_utils import ensure_dir, save_json
+from data_pipeline.utils.log_data_collection import log_collection_event
+from data_pipeline.utils.stage_cache import get_stage_cache, code_fingerprint
+from data_pipeline.utils.text_cleaning import clean_text, CLEANING_VERSION
+from data_pipeline.utils.near_dedup import dedupe, find_near_duplicates
+from data_pipeline.utils import record_store
+from data_pipeline.combine_sources import (
+    latest_source_files, combine_topic_records, load_source_records, combined_payload, combined_path
+)
+from data_pipeline.clean_combined_data import clean_records, write_cleaned, DEDUP_THRESHOLD
+from data_pipeline.generate_embeddings import encode_reusing, previous_snapshot, save_embeddings, MODEL_NAME
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def process_topic(topic: str, force: bool = False, materialize: bool = False,
+                  dedup_threshold: float = DEDUP_THRESHOLD):
+    """
+    Combine, clean and embed a topic without intermediate files; returns the
+    embeddings path (None if there is no data). materialize=True also writes
+    the combined and cleaned JSON files.
+    """
+    latest_files = latest_source_files(topic)
+    if not latest_files:
+        logger.warning(f"No data found for topic '{topic}' in any source.")
+        return None
+
+    cache = get_stage_cache()
+    fingerprint = cache.fingerprint(list(latest_files.values()), {
+        "sources": sorted(latest_files),
+        "model": MODEL_NAME,
+        "dedup_threshold": dedup_threshold,
+        "materialize": materialize,
+        "record_store": record_store.available(),
+        "code": code_fingerprint(process_topic, combine_topic_records, load_source_records, clean_records,
+                                 clean_text, dedupe, find_near_duplicates, encode_reusing, save_embeddings),
+    })
+    cached = None if force else cache.lookup("process", topic, fingerprint)
+    if cached:
+        logger.info(f"⏭️ Raw inputs for '{topic}' unchanged, keeping {cached[0]}")
+        return cached[0]
+
+    records, found_sources, cleaning_version = combine_topic_records(topic, latest_files)
+    if not records:
+        logger.warning(f"No data found for topic '{topic}' in any source.")
+        return None
+    combined = combined_payload(topic, records, found_sources, cleaning_version) if materialize else None
+
+    records, dedup_stats = clean_records(records, cleaning_version == CLEANING_VERSION, dedup_threshold)
+    if dedup_stats:
+        logger.info(f"🧹 Dropped {dedup_stats['exact_duplicates']} exact and {dedup_stats['near_duplicates']} "
+                    f"near-duplicate texts for '{topic}'")
+    texts = [r["clean_text"] for r in records]
+    if not texts:
+        logger.warning(f"No texts to embed for {topic}")
+        return None
+
+    outputs = []
+    if materialize:
+        path = combined_path(topic)
+        ensure_dir(os.path.dirname(path))
+        save_json(combined, path)
+        log_collection_event(topic, "combined", path)
+        outputs += [path] + write_cleaned(topic, combined, records, dedup_stats)
+    elif record_store.available():
+        outputs.append(record_store.write_records(records, topic, dt.datetime.utcnow().strftime("%Y-%m-%d")))
+
+    logger.info(f"🔹 Generating embeddings for '{topic}' from {found_sources} ({len(texts)} texts, fused)...")
+    embeddings = encode_reusing(texts, previous_snapshot(topic))
+    npy_path, meta_path = save_embeddings(topic, texts, embeddings, [r["id"] for r in records],
+                                          sources=found_sources, fused=True, dedup=dedup_stats)
+
+    cache.record("process", topic, fingerprint, [npy_path, meta_path] + outputs)
+    logger.info(f"✅ Processed '{topic}' in one pass → {npy_path}")
+    return npy_path
+
+
+if __name__ == "__main__":
+    topics = [
+        "Artificial Intelligence",
+        "Climate Change",
+        "Space Exploration",
+        "Cryptocurrency",
+        "Electric Vehicles",
+        "Elections"
+    ]
+    for t in topics:
+        process_topic(t)
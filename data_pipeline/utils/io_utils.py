@@ -1,11 +1,17 @@
 """
 Module: io_utils.py
 Purpose: Centralized file I/O utilities for saving and loading JSON data.
+
+Writes are atomic: data goes to a hidden temp file in the target directory,
+is fsynced, and then renamed over the target, so a crash mid-write never
+leaves a truncated file where a reader (or a resumed run) would pick it up.
 """
 
 import os
 import json
 import logging
+import threading
+from contextlib import contextmanager
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -14,13 +20,43 @@ def ensure_dir(path: str):
     """Ensure that a directory exists."""
     os.makedirs(path, exist_ok=True)
 
+@contextmanager
+def atomic_write(path: str, mode: str = "w", **kwargs):
+    """Open a temp file next to `path`; it replaces `path` only if the block succeeds."""
+    directory = os.path.dirname(path)
+    if directory:
+        ensure_dir(directory)
+    # hidden and without the target's extension, so globs over outputs never see it
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.tmp-{os.getpid()}-{threading.get_ident()}")
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
 def save_json(data: dict, path: str):
     """Save Python dict to JSON file."""
-    ensure_dir(os.path.dirname(path))
-    with open(path, "w", encoding="utf-8") as f:
+    with atomic_write(path, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
     logger.info(f"✅ Saved JSON: {path}")
 
+def save_npy(array, path: str):
+    """Save a numpy array to a .npy file atomically."""
+    import numpy as np
+    with atomic_write(path, "wb") as f:
+        np.save(f, array)
+
+def save_npz(path: str, **arrays):
+    """Save named numpy arrays to a .npz file atomically."""
+    import numpy as np
+    with atomic_write(path, "wb") as f:
+        np.savez(f, **arrays)
+
 def load_json(path: str) -> dict:
     """Load JSON data from file."""
     if not os.path.exists(path):
@@ -2,22 +2,60 @@
 Module: log_data_collection.py
 Purpose: Log data collection events (topic, source, file path, timestamp)
          to a central JSON log for monitoring and reproducibility.
+
+The log is append-only JSONL (one event per line). When it exceeds
+MAX_LOG_BYTES it is rotated to data_collection_log.jsonl.1, .2, ... (keeping
+BACKUP_COUNT files). A small index keeps the last event and the last
+successful event per (topic, source), so "when did X last succeed" never
+scans the log. Appends, rotation and index updates run under an exclusive
+lock file (fcntl.flock), so concurrent collectors and processes can log safely.
 """
 
 import os
 import json
+import threading
 import datetime as dt
 import logging
-from data_pipeline.utils.io_utils import ensure_dir
+from contextlib import contextmanager
+from data_pipeline.utils.io_utils import ensure_dir, atomic_write, load_json
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process locking only
+    fcntl = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-LOG_PATH = "logging/logs/data_collection_log.json"
+LOG_PATH = "logging/logs/data_collection_log.jsonl"
+INDEX_PATH = "logging/logs/data_collection_index.json"
+LEGACY_LOG_PATH = "logging/logs/data_collection_log.json"
+
+MAX_LOG_BYTES = 10 * 1024 * 1024
+BACKUP_COUNT = 5
+
+_thread_lock = threading.Lock()
+
+
+@contextmanager
+def _log_lock():
+    ensure_dir(os.path.dirname(LOG_PATH))
+    with _thread_lock, open(f"{LOG_PATH}.lock", "a") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _is_success(path) -> bool:
+    return bool(path) and not str(path).startswith("failed")
+
 
 def log_collection_event(topic: str, source: str, path: str):
     """Append a new record to the data collection log."""
-    ensure_dir(os.path.dirname(LOG_PATH))
     record = {
         "topic": topic,
         "source": source,
@@ -25,19 +63,86 @@ def log_collection_event(topic: str, source: str, path: str):
         "timestamp": str(dt.datetime.utcnow())
     }
 
-    # Load existing log if present
-    if os.path.exists(LOG_PATH):
-        try:
-            with open(LOG_PATH, "r") as f:
-                existing = json.load(f)
-        except json.JSONDecodeError:
-            existing = []
-    else:
-        existing = []
+    with _log_lock():
+        _migrate_legacy_log()
+        _rotate_if_needed()
+        with open(LOG_PATH, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        _update_index(record)
 
-    existing.append(record)
+    logger.info(f"🧾 Logged data collection for '{topic}' ({source}) → {path}")
 
-    with open(LOG_PATH, "w") as f:
-        json.dump(existing, f, indent=2)
 
-    logger.info(f"🧾 Logged data collection for '{topic}' ({source}) → {path}")
+def _rotate_if_needed():
+    if not os.path.exists(LOG_PATH) or os.path.getsize(LOG_PATH) < MAX_LOG_BYTES:
+        return
+    for i in range(BACKUP_COUNT - 1, 0, -1):
+        if os.path.exists(f"{LOG_PATH}.{i}"):
+            os.replace(f"{LOG_PATH}.{i}", f"{LOG_PATH}.{i + 1}")
+    os.replace(LOG_PATH, f"{LOG_PATH}.1")
+    logger.info(f"🔄 Rotated collection log → {LOG_PATH}.1")
+
+
+def _load_index() -> dict:
+    return load_json(INDEX_PATH) if os.path.exists(INDEX_PATH) else {}
+
+
+def _index_record(index: dict, record: dict):
+    entry = index.setdefault(record["topic"], {}).setdefault(record["source"], {})
+    entry["last_event"] = record
+    if _is_success(record["path"]):
+        entry["last_success"] = record
+
+
+def _save_index(index: dict):
+    with atomic_write(INDEX_PATH, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+
+
+def _update_index(record: dict):
+    index = _load_index()
+    _index_record(index, record)
+    _save_index(index)
+
+
+def _migrate_legacy_log():
+    """One-time conversion of the old whole-file JSON array log to JSONL + index."""
+    if not os.path.exists(LEGACY_LOG_PATH) or os.path.exists(LOG_PATH):
+        return
+    try:
+        with open(LEGACY_LOG_PATH, "r") as f:
+            records = json.load(f)
+    except json.JSONDecodeError:
+        records = []
+    with open(LOG_PATH, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    # one index write for the whole legacy log, not one per record
+    index = _load_index()
+    for record in records:
+        _index_record(index, record)
+    _save_index(index)
+    os.replace(LEGACY_LOG_PATH, f"{LEGACY_LOG_PATH}.migrated")
+    logger.info(f"📦 Migrated {len(records)} collection events to {LOG_PATH}")
+
+
+def last_collection(topic: str, source: str, successful: bool = True):
+    """Last (successful) event for a topic and source, from the index; None if there is none."""
+    index = _load_index()
+    entry = index.get(topic, {}).get(source, {})
+    return entry.get("last_success" if successful else "last_event")
+
+
+def read_events(topic: str = None, source: str = None, include_rotated: bool = True):
+    """Yield logged events, oldest first, optionally filtered by topic and/or source."""
+    paths = [f"{LOG_PATH}.{i}" for i in range(BACKUP_COUNT, 0, -1)] if include_rotated else []
+    for path in paths + [LOG_PATH]:
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if (topic is None or record["topic"] == topic) and (source is None or record["source"] == source):
+                    yield record
@@ -0,0 +1,152 @@
+"""
+Module: near_dedup.py
+Purpose: Near-duplicate text removal with MinHash signatures and LSH banding.
+
+Each text becomes a set of byte shingles (k-grams); a MinHash signature of
+`num_perm` values estimates Jaccard similarity between two such sets. The
+signature is cut into `bands` bands of `rows` values, and texts sharing any
+band are candidate pairs. Only candidates are compared (by the fraction of
+equal signature values), and only kept texts are indexed, so the pass is
+linear in the number of texts rather than quadratic. The first occurrence of
+each near-duplicate group is kept.
+"""
+
+import numpy as np
+
+DEFAULT_THRESHOLD = 0.85
+NUM_PERM = 128
+SHINGLE_SIZE = 5
+# shingles hashed at once: bounds the (num_perm x chunk) uint64 work array (1 MiB at 128 x 1024)
+SIGNATURE_CHUNK = 1024
+
+_SHIFT = np.uint64(32)
+
+
+def lsh_params(threshold: float, num_perm: int = NUM_PERM):
+    """
+    (bands, rows) with bands * rows <= num_perm whose LSH S-curve threshold
+    (1/bands) ** (1/rows) is closest to `threshold` from below (erring
+    toward more candidates, which the signature check then filters).
+    """
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        curve = (1 / bands) ** (1 / rows)
+        score = (threshold - curve) if curve <= threshold else 2 * (curve - threshold)
+        if best is None or score < best[0]:
+            best = (score, bands, rows)
+    return best[1], best[2]
+
+
+def shingles(text: str, k: int = SHINGLE_SIZE) -> np.ndarray:
+    """Distinct byte k-grams of the UTF-8 text, each packed into one uint64 (k <= 8)."""
+    data = np.frombuffer(text.encode("utf-8"), dtype=np.uint8).astype(np.uint64)
+    if len(data) < k:
+        return np.array([_pack(data)], dtype=np.uint64)
+    grams = np.zeros(len(data) - k + 1, dtype=np.uint64)
+    for offset in range(k):
+        grams = (grams << np.uint64(8)) | data[offset:len(data) - k + 1 + offset]
+    return np.unique(grams)
+
+
+def _pack(data: np.ndarray) -> int:
+    value = 0
+    for byte in data.tolist():
+        value = (value << 8) | byte
+    return value
+
+
+class MinHasher:
+    """MinHash over uint64 shingles with multiply-shift hashing (a odd, top 32 bits kept)."""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.a = (rng.randint(0, 1 << 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1))[:, None]
+        self.b = rng.randint(0, 1 << 63, size=num_perm, dtype=np.uint64)[:, None]
+
+    def signature(self, grams: np.ndarray, chunk_size: int = SIGNATURE_CHUNK) -> np.ndarray:
+        """Per-permutation minimum hash, over the shingles in fixed-size chunks (running minimum)."""
+        sig = np.full(self.num_perm, np.iinfo(np.uint64).max, dtype=np.uint64)
+        work = np.empty((self.num_perm, min(len(grams), chunk_size)), dtype=np.uint64)
+        for start in range(0, len(grams), chunk_size):
+            chunk = grams[start:start + chunk_size]
+            hashed = work[:, :len(chunk)]
+            # in place; uint64 products wrap mod 2**64, as multiply-shift hashing intends
+            np.multiply(self.a, chunk[None, :], out=hashed)
+            hashed += self.b
+            hashed >>= _SHIFT
+            np.minimum(sig, hashed.min(axis=1), out=sig)
+        return sig.astype(np.uint32)
+
+
+def find_near_duplicates(texts: list, threshold: float = DEFAULT_THRESHOLD, num_perm: int = NUM_PERM,
+                         shingle_size: int = SHINGLE_SIZE, seed: int = 1):
+    """{duplicate index: index of the kept text it duplicates}."""
+    bands, rows = lsh_params(threshold, num_perm)
+    hasher = MinHasher(num_perm, seed)
+    buckets = [dict() for _ in range(bands)]
+    exact = {}
+    duplicates = {}
+
+    unique = []
+    for i, text in enumerate(texts):
+        if text in exact:
+            duplicates[i] = exact[text]
+        else:
+            exact[text] = i
+            unique.append(i)
+    signatures = {}
+
+    for i in unique:
+        sig = signatures[i] = hasher.signature(shingles(texts[i], shingle_size))
+        keys = [sig[b * rows:(b + 1) * rows].tobytes() for b in range(bands)]
+
+        match = None
+        checked = set()
+        for band, key in zip(buckets, keys):
+            for j in band.get(key, ()):
+                if j in checked:
+                    continue
+                checked.add(j)
+                if np.count_nonzero(signatures[j] == sig) >= threshold * num_perm:
+                    match = j
+                    break
+            if match is not None:
+                break
+
+        if match is not None:
+            duplicates[i] = match
+            continue
+        for band, key in zip(buckets, keys):
+            band.setdefault(key, []).append(i)
+    return duplicates
+
+
+def dedupe(texts: list, threshold: float = DEFAULT_THRESHOLD, num_perm: int = NUM_PERM,
+           shingle_size: int = SHINGLE_SIZE):
+    """(indices of kept texts in original order, stats dict for the cleaned file's metadata)."""
+    duplicates = find_near_duplicates(texts, threshold, num_perm, shingle_size)
+    exact = sum(texts[i] == texts[j] for i, j in duplicates.items())
+    kept = [i for i in range(len(texts)) if i not in duplicates]
+    bands, rows = lsh_params(threshold, num_perm)
+    stats = {
+        "method": "minhash_lsh",
+        "threshold": threshold,
+        "num_perm": num_perm,
+        "bands": bands,
+        "rows": rows,
+        "shingle_size": shingle_size,
+        "input_texts": len(texts),
+        "kept_texts": len(kept),
+        "exact_duplicates": exact,
+        "near_duplicates": len(duplicates) - exact,
+    }
+    return kept, stats
+
+
+def dedupe_texts(texts: list, threshold: float = DEFAULT_THRESHOLD, num_perm: int = NUM_PERM,
+                 shingle_size: int = SHINGLE_SIZE):
+    """(kept texts in original order, stats dict for the cleaned file's metadata)."""
+    kept, stats = dedupe(texts, threshold, num_perm, shingle_size)
+    return [texts[i] for i in kept], stats
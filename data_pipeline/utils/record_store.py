@@ -0,0 +1,173 @@
+"""
+Module: record_store.py
+Purpose: Columnar per-record text store (Parquet) with provenance.
+
+Every cleaned text is one row with its provenance:
+
+    id            stable id: hash of source + raw text
+    topic         topic name
+    source        reddit / wiki / rss / x
+    collected_at  when the source file was collected (UTC)
+    raw_text      text as collected
+    clean_text    normalized text fed to the embedding model
+    content_hash  sha1 of clean_text
+
+Files are zstd-compressed Parquet, hive-partitioned by topic and snapshot
+date (records/topic_key=<Topic>/date=<YYYY-MM-DD>/part-0.parquet), so reads
+filtered by topic or date only open the matching files, and filters on
+source / collected_at are pushed down to row groups. Reads can stream record
+batches instead of loading a whole topic; embedding reads its texts from here
+one row group at a time.
+
+pyarrow is optional: without it `available()` is False and the pipeline keeps
+using its JSON files only.
+"""
+
+import os
+import hashlib
+import datetime as dt
+import logging
+from data_pipeline.utils.io_utils import atomic_write
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = ds = pq = None
+
+logger = logging.getLogger(__name__)
+
+RECORDS_DIR = "data_pipeline/data/processed/records"
+COLUMNS = ("id", "topic", "source", "collected_at", "raw_text", "clean_text", "content_hash")
+ROW_GROUP_SIZE = 50_000
+BATCH_SIZE = 10_000
+
+
+def available() -> bool:
+    return pa is not None
+
+
+def _schema():
+    return pa.schema([
+        ("id", pa.string()),
+        ("topic", pa.string()),
+        ("source", pa.string()),
+        ("collected_at", pa.timestamp("us")),
+        ("raw_text", pa.string()),
+        ("clean_text", pa.string()),
+        ("content_hash", pa.string()),
+    ])
+
+
+def _partitioning():
+    return ds.partitioning(pa.schema([("topic_key", pa.string()), ("date", pa.string())]), flavor="hive")
+
+
+def record_id(source: str, raw_text: str) -> str:
+    return hashlib.sha1(f"{source}\x00{raw_text}".encode("utf-8")).hexdigest()[:16]
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def record_path(topic: str, date: str, root: str = RECORDS_DIR) -> str:
+    return os.path.join(root, f"topic_key={topic.replace(' ', '_')}", f"date={date}", "part-0.parquet")
+
+
+def _timestamp(value):
+    if value is None or isinstance(value, dt.datetime):
+        return value
+    try:
+        return dt.datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def write_records(records: list, topic: str, date: str, root: str = RECORDS_DIR) -> str:
+    """Write one topic snapshot (replacing any previous one for that date); returns the file path."""
+    if not available():
+        raise ImportError("pyarrow is required for the record store")
+    columns = {name: [r.get(name) for r in records] for name in COLUMNS}
+    columns["collected_at"] = [_timestamp(v) for v in columns["collected_at"]]
+    table = pa.Table.from_pydict(columns, schema=_schema())
+    path = record_path(topic, date, root)
+    with atomic_write(path, "wb") as f:
+        pq.write_table(table, f, compression="zstd", row_group_size=ROW_GROUP_SIZE)
+    logger.info(f"🗄️ Stored {table.num_rows} records for '{topic}' ({date}) → {path}")
+    return path
+
+
+def _dataset(root: str):
+    return ds.dataset(root, format="parquet", partitioning=_partitioning())
+
+
+def _filter(topic=None, dates=None, sources=None, since=None, until=None):
+    expr = None
+    parts = []
+    if topic is not None:
+        parts.append(ds.field("topic_key") == topic.replace(" ", "_"))
+    if dates is not None:
+        parts.append(ds.field("date").isin(list(dates)))
+    if sources is not None:
+        parts.append(ds.field("source").isin(list(sources)))
+    if since is not None:
+        parts.append(ds.field("collected_at") >= pa.scalar(_timestamp(since), pa.timestamp("us")))
+    if until is not None:
+        parts.append(ds.field("collected_at") < pa.scalar(_timestamp(until), pa.timestamp("us")))
+    for part in parts:
+        expr = part if expr is None else expr & part
+    return expr
+
+
+def scan(root: str = RECORDS_DIR, columns: list = None, batch_size: int = BATCH_SIZE, **filters):
+    """
+    Stream record batches (pyarrow.RecordBatch) matching the filters:
+    topic, dates, sources, since / until (on collected_at).
+    """
+    if not available() or not os.path.isdir(root):
+        return
+    dataset = _dataset(root)
+    yield from dataset.to_batches(columns=columns, filter=_filter(**filters), batch_size=batch_size)
+
+
+def read_records(root: str = RECORDS_DIR, columns: list = None, **filters):
+    """Matching records as one pyarrow Table (or None if the store is unavailable/empty)."""
+    if not available() or not os.path.isdir(root):
+        return None
+    return _dataset(root).to_table(columns=columns, filter=_filter(**filters))
+
+
+def iter_records(root: str = RECORDS_DIR, columns: list = None, **filters):
+    """Matching records one dict at a time, streamed batch by batch."""
+    for batch in scan(root, columns=columns, **filters):
+        yield from batch.to_pylist()
+
+
+def iter_columns(path: str, columns: list):
+    """Columns of a record file as {column: [values]}, one row group at a time."""
+    parquet = pq.ParquetFile(path)
+    for i in range(parquet.num_row_groups):
+        group = parquet.read_row_group(i, columns=list(columns))
+        yield {c: group.column(c).to_pylist() for c in columns}
+
+
+def iter_column(path: str, column: str = "clean_text"):
+    """One column of a record file as lists of values, one row group at a time."""
+    for group in iter_columns(path, [column]):
+        yield group[column]
+
+
+def num_rows(path: str) -> int:
+    """Row count from the file footer, without reading any data."""
+    return pq.ParquetFile(path).metadata.num_rows
+
+
+def latest_date(topic: str, root: str = RECORDS_DIR):
+    """Newest snapshot date stored for a topic, or None."""
+    topic_dir = os.path.join(root, f"topic_key={topic.replace(' ', '_')}")
+    if not os.path.isdir(topic_dir):
+        return None
+    dates = sorted(d.split("=", 1)[1] for d in os.listdir(topic_dir) if d.startswith("date="))
+    return dates[-1] if dates else None
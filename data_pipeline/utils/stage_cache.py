@@ -0,0 +1,121 @@
+"""
+Module: stage_cache.py
+Purpose: Content-fingerprinted caching of pipeline stages.
+
+A stage (combine, clean, embed, drift) records a fingerprint of its input
+files' contents and its parameters next to the outputs it produced. On the
+next run the stage is skipped if the fingerprint is unchanged and those
+outputs still exist. File contents are hashed once and re-hashed only when a
+file's (size, mtime) changes, so checking a fresh stage costs a few stats.
+The cache is shared by stages running in pipelined worker threads, so memo
+and entry updates and saves are serialized.
+"""
+
+import os
+import json
+import hashlib
+import threading
+import inspect
+import datetime as dt
+import logging
+from data_pipeline.utils.io_utils import save_json
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = "data_pipeline/data/processed/.stage_cache.json"
+
+HASH_CHUNK = 1 << 20
+
+
+def code_fingerprint(*fns) -> str:
+    """Hash of the functions' source, so a code change invalidates cached outputs."""
+    h = hashlib.sha1()
+    for fn in fns:
+        try:
+            h.update(inspect.getsource(fn).encode())
+        except (OSError, TypeError):
+            h.update(getattr(fn, "__qualname__", repr(fn)).encode())
+    return h.hexdigest()[:16]
+
+
+class StageCache:
+    """{stage}:{key} -> fingerprint + outputs, plus a (size, mtime)-keyed file hash memo."""
+
+    def __init__(self, path: str = CACHE_PATH):
+        self.path = path
+        data = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                logger.warning(f"Ignoring unreadable stage cache: {path}")
+        self.stages = data.get("stages", {})
+        self.files = data.get("files", {})
+        self._lock = threading.RLock()
+
+    def file_digest(self, path: str) -> str:
+        st = os.stat(path)
+        with self._lock:
+            memo = self.files.get(path)
+        if memo and memo[0] == st.st_size and memo[1] == st.st_mtime_ns:
+            return memo[2]
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        with self._lock:
+            self.files[path] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def fingerprint(self, inputs: list, params: dict = None) -> str:
+        """Fingerprint of input file contents (order-independent) and parameters."""
+        h = hashlib.sha256()
+        for path in sorted(inputs):
+            h.update(os.path.basename(path).encode())
+            h.update(self.file_digest(path).encode())
+        h.update(json.dumps(params or {}, sort_keys=True, default=str).encode())
+        return h.hexdigest()
+
+    def lookup(self, stage: str, key: str, fingerprint: str):
+        """Outputs recorded for this fingerprint if they all still exist, else None."""
+        with self._lock:
+            entry = self.stages.get(f"{stage}:{key}")
+        if not entry or entry["fingerprint"] != fingerprint:
+            return None
+        if not all(os.path.exists(p) for p in entry["outputs"]):
+            return None
+        return entry["outputs"]
+
+    def record(self, stage: str, key: str, fingerprint: str, outputs: list, save: bool = True):
+        """Remember a stage's outputs; pass save=False to batch many records into one write."""
+        with self._lock:
+            self.stages[f"{stage}:{key}"] = {
+                "fingerprint": fingerprint,
+                "outputs": list(outputs),
+                "updated_at": str(dt.datetime.utcnow()),
+            }
+            if save:
+                self.save()
+
+    def save(self):
+        with self._lock:
+            # drop memo entries of files that no longer exist
+            self.files = {p: m for p, m in self.files.items() if os.path.exists(p)}
+            save_json({"stages": self.stages, "files": self.files}, self.path)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_stage_cache() -> StageCache:
+    """Process-wide cache for the current working directory's pipeline data."""
+    global _cache
+    path = os.path.abspath(CACHE_PATH)
+    with _cache_lock:
+        if _cache is None or _cache.path != path:
+            _cache = StageCache(path)
+        return _cache
@@ -1,19 +1,85 @@
 """
 Module: text_cleaning.py
 Purpose: Text normalization utilities shared across data pipeline scripts.
+
+Cleaning keeps lowercase ASCII letters, digits and single spaces, and drops
+URLs (`http...` up to the next whitespace). Punctuation and non-ASCII removal,
+whitespace normalization and lowercasing happen in one `bytes.translate` pass
+over the UTF-8 text; the URL pattern is precompiled and only run on texts
+that contain "http". Output is a fixed point (clean_text(clean_text(x)) ==
+clean_text(x)), so files written by the collectors carry CLEANING_VERSION
+and later stages skip re-cleaning them.
 """
 
 import re
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# bump when the cleaning rules change, so previously cleaned files are re-cleaned
+CLEANING_VERSION = 1
+
+# batches at least this large are spread across worker processes
+PARALLEL_MIN_TEXTS = 200_000
+CHUNK_SIZE = 20_000
+
+_URL = re.compile(r"http\S+")
+_UNICODE_SPACE = re.compile(r"[^\S\x00-\x7f]")
+
+
+def _byte_tables():
+    """UTF-8 byte translate table: ASCII uppercase → lowercase, ASCII whitespace → ' '; delete the rest."""
+    table = bytearray(range(256))
+    delete = bytearray()
+    for code in range(256):
+        char = chr(code)
+        if code < 128 and char.isspace():
+            table[code] = ord(" ")
+        elif "A" <= char <= "Z":
+            table[code] = ord(char.lower())
+        elif not (code < 128 and char.isalnum()):
+            delete.append(code)  # ASCII punctuation and every byte of a non-ASCII character
+    return bytes(table), bytes(delete)
+
+
+_TABLE, _DELETE = _byte_tables()
+
 
 def clean_text(text: str) -> str:
     """Remove URLs, punctuation, and excessive spaces."""
     if not isinstance(text, str):
         return ""
-    text = re.sub(r"http\S+", "", text)
-    text = re.sub(r"[^A-Za-z0-9\s]", "", text)
-    text = re.sub(r"\s+", " ", text).strip().lower()
-    return text
+    if "http" in text:
+        text = _URL.sub("", text)
+    # non-ASCII whitespace separates words like ASCII whitespace does
+    if not text.isascii() and _UNICODE_SPACE.search(text):
+        text = _UNICODE_SPACE.sub(" ", text)
+    text = text.encode("utf-8").translate(_TABLE, _DELETE).decode("ascii")
+    # dropping punctuation can join a new "http..." token (e.g. "h.t.t.p.s"); strip it too
+    if "http" in text:
+        text = _URL.sub("", text)
+    return " ".join(text.split())
+
+
+def _clean_chunk(texts: list) -> list:
+    return [clean_text(t) for t in texts]
+
+
+def clean_batch(texts: list, processes: int = None, min_parallel: int = PARALLEL_MIN_TEXTS,
+                chunk_size: int = CHUNK_SIZE) -> list:
+    """
+    Clean a list of texts (one output per input). Batches of at least
+    `min_parallel` texts are split into chunks and cleaned in `processes`
+    worker processes (default: CPU count).
+    """
+    texts = list(texts)
+    processes = processes or os.cpu_count() or 1
+    if len(texts) < min_parallel or processes < 2:
+        return _clean_chunk(texts)
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    with ProcessPoolExecutor(max_workers=min(processes, len(chunks))) as pool:
+        return [t for chunk in pool.map(_clean_chunk, chunks) for t in chunk]
+
 
-def clean_texts(texts: list[str]) -> list[str]:
+def clean_texts(texts: list[str], **kwargs) -> list[str]:
     """Apply clean_text to a list of strings."""
-    return [clean_text(t) for t in texts if t and isinstance(t, str)]
+    return clean_batch([t for t in texts if t and isinstance(t, str)], **kwargs)
@@ -13,6 +13,7 @@ import xgboost as xgb
 from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, f1_score, classification_report
 from data_pipeline.utils.io_utils import ensure_dir, save_json
+from data_pipeline.utils.stage_cache import get_stage_cache, code_fingerprint
 from analytics.evidently_reports import generate_concept_drift_report
 from analytics.plotly_reports import generate_semantic_drift_report, generate_concept_drift_report
 
@@ -20,6 +21,10 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def concept_report_path(topic: str, new_date: str) -> str:
+    return os.path.join("drift_reports/concept", f"{topic.replace(' ', '_')}_concept_drift_{new_date}.json")
+
+
 # ---------- Drift Computation ----------
 def compute_concept_drift(topic, old_emb_path, new_emb_path, old_date, new_date):
     """
@@ -113,10 +118,7 @@ def compute_concept_drift(topic, old_emb_path, new_emb_path, old_date, new_date)
     }
 
     ensure_dir("drift_reports/concept")
-    path = os.path.join(
-        "drift_reports/concept",
-        f"{topic.replace(' ', '_')}_concept_drift_{new_date}.json"
-    )
+    path = concept_report_path(topic, new_date)
     save_json(result, path)
 
     logger.info(f"✅ Concept drift for '{topic}' saved → {path}")
@@ -127,15 +129,18 @@ def compute_concept_drift(topic, old_emb_path, new_emb_path, old_date, new_date)
 
 
 # ---------- Runner ----------
-def run_concept_drift(base_dir="data_pipeline/data/processed/embeddings"):
+def run_concept_drift(base_dir="data_pipeline/data/processed/embeddings", force: bool = False):
     """
     Detect concept drift for all topics across consecutive embedding snapshots.
+    Unchanged snapshot pairs are skipped unless `force` is set.
+    Returns the results computed in this call.
     """
     logger.info("📊 Running concept drift detection...")
 
+    results = []
     if not os.path.exists(base_dir):
         logger.error(f"Embedding directory not found: {base_dir}")
-        return
+        return results
 
     date_dirs = sorted(
         d for d in os.listdir(base_dir) 
@@ -144,7 +149,11 @@ def run_concept_drift(base_dir="data_pipeline/data/processed/embeddings"):
     
     if len(date_dirs) < 2:
         logger.warning("Not enough snapshots for concept drift (need at least 2 dates).")
-        return
+        return results
+
+    cache = get_stage_cache()
+    code = code_fingerprint(compute_concept_drift)
+    skipped = 0
 
     for i in range(1, len(date_dirs)):
         old_date, new_date = date_dirs[i - 1], date_dirs[i]
@@ -170,18 +179,31 @@ def run_concept_drift(base_dir="data_pipeline/data/processed/embeddings"):
 
         for topic_file in common_topics:
             topic_name = topic_file.replace("_", " ")
+            key = f"{topic_file}:{old_date}:{new_date}"
+            fingerprint = cache.fingerprint([old_files[topic_file], new_files[topic_file]], {"code": code})
+            if not force and cache.lookup("concept_drift", key, fingerprint):
+                skipped += 1
+                continue
             try:
-                compute_concept_drift(
+                result = compute_concept_drift(
                     topic=topic_name,
                     old_emb_path=old_files[topic_file],
                     new_emb_path=new_files[topic_file],
                     old_date=old_date,
                     new_date=new_date
                 )
+                if result:
+                    results.append(result)
+                    cache.record("concept_drift", key, fingerprint,
+                                 [concept_report_path(topic_name, new_date)], save=False)
             except Exception as e:
                 logger.error(f"❌ Failed to compute concept drift for {topic_name}: {e}")
+        cache.save()
 
+    if skipped:
+        logger.info(f"⏭️ Skipped {skipped} unchanged snapshot pair(s)")
     logger.info("✅ All concept drift computations completed.")
+    return results
 
 
 if __name__ == "__main__":
@@ -17,6 +17,7 @@ import datetime as dt
 from glob import glob
 from pathlib import Path
 import subprocess, sys
+from monitoring.rollups import update_rollups
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -71,6 +72,9 @@ def main():
     with open(jpath, "w") as f:
         json.dump({"generated_at": today, "date": latest_date, "rows": rows}, f, indent=2)
 
+    # Fold into day/week/month rollups used by the history endpoints
+    update_rollups({"generated_at": today, "date": latest_date, "rows": rows})
+
     # Write CSV
     cpath = os.path.join(SUMMARY_DIR, f"drift_summary_{latest_date}.csv")
     if rows:
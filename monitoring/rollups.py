@@ -0,0 +1,182 @@
+"""
+Maintain day / week / month rollups of the drift summaries.
+
+Each new summary only touches the one bucket it falls into per granularity,
+so history endpoints can serve multi-year ranges without re-reading every
+summary file.
+
+Outputs:
+- drift_reports/rollups/overall_<granularity>.json
+- drift_reports/rollups/topics/<Topic>_<granularity>.json
+"""
+
+import os
+import json
+import datetime as dt
+from glob import glob
+from pathlib import Path
+from data_pipeline.utils.io_utils import save_json, load_json
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DRIFT_DIR = BASE_DIR / "drift_reports"
+SUMMARY_DIR = DRIFT_DIR / "summaries"
+ROLLUP_DIR = DRIFT_DIR / "rollups"
+
+GRANULARITIES = ("day", "week", "month")
+
+TOPIC_NUMERIC_FIELDS = ("semantic_score", "cosine_drift", "jsd_drift", "concept_accuracy_drop")
+
+
+# ---------- Buckets ----------
+def bucket_for(date: str, granularity: str):
+    """Return (key, start, end) of the bucket containing a YYYY-MM-DD date."""
+    d = dt.date.fromisoformat(date)
+    if granularity == "day":
+        return date, date, date
+    if granularity == "week":
+        year, week, weekday = d.isocalendar()
+        start = d - dt.timedelta(days=weekday - 1)
+        end = start + dt.timedelta(days=6)
+        return f"{year}-W{week:02d}", start.isoformat(), end.isoformat()
+    if granularity == "month":
+        start = d.replace(day=1)
+        next_month = (start + dt.timedelta(days=32)).replace(day=1)
+        end = next_month - dt.timedelta(days=1)
+        return f"{d.year}-{d.month:02d}", start.isoformat(), end.isoformat()
+    raise ValueError(f"Unknown granularity: {granularity}")
+
+
+# ---------- Per-day entries and reducers ----------
+def _is_number(v):
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
+def overall_day_entry(rows):
+    semantic = [r.get("semantic_score") for r in rows if _is_number(r.get("semantic_score"))]
+    concept = [r.get("test_acc") for r in rows if _is_number(r.get("test_acc"))]
+    return {
+        "semantic_sum": sum(semantic), "semantic_count": len(semantic),
+        "concept_sum": sum(concept), "concept_count": len(concept),
+    }
+
+
+def overall_values(days):
+    """Same averages as /drift_history, pooled over every topic-day in the bucket."""
+    sem_sum = sum(d["semantic_sum"] for d in days.values())
+    sem_n = sum(d["semantic_count"] for d in days.values())
+    con_sum = sum(d["concept_sum"] for d in days.values())
+    con_n = sum(d["concept_count"] for d in days.values())
+    return {
+        "semantic_drift_score": round(sem_sum / sem_n, 4) if sem_n else None,
+        "concept_drift_score": round(con_sum / con_n, 4) if con_n else None,
+    }
+
+
+def topic_day_entry(row):
+    return {
+        "semantic_score": row.get("semantic_score"),
+        "cosine_drift": row.get("cosine_drift"),
+        "jsd_drift": row.get("jsd_drift"),
+        "concept_accuracy_drop": row.get("accuracy_drop"),
+        "concept_status": row.get("concept_status"),
+    }
+
+
+def topic_values(days):
+    """Mean of each numeric field over the bucket; status of its latest day."""
+    if len(days) == 1:
+        return dict(next(iter(days.values())))
+
+    out = {}
+    for field in TOPIC_NUMERIC_FIELDS:
+        vals = [d[field] for d in days.values() if _is_number(d.get(field))]
+        out[field] = sum(vals) / len(vals) if vals else None
+    out["concept_status"] = days[max(days)].get("concept_status")
+    return out
+
+
+# ---------- Rollup documents ----------
+def empty_rollup(granularity: str):
+    return {"granularity": granularity, "dates": [], "buckets": {}}
+
+
+def upsert_day(rollup: dict, date: str, entry: dict, reducer):
+    """Insert or replace one day's entry and recompute only its bucket."""
+    key, start, end = bucket_for(date, rollup["granularity"])
+    bucket = rollup["buckets"].setdefault(key, {"start": start, "end": end, "days": {}})
+    bucket["days"][date] = entry
+    bucket["values"] = reducer(bucket["days"])
+
+    if date not in rollup["dates"]:
+        rollup["dates"] = sorted(rollup["dates"] + [date])
+    return rollup
+
+
+def topic_file_key(topic: str):
+    return topic.replace(" ", "_")
+
+
+def rollup_path(granularity: str, topic: str = None, rollup_dir=ROLLUP_DIR):
+    if topic is None:
+        return os.path.join(rollup_dir, f"overall_{granularity}.json")
+    return os.path.join(rollup_dir, "topics", f"{topic_file_key(topic)}_{granularity}.json")
+
+
+def _load_rollup(path, granularity):
+    data = load_json(path) if os.path.exists(path) else {}
+    return data if data.get("buckets") is not None else empty_rollup(granularity)
+
+
+# ---------- Public API ----------
+def update_rollups(summary: dict, rollup_dir=ROLLUP_DIR):
+    """Fold one summary into the persisted rollups (called when a summary is written)."""
+    date = summary.get("date")
+    rows = summary.get("rows", [])
+    if not date or not rows:
+        return
+
+    for granularity in GRANULARITIES:
+        path = rollup_path(granularity, rollup_dir=rollup_dir)
+        rollup = _load_rollup(path, granularity)
+        upsert_day(rollup, date, overall_day_entry(rows), overall_values)
+        save_json(rollup, path)
+
+        for row in rows:
+            topic = row.get("topic")
+            if not topic:
+                continue
+            path = rollup_path(granularity, topic, rollup_dir)
+            rollup = _load_rollup(path, granularity)
+            upsert_day(rollup, date, topic_day_entry(row), topic_values)
+            save_json(rollup, path)
+
+
+def build_overall_rollup(summaries, granularity: str):
+    """In-memory rollup over already-loaded summaries (fallback / backfill)."""
+    rollup = empty_rollup(granularity)
+    for s in summaries:
+        if s.get("date") and s.get("rows"):
+            upsert_day(rollup, s["date"], overall_day_entry(s["rows"]), overall_values)
+    return rollup
+
+
+def build_topic_rollup(summaries, topic: str, granularity: str):
+    rollup = empty_rollup(granularity)
+    for s in summaries:
+        for row in s.get("rows", []):
+            if row.get("topic") == topic and s.get("date"):
+                upsert_day(rollup, s["date"], topic_day_entry(row), topic_values)
+    return rollup
+
+
+def rebuild_rollups(summary_dir=SUMMARY_DIR, rollup_dir=ROLLUP_DIR):
+    """Backfill rollups from every summary on disk."""
+    for p in sorted(glob(os.path.join(summary_dir, "drift_summary_*.json"))):
+        with open(p) as f:
+            update_rollups(json.load(f), rollup_dir)
+    print(f"✅ Rollups rebuilt under {rollup_dir}")
+
+
+if __name__ == "__main__":
+    rebuild_rollups()
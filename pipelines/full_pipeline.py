@@ -6,11 +6,9 @@ Author: Krishna
 
 import os
 import sys
-import time
-import json
+import argparse
 import datetime as dt
 import logging
-from glob import glob
 import mlflow
 
 # =========================================
@@ -53,22 +51,31 @@ logger.info(f"Logging initialized. Saving to: {log_file}")
 from data_pipeline.data_collectors.reddit_scraper import fetch_reddit_posts
 from data_pipeline.data_collectors.wiki_scraper import fetch_wiki_page
 from data_pipeline.data_collectors.rss_scraper import fetch_rss_articles
+from data_pipeline.data_collectors.scheduler import CollectorScheduler, CollectionJob, results_by_topic
 from data_pipeline.combine_sources import combine_topic_data
 from data_pipeline.clean_combined_data import clean_combined_topic
 from data_pipeline.generate_embeddings import generate_embeddings_for_topic
-from analytics.semantic_drift import run_semantic_drift
+from data_pipeline.process_topic import process_topic
+from analytics.semantic_drift import run_semantic_drift, semantic_report_path
+from analytics.projection import run_projections
 
 # Try to import concept drift (module may vary by install)
 try:
-    from analytics.concept_drift_xgb import run_concept_drift
+    from analytics.concept_drift_xgb import run_concept_drift, concept_report_path
 except ImportError:
     try:
-        from models.concept_drift_xgb import run_concept_drift
+        from models.concept_drift_xgb import run_concept_drift, concept_report_path
     except ImportError:
         logger.warning("concept_drift_xgb module not found")
         run_concept_drift = None
 
 from data_pipeline.utils.log_data_collection import log_collection_event
+from pipelines.run_journal import RunJournal
+from pipelines.stage_executor import PipelinedExecutor, Stage
+from pipelines.profiling import PipelineProfiler, MODES as PROFILE_MODES, count_items
+from pipelines.mlflow_logging import (
+    SEMANTIC_FIELDS, CONCEPT_FIELDS, log_drift_results, files_modified_since, log_new_artifacts
+)
 
 # =========================================
 # CONFIG
@@ -78,10 +85,110 @@ TOPICS = [
     "Cryptocurrency", "Electric Vehicles", "Elections"
 ]
 
+# Units of work, in execution order, as recorded in the run journal
+PLAN = (
+    [("collection", t) for t in TOPICS]
+    + [("preparation", t) for t in TOPICS]
+    + [("embedding", t) for t in TOPICS]
+    + [("projection", None), ("semantic_drift", None), ("concept_drift", None)]
+)
+
+# Worker threads per stage in --pipelined mode. Collection mostly waits on the
+# network (sources inside a topic already run concurrently); preparation and
+# embedding are CPU-bound.
+STAGE_WORKERS = {"collection": 2, "preparation": 1, "embedding": 1, "processing": 1}
+# topics allowed to wait between two stages
+PIPELINE_QUEUE_SIZE = 2
+# rendered drift plots; per-topic subdirectories are kept in the MLflow artifact tree
+VISUAL_REPORTS_DIR = "drift_reports/visual"
+
 # =========================================
 # MAIN PIPELINE FUNCTION
 # =========================================
-def run_full_pipeline():
+def collection_jobs(topic: str) -> list:
+    return [
+        CollectionJob("reddit", topic, fetch_reddit_posts, {"limit": 100}, paged=True),
+        CollectionJob("wikipedia", topic, fetch_wiki_page),
+        CollectionJob("rss", topic, fetch_rss_articles),
+    ]
+
+
+def record_collection(journal: RunJournal, topic: str, topic_results: list) -> str:
+    """Log a topic's collection outcome and checkpoint it if every source succeeded; returns the status."""
+    failed = [r for r in topic_results if r["status"] == "failed"]
+    if failed:
+        errors = "; ".join(f"{r['source']}: {r['error']}" for r in failed)
+        log_collection_event(topic, "data_collection", f"failed: {errors}")
+        logger.error(f"Failed to collect data for {topic}: {errors}")
+        return "error"
+    log_collection_event(topic, "data_collection", "success")
+    journal.mark_done("collection", topic)
+    return "ok"
+
+
+def run_pipelined(journal: RunJournal, profiler: PipelineProfiler, done, force: bool = False,
+                  fused: bool = False, materialize: bool = False, stage_workers: dict = None):
+    """
+    Phases 1-3 as a producer/consumer pipeline over topics (see stage_executor):
+    topic N+1 is collected while topic N is prepared and embedded. Each
+    (stage, topic) is checkpointed in the journal as soon as it finishes.
+    """
+    workers = {**STAGE_WORKERS, **(stage_workers or {})}
+    scheduler = CollectorScheduler()  # shared, so rate limits hold across collection workers
+    skipped = object()
+
+    def collect(topic):
+        if done("collection", topic):
+            return skipped
+        results = scheduler.run(collection_jobs(topic))
+        return results, record_collection(journal, topic, results)
+
+    def prepare(topic):
+        if done("preparation", topic):
+            return skipped
+        combine_topic_data(topic, force=force)
+        path = clean_combined_topic(topic, force=force)
+        journal.mark_done("preparation", topic)
+        return path
+
+    def embed(topic):
+        if done("embedding", topic):
+            return skipped
+        path = generate_embeddings_for_topic(topic, force=force)
+        journal.mark_done("embedding", topic)
+        return path
+
+    def process(topic):
+        if journal.is_done("preparation", topic) and done("embedding", topic):
+            return skipped
+        path = process_topic(topic, force=force, materialize=materialize)
+        journal.mark_done("preparation", topic)
+        journal.mark_done("embedding", topic)
+        return path
+
+    def on_result(r):
+        if r["result"] is skipped:
+            return
+        items, status = 0, "error" if r["status"] == "failed" else "ok"
+        if r["stage"] == "collection" and r["result"]:
+            results, status = r["result"]
+            items = sum(count_items(res["path"]) for res in results)
+        elif r["result"]:
+            items = count_items(r["result"])
+        profiler.add(r["stage"], r["topic"], items=items, wall_s=r["elapsed_s"], status=status)
+
+    stages = [Stage("collection", collect, workers["collection"])]
+    if fused:
+        stages.append(Stage("processing", process, workers["processing"]))
+    else:
+        stages += [Stage("preparation", prepare, workers["preparation"]),
+                   Stage("embedding", embed, workers["embedding"])]
+    return PipelinedExecutor(stages, queue_size=PIPELINE_QUEUE_SIZE, on_result=on_result).run(TOPICS)
+
+
+def run_full_pipeline(profile_mode: str = "basic", force: bool = False, resume: str = None,
+                      fused: bool = False, materialize: bool = False,
+                      pipelined: bool = False, stage_workers: dict = None):
     logger.info("Starting IntentDriftWatch full pipeline...")
 
     # -----------------------------
@@ -90,115 +197,196 @@ def run_full_pipeline():
     mlflow.set_tracking_uri("file:./mlruns")
     mlflow.set_experiment("IntentDriftWatch_Experiments")
 
-    run_name = f"Run_{dt.datetime.utcnow().strftime('%Y-%m-%d_%H-%M-%S')}"
-    with mlflow.start_run(run_name=run_name):
-        mlflow.log_param("run_date", str(dt.datetime.utcnow()))
-        mlflow.log_param("tracked_topics", TOPICS)
+    journal = RunJournal.load(resume) if resume else None
+    if journal:
+        journal.start_attempt(profile_mode=profile_mode, force=force)
+        run_name = f"{journal.run_name}_resume{journal.attempt - 1}"
+        pending = journal.pending(PLAN)
+        logger.info(f"Resuming run {journal.run_id}: {len(PLAN) - len(pending)}/{len(PLAN)} units done"
+                    + (f", continuing at {pending[0][0]} {pending[0][1] or ''}" if pending else ""))
+    else:
+        run_name = f"Run_{dt.datetime.utcnow().strftime('%Y-%m-%d_%H-%M-%S')}"
+    profiler = PipelineProfiler(run_name, mode=profile_mode)
 
-        # -----------------------------
-        # PHASE 1: DATA COLLECTION
-        # -----------------------------
-        logger.info("Phase 1: Collecting data from Reddit, Wikipedia, and RSS")
+    with mlflow.start_run(run_id=journal.run_id if journal else None,
+                          run_name=None if journal else run_name) as run:
+        if journal is None:
+            journal = RunJournal.create(run.info.run_id, run_name, profile_mode=profile_mode, force=force)
+            logger.info(f"Run id: {run.info.run_id} (resume with --resume {run.info.run_id})")
+            mlflow.log_param("run_date", str(dt.datetime.utcnow()))
+            mlflow.log_param("tracked_topics", TOPICS)
+            mlflow.log_param("profile_mode", profile_mode)
+            mlflow.log_param("force", force)
+            mlflow.log_param("fused", fused)
+            mlflow.log_param("pipelined", pipelined)
+        else:
+            # params are immutable once logged; record the resume as a tag
+            mlflow.set_tag(f"resumed_{journal.attempt - 1}", str(dt.datetime.utcnow()))
 
-        for topic in TOPICS:
-            try:
-                fetch_reddit_posts(topic, limit=100)
-                fetch_wiki_page(topic)
-                fetch_rss_articles(topic)
-                log_collection_event(topic, "data_collection", "success")
-                time.sleep(5)
-            except Exception as e:
-                log_collection_event(topic, "data_collection", f"failed: {e}")
-                logger.error(f"Failed to collect data for {topic}: {e}")
+        def done(phase, topic=None):
+            if journal.is_done(phase, topic):
+                logger.info(f"⏭️ {phase} {topic or ''} already completed in this run, skipping")
+                return True
+            return False
 
-        # -----------------------------
-        # PHASE 2: DATA PREPARATION
-        # -----------------------------
-        logger.info("Phase 2: Combining and cleaning data")
+        if pipelined:
+            # -----------------------------
+            # PHASES 1-3 PIPELINED: topics stream through collection → preparation → embedding
+            # -----------------------------
+            logger.info("Phases 1-3: Collecting, preparing and embedding topics in a pipeline")
+            with profiler.stage("pipelined"):
+                run_pipelined(journal, profiler, done, force=force, fused=fused,
+                              materialize=materialize, stage_workers=stage_workers)
+        else:
+            # -----------------------------
+            # PHASE 1: DATA COLLECTION
+            # -----------------------------
+            logger.info("Phase 1: Collecting data from Reddit, Wikipedia, and RSS")
 
-        for topic in TOPICS:
-            try:
-                combine_topic_data(topic)
-                clean_combined_topic(topic)
-            except Exception as e:
-                logger.error(f"Failed during processing for {topic}: {e}")
+            with profiler.stage("collection"):
+                # sources run concurrently, each under its own rate limit
+                jobs = [job for topic in TOPICS if not done("collection", topic) for job in collection_jobs(topic)]
+                results = CollectorScheduler().run(jobs) if jobs else []
 
-        # -----------------------------
-        # PHASE 3: EMBEDDING GENERATION
-        # -----------------------------
-        logger.info("Phase 3: Generating embeddings")
+                for topic, topic_results in results_by_topic(results).items():
+                    profiler.add("collection", topic,
+                                 items=sum(count_items(r["path"]) for r in topic_results),
+                                 wall_s=max(r["elapsed_s"] for r in topic_results),
+                                 status=record_collection(journal, topic, topic_results))
+
+        # (pipelined runs have already prepared and embedded every topic)
+        if fused and not pipelined:
+            # -----------------------------
+            # PHASES 2-3 FUSED: combine → clean → embed in memory, per topic
+            # -----------------------------
+            logger.info("Phases 2-3: Combining, cleaning and embedding in one pass per topic")
+
+            with profiler.stage("processing"):
+                for topic in TOPICS:
+                    if journal.is_done("preparation", topic) and done("embedding", topic):
+                        continue
+                    try:
+                        with profiler.stage("processing", topic) as st:
+                            st["items"] = count_items(process_topic(topic, force=force, materialize=materialize))
+                        journal.mark_done("preparation", topic)
+                        journal.mark_done("embedding", topic)
+                    except Exception as e:
+                        logger.error(f"Processing failed for {topic}: {e}")
+        elif not pipelined:
+            # -----------------------------
+            # PHASE 2: DATA PREPARATION
+            # -----------------------------
+            logger.info("Phase 2: Combining and cleaning data")
 
-        for topic in TOPICS:
+            with profiler.stage("preparation"):
+                for topic in TOPICS:
+                    if done("preparation", topic):
+                        continue
+                    try:
+                        with profiler.stage("preparation", topic) as st:
+                            combine_topic_data(topic, force=force)
+                            st["items"] = count_items(clean_combined_topic(topic, force=force))
+                        journal.mark_done("preparation", topic)
+                    except Exception as e:
+                        logger.error(f"Failed during processing for {topic}: {e}")
+
+            # -----------------------------
+            # PHASE 3: EMBEDDING GENERATION
+            # -----------------------------
+            logger.info("Phase 3: Generating embeddings")
+
+            with profiler.stage("embedding"):
+                for topic in TOPICS:
+                    if done("embedding", topic):
+                        continue
+                    try:
+                        with profiler.stage("embedding", topic) as st:
+                            st["items"] = count_items(generate_embeddings_for_topic(topic, force=force))
+                        journal.mark_done("embedding", topic)
+                    except Exception as e:
+                        logger.error(f"Embedding failed for {topic}: {e}")
+
+        # 2D projections served by /embeddings/{topic}/projection
+        if not done("projection"):
             try:
-                generate_embeddings_for_topic(topic)
+                with profiler.stage("projection") as st:
+                    st["items"] = len(run_projections("data_pipeline/data/processed/embeddings"))
+                journal.mark_done("projection")
             except Exception as e:
-                logger.error(f"Embedding failed for {topic}: {e}")
+                logger.error(f"Projection computation failed: {e}")
 
         # -----------------------------
         # PHASE 4: SEMANTIC DRIFT
         # -----------------------------
         logger.info("Phase 4: Detecting semantic drift")
-        try:
-            run_semantic_drift("data_pipeline/data/processed/embeddings")
-        except Exception as e:
-            logger.error(f"Semantic drift computation failed: {e}")
-
-        # Log semantic drift metrics
-        semantic_reports = glob("drift_reports/semantic/*.json")
-        for rpt in semantic_reports:
+        if not done("semantic_drift"):
+            semantic_results = None
             try:
-                with open(rpt) as f:
-                    data = json.load(f)
-                topic_key = data["topic"].replace(" ", "_")
-                mlflow.log_metric(f"{topic_key}_cosine_drift", data["cosine_drift"])
-                mlflow.log_metric(f"{topic_key}_jsd_drift", data["jsd_drift"])
-                mlflow.log_metric(f"{topic_key}_drift_score", data["drift_score"])
+                with profiler.stage("semantic_drift") as st:
+                    semantic_results = run_semantic_drift("data_pipeline/data/processed/embeddings", force=force) or []
+                    st["items"] = len(semantic_results)
             except Exception as e:
-                logger.warning(f"Could not log semantic drift metric from {rpt}: {e}")
+                logger.error(f"Semantic drift computation failed: {e}")
 
-        if os.path.exists("drift_reports/semantic"):
-            mlflow.log_artifacts("drift_reports/semantic", artifact_path="semantic_reports")
+            if semantic_results is not None:
+                # Log this run's semantic drift metrics (one batch, step = snapshot date)
+                try:
+                    log_drift_results(semantic_results, SEMANTIC_FIELDS, semantic_report_path, "semantic_reports")
+                except Exception as e:
+                    logger.warning(f"Could not log semantic drift metrics: {e}")
+                journal.mark_done("semantic_drift")
 
         # -----------------------------
         # PHASE 5: CONCEPT DRIFT
         # -----------------------------
         logger.info("Phase 5: Detecting concept drift")
 
-        if run_concept_drift is not None:
+        if run_concept_drift is None:
+            logger.warning("Concept drift module not available, skipping Phase 5")
+        elif not done("concept_drift"):
+            concept_results = None
             try:
-                run_concept_drift("data_pipeline/data/processed/embeddings")
+                with profiler.stage("concept_drift") as st:
+                    concept_results = run_concept_drift("data_pipeline/data/processed/embeddings", force=force) or []
+                    st["items"] = len(concept_results)
             except Exception as e:
                 logger.error(f"Concept drift computation failed: {e}")
 
-            concept_reports = glob("drift_reports/concept/*.json")
-            for rpt in concept_reports:
+            if concept_results is not None:
                 try:
-                    with open(rpt) as f:
-                        data = json.load(f)
-                    topic_key = data["topic"].replace(" ", "_")
-                    mlflow.log_metric(f"{topic_key}_train_acc", data["train_acc"])
-                    mlflow.log_metric(f"{topic_key}_test_acc", data["test_acc"])
-                    mlflow.log_metric(f"{topic_key}_accuracy_drop", data["accuracy_drop"])
-                    mlflow.log_metric(f"{topic_key}_test_f1", data["test_f1"])
+                    log_drift_results(concept_results, CONCEPT_FIELDS, concept_report_path, "concept_reports")
                 except Exception as e:
-                    logger.warning(f"Could not log concept drift metric from {rpt}: {e}")
-
-            if os.path.exists("drift_reports/concept"):
-                mlflow.log_artifacts("drift_reports/concept", artifact_path="concept_reports")
-        else:
-            logger.warning("Concept drift module not available, skipping Phase 5")
+                    logger.warning(f"Could not log concept drift metrics: {e}")
+                journal.mark_done("concept_drift")
 
         # -----------------------------
         # Visual Drift Reports
         # -----------------------------
-        if os.path.exists("drift_reports/visual"):
-            mlflow.log_artifacts("drift_reports/visual", artifact_path="visual_reports")
-            logger.info("Visual drift reports logged to MLflow")
+        with profiler.stage("reporting"):
+            # only the visual reports rendered during this run (any attempt of it)
+            visual = files_modified_since(VISUAL_REPORTS_DIR, journal.started_ts)
+            if visual:
+                log_new_artifacts(visual, "visual_reports", root=VISUAL_REPORTS_DIR)
+                logger.info(f"{len(visual)} visual drift report(s) logged to MLflow")
+
+        # -----------------------------
+        # Run profile (JSON + one batched MLflow call)
+        # -----------------------------
+        try:
+            profiler.log_to_mlflow(profiler.save())
+        except Exception as e:
+            logger.warning(f"Could not record run profile: {e}")
 
         # -----------------------------
         # END OF RUN
         # -----------------------------
-        logger.info("Pipeline complete! All phases executed successfully.")
+        pending = journal.pending(PLAN if run_concept_drift else PLAN[:-1])
+        if pending:
+            logger.warning(f"Pipeline finished with {len(pending)} incomplete unit(s); "
+                           f"retry them with --resume {journal.run_id}")
+        else:
+            journal.finish()
+            logger.info("Pipeline complete! All phases executed successfully.")
         mlflow.end_run()
 
 
@@ -206,4 +394,23 @@ def run_full_pipeline():
 # ENTRY POINT
 # =========================================
 if __name__ == "__main__":
-    run_full_pipeline()
+    parser = argparse.ArgumentParser(description="Run the IntentDriftWatch pipeline")
+    parser.add_argument("--profile", choices=PROFILE_MODES, default="basic",
+                        help="basic timing/RSS, or add cProfile / tracemalloc capture")
+    parser.add_argument("--force", action="store_true",
+                        help="recompute every stage even if its inputs are unchanged")
+    parser.add_argument("--resume", metavar="RUN_ID",
+                        help="continue an interrupted run from its first incomplete unit")
+    parser.add_argument("--fused", action="store_true",
+                        help="combine, clean and embed each topic in memory, without intermediate files")
+    parser.add_argument("--materialize", action="store_true",
+                        help="with --fused, also write the combined and cleaned JSON files")
+    parser.add_argument("--pipelined", action="store_true",
+                        help="overlap collection, preparation and embedding across topics")
+    parser.add_argument("--stage-workers", nargs="*", default=[], metavar="STAGE=N",
+                        help=f"worker threads per stage with --pipelined (default: {STAGE_WORKERS})")
+    args = parser.parse_args()
+    stage_workers = {name: int(n) for name, n in (w.split("=", 1) for w in args.stage_workers)}
+    run_full_pipeline(profile_mode=args.profile, force=args.force, resume=args.resume,
+                      fused=args.fused, materialize=args.materialize,
+                      pipelined=args.pipelined, stage_workers=stage_workers)
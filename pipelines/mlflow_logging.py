@@ -0,0 +1,93 @@
+"""
+Module: mlflow_logging.py
+Purpose: Run-scoped, batched MLflow logging for the pipeline.
+
+Only results produced by the current run are logged. Metrics keep one key per
+topic and field (e.g. `Elections_drift_score`) and use the snapshot date as the
+step, so several dates in one run no longer overwrite each other. Everything
+goes out through MlflowClient.log_batch, in chunks of MLflow's per-request
+limit; artifacts are uploaded file by file, only for files this run wrote.
+"""
+
+import os
+import time
+import datetime as dt
+import logging
+
+logger = logging.getLogger(__name__)
+
+SEMANTIC_FIELDS = ("cosine_drift", "jsd_drift", "drift_score")
+CONCEPT_FIELDS = ("train_acc", "test_acc", "accuracy_drop", "test_f1")
+
+MAX_METRICS_PER_BATCH = 1000
+
+
+def date_step(date: str) -> int:
+    """Snapshot date as a readable integer step: 2025-11-15 -> 20251115."""
+    return int(dt.date.fromisoformat(date).strftime("%Y%m%d"))
+
+
+def drift_metric_entries(results: list, fields, timestamp_ms: int = None):
+    """[(key, value, timestamp_ms, step)] for every numeric field of every result."""
+    timestamp_ms = timestamp_ms or int(time.time() * 1000)
+    entries = []
+    for r in results:
+        topic_key = r["topic"].replace(" ", "_")
+        step = date_step(r["new_date"])
+        for field in fields:
+            value = r.get(field)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                entries.append((f"{topic_key}_{field}", float(value), timestamp_ms, step))
+    return entries
+
+
+def log_metric_entries(entries: list, run_id: str = None):
+    """Send metric entries to the (active) run via log_batch. Returns the number of requests."""
+    if not entries:
+        return 0
+    import mlflow
+    from mlflow.entities import Metric
+    from mlflow.tracking import MlflowClient
+
+    run_id = run_id or mlflow.active_run().info.run_id
+    client = MlflowClient()
+    requests = 0
+    for i in range(0, len(entries), MAX_METRICS_PER_BATCH):
+        chunk = entries[i:i + MAX_METRICS_PER_BATCH]
+        client.log_batch(run_id, metrics=[Metric(k, v, ts, step) for k, v, ts, step in chunk])
+        requests += 1
+    return requests
+
+
+def log_drift_results(results: list, fields, report_path_fn, artifact_path: str, run_id: str = None):
+    """Log this run's drift results as batched metrics and upload only their report files."""
+    entries = drift_metric_entries(results, fields)
+    requests = log_metric_entries(entries, run_id)
+    uploaded = log_new_artifacts(
+        [report_path_fn(r["topic"], r["new_date"]) for r in results], artifact_path
+    )
+    logger.info(f"📈 Logged {len(entries)} metrics in {requests} batch(es), {uploaded} report(s) → {artifact_path}")
+    return len(entries)
+
+
+def files_modified_since(directory: str, since: float):
+    """Files anywhere under `directory` (subdirectories included) written at or after epoch `since`."""
+    if not os.path.isdir(directory):
+        return []
+    paths = (os.path.join(root, name) for root, _, names in os.walk(directory) for name in names)
+    return sorted(p for p in paths if os.path.getmtime(p) >= since)
+
+
+def log_new_artifacts(paths: list, artifact_path: str, root: str = None):
+    """
+    Upload the given files (skipping missing ones and duplicates). With `root`,
+    each file keeps its subdirectory under it in `artifact_path`. Returns the count.
+    """
+    import mlflow
+    uploaded = 0
+    for path in dict.fromkeys(paths):
+        if os.path.exists(path):
+            subdir = os.path.dirname(os.path.relpath(path, root)) if root else ""
+            mlflow.log_artifact(path, artifact_path=os.path.join(artifact_path, subdir) if subdir else artifact_path)
+            uploaded += 1
+    return uploaded
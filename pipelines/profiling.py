@@ -0,0 +1,233 @@
+"""
+Module: profiling.py
+Purpose: Per-phase / per-topic resource instrumentation for the pipeline.
+
+Each `stage()` records wall time, CPU time, the process peak RSS (and how much
+this stage raised it) and the number of items it processed. Optional capture
+modes add detail to top-level stages:
+
+- "cprofile":    cProfile per phase; .prof dumps plus the top functions in the JSON
+- "tracemalloc": Python heap peak per stage plus the top allocation sites per phase
+
+The run profile is saved as JSON and can be logged to the active MLflow run in
+a single batched call.
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import pstats
+import cProfile
+import tracemalloc
+import datetime as dt
+import logging
+from contextlib import contextmanager
+from data_pipeline.utils.io_utils import ensure_dir, save_json
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROFILE_DIR = os.path.join(PROJECT_ROOT, "monitoring", "profiles")
+
+MODES = ("basic", "cprofile", "tracemalloc")
+TOP_N = 15
+
+
+def peak_rss_mb():
+    """High-water mark of the process RSS in MB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 2)
+
+
+def count_items(path):
+    """Rows in a pipeline output (.npy rows, .parquet footer row count, or `texts` / list length of a JSON file)."""
+    if not path or not os.path.exists(path):
+        return 0
+    try:
+        if path.endswith(".npy"):
+            import numpy as np
+            return int(np.load(path, mmap_mode="r").shape[0])
+        if path.endswith(".parquet"):
+            from data_pipeline.utils import record_store
+            return record_store.num_rows(path) if record_store.available() else 0
+        if path.endswith(".json"):
+            with open(path) as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                return len(data.get("texts", data.get("items", [])))
+            return len(data)
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
+class PipelineProfiler:
+    """Collects stage records for one pipeline run."""
+
+    def __init__(self, run_name: str, mode: str = "basic", output_dir: str = PROFILE_DIR):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profiling mode: {mode} (expected one of {MODES})")
+        self.run_name = run_name
+        self.mode = mode
+        self.output_dir = output_dir
+        self.started_at = dt.datetime.utcnow()
+        self.records = []
+        self.captures = {}
+        self._stack = []
+        self._t0 = time.perf_counter()
+        if mode == "tracemalloc" and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, phase: str, topic: str = None):
+        """Time a block. Set `record["items"]` inside it to report items processed."""
+        record = {"phase": phase, "topic": topic, "items": 0, "status": "ok"}
+        top_level = not self._stack
+        profiler = None
+        if top_level and self.mode == "cprofile":
+            profiler = cProfile.Profile()
+        if self.mode == "tracemalloc":
+            tracemalloc.reset_peak()
+
+        rss_before = peak_rss_mb()
+        self._stack.append(record)
+        wall0, cpu0 = time.perf_counter(), time.process_time()
+        if profiler:
+            profiler.enable()
+        try:
+            yield record
+        except Exception as e:
+            record["status"] = "error"
+            record["error"] = str(e)
+            raise
+        finally:
+            if profiler:
+                profiler.disable()
+            record["wall_s"] = round(time.perf_counter() - wall0, 4)
+            record["cpu_s"] = round(time.process_time() - cpu0, 4)
+            rss_after = peak_rss_mb()
+            record["peak_rss_mb"] = rss_after
+            record["rss_growth_mb"] = round(rss_after - rss_before, 2) if rss_after is not None else None
+            self._stack.pop()
+
+            if self.mode == "tracemalloc":
+                record["py_heap_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2 ** 20, 2)
+                # a nested stage reset the peak; keep the parent's view correct
+                if self._stack:
+                    parent = self._stack[-1]
+                    parent["_child_heap_peak_mb"] = max(parent.get("_child_heap_peak_mb", 0), record["py_heap_peak_mb"])
+                record["py_heap_peak_mb"] = max(record["py_heap_peak_mb"], record.pop("_child_heap_peak_mb", 0))
+                if top_level:
+                    self.captures.setdefault(phase, {})["top_allocations"] = self._top_allocations()
+            if profiler:
+                self.captures.setdefault(phase, {}).update(self._dump_cprofile(phase, profiler))
+            self.records.append(record)
+
+    def add(self, phase: str, topic: str = None, items: int = 0, wall_s: float = 0.0, status: str = "ok"):
+        """Record work timed elsewhere, e.g. per-topic jobs that ran concurrently inside a stage."""
+        self.records.append({"phase": phase, "topic": topic, "items": items, "status": status,
+                             "wall_s": round(wall_s, 4), "cpu_s": None, "peak_rss_mb": None,
+                             "rss_growth_mb": None})
+
+    # ----- capture helpers -----
+    def _run_dir(self):
+        path = os.path.join(self.output_dir, self.run_name)
+        ensure_dir(path)
+        return path
+
+    def _dump_cprofile(self, phase: str, profiler):
+        prof_path = os.path.join(self._run_dir(), f"{phase}.prof")
+        profiler.dump_stats(prof_path)
+        buf = io.StringIO()
+        stats = pstats.Stats(profiler, stream=buf).sort_stats("cumulative")
+        top = []
+        for (filename, line, func), (_, ncalls, tottime, cumtime, _) in sorted(
+                stats.stats.items(), key=lambda kv: kv[1][3], reverse=True)[:TOP_N]:
+            top.append({"function": f"{os.path.basename(filename)}:{line}({func})", "calls": ncalls,
+                        "tottime_s": round(tottime, 4), "cumtime_s": round(cumtime, 4)})
+        return {"cprofile_dump": prof_path, "top_functions": top}
+
+    def _top_allocations(self):
+        snapshot = tracemalloc.take_snapshot()
+        return [
+            {"site": f"{os.path.basename(s.traceback[0].filename)}:{s.traceback[0].lineno}",
+             "size_mb": round(s.size / 2 ** 20, 3), "count": s.count}
+            for s in snapshot.statistics("lineno")[:TOP_N]
+        ]
+
+    # ----- results -----
+    def phase_totals(self):
+        """
+        Per-phase totals. Time comes from the phase-level stage when there is
+        one, otherwise from the sum of its topic stages; items are summed over
+        topic stages when the phase has any.
+        """
+        totals = {}
+        for phase in dict.fromkeys(r["phase"] for r in self.records):
+            records = [r for r in self.records if r["phase"] == phase]
+            phase_level = [r for r in records if r["topic"] is None]
+            per_topic = [r for r in records if r["topic"] is not None]
+            timed = phase_level or per_topic
+            rss = [r["peak_rss_mb"] for r in records if r["peak_rss_mb"] is not None]
+            # add() records (work timed in other threads) carry no CPU time
+            cpu = [r["cpu_s"] for r in timed if r["cpu_s"] is not None]
+            totals[phase] = {
+                "wall_s": round(sum(r["wall_s"] for r in timed), 4),
+                "cpu_s": round(sum(cpu), 4) if cpu else None,
+                "items": sum(r["items"] for r in (per_topic or phase_level)),
+                "errors": sum(r["status"] == "error" for r in records),
+                "peak_rss_mb": max(rss) if rss else None,
+            }
+        return totals
+
+    def to_dict(self):
+        return {
+            "run_name": self.run_name,
+            "mode": self.mode,
+            "started_at": str(self.started_at),
+            "total_wall_s": round(time.perf_counter() - self._t0, 4),
+            "peak_rss_mb": peak_rss_mb(),
+            "phases": self.phase_totals(),
+            "stages": self.records,
+            "captures": self.captures,
+        }
+
+    def save(self):
+        """Write the run profile JSON; returns its path."""
+        path = os.path.join(self.output_dir, f"{self.run_name}.json")
+        ensure_dir(self.output_dir)
+        save_json(self.to_dict(), path)
+        logger.info(f"⏱️ Run profile saved → {path}")
+        return path
+
+    def mlflow_metrics(self):
+        """Flat {metric: value} for one batched MLflow call."""
+        metrics = {}
+        for phase, t in self.phase_totals().items():
+            for field in ("wall_s", "cpu_s", "items", "errors", "peak_rss_mb"):
+                if t[field] is not None:
+                    metrics[f"profile_{phase}_{field}"] = float(t[field])
+        for r in self.records:
+            if r["topic"] is None:
+                continue
+            key = f"profile_{r['phase']}_{r['topic'].replace(' ', '_')}"
+            metrics[f"{key}_wall_s"] = float(r["wall_s"])
+            metrics[f"{key}_items"] = float(r["items"])
+        return metrics
+
+    def log_to_mlflow(self, profile_path: str = None):
+        """Log all profile metrics to the active MLflow run in one request."""
+        import mlflow
+        mlflow.log_metrics(self.mlflow_metrics())
+        if profile_path:
+            mlflow.log_artifact(profile_path, artifact_path="profiles")
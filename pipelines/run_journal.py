@@ -0,0 +1,105 @@
+"""
+Module: run_journal.py
+Purpose: Checkpoint journal for resumable pipeline runs.
+
+Every completed unit of work, a (phase, topic) pair or a whole phase, is
+recorded in monitoring/runs/<run_id>.json as soon as it finishes. The journal
+is rewritten atomically on each update, so after a crash it holds exactly the
+units that finished. Updates are serialized, so pipelined stages running in
+worker threads can record units concurrently. `full_pipeline.py --resume <run_id>` reopens the journal
+and the MLflow run of the same id and skips everything already recorded.
+"""
+
+import os
+import time
+import threading
+import datetime as dt
+import logging
+from data_pipeline.utils.io_utils import save_json, load_json
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+JOURNAL_DIR = os.path.join(PROJECT_ROOT, "monitoring", "runs")
+
+
+def unit_key(phase: str, topic: str = None) -> str:
+    return f"{phase}:{topic}" if topic else phase
+
+
+class RunJournal:
+    """Completed units of one pipeline run, keyed by its MLflow run id."""
+
+    def __init__(self, data: dict, journal_dir: str = JOURNAL_DIR):
+        self.data = data
+        self.journal_dir = journal_dir
+        self._lock = threading.RLock()
+
+    @classmethod
+    def create(cls, run_id: str, run_name: str, journal_dir: str = JOURNAL_DIR, **params):
+        journal = cls({
+            "run_id": run_id,
+            "run_name": run_name,
+            "started_at": str(dt.datetime.utcnow()),
+            "started_ts": time.time(),
+            "status": "running",
+            "attempts": [],
+            "completed": {},
+        }, journal_dir)
+        journal.start_attempt(**params)
+        return journal
+
+    @classmethod
+    def load(cls, run_id: str, journal_dir: str = JOURNAL_DIR):
+        path = os.path.join(journal_dir, f"{run_id}.json")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No run journal for run id '{run_id}' in {journal_dir}")
+        return cls(load_json(path), journal_dir)
+
+    @property
+    def path(self):
+        return os.path.join(self.journal_dir, f"{self.run_id}.json")
+
+    @property
+    def run_id(self):
+        return self.data["run_id"]
+
+    @property
+    def run_name(self):
+        return self.data["run_name"]
+
+    @property
+    def started_ts(self):
+        """Epoch time of the first attempt (outputs of every attempt are newer)."""
+        return self.data["started_ts"]
+
+    @property
+    def attempt(self):
+        """1 for the original run, 2 for the first resume, ..."""
+        return len(self.data["attempts"])
+
+    def start_attempt(self, **params):
+        self.data["attempts"].append({"started_at": str(dt.datetime.utcnow()), **params})
+        self.data["status"] = "running"
+        self.save()
+
+    def is_done(self, phase: str, topic: str = None) -> bool:
+        return unit_key(phase, topic) in self.data["completed"]
+
+    def mark_done(self, phase: str, topic: str = None):
+        with self._lock:
+            self.data["completed"][unit_key(phase, topic)] = str(dt.datetime.utcnow())
+            self.save()
+
+    def pending(self, units: list) -> list:
+        """Units of the plan [(phase, topic), ...] not yet completed, in plan order."""
+        return [u for u in units if not self.is_done(*u)]
+
+    def finish(self):
+        self.data["status"] = "complete"
+        self.data["finished_at"] = str(dt.datetime.utcnow())
+        self.save()
+
+    def save(self):
+        with self._lock:
+            save_json(self.data, self.path)
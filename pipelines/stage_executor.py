@@ -0,0 +1,111 @@
+"""
+Module: stage_executor.py
+Purpose: Pipelined per-topic execution of pipeline stages (producer/consumer).
+
+Run phase by phase, the pipeline first waits on the network for every topic,
+then prepares every topic, then embeds every topic. Here each stage has its
+own worker threads and a bounded queue in front of it: as soon as a topic
+leaves one stage it is queued for the next, so topic N+1 is collected while
+topic N is cleaned and embedded. Total wall time approaches that of the
+slowest stage rather than the sum of all of them. Bounded queues keep a fast
+producer from running far ahead of a slow consumer.
+
+A topic whose stage raises is not passed on to later stages.
+
+Usage:
+    executor = PipelinedExecutor([
+        Stage("collection", collect, workers=2),
+        Stage("preparation", prepare),
+        Stage("embedding", embed),
+    ])
+    results = executor.run(topics)
+"""
+
+import time
+import queue
+import threading
+import logging
+from collections import namedtuple
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# topics waiting in front of each stage
+QUEUE_SIZE = 2
+
+# fn(topic) -> result; workers = threads for this stage
+Stage = namedtuple("Stage", ["name", "fn", "workers"], defaults=[1])
+
+_DONE = object()
+
+
+class PipelinedExecutor:
+    """Streams topics through stages, each with its own workers and a bounded input queue."""
+
+    def __init__(self, stages: list, queue_size: int = QUEUE_SIZE, on_result=None):
+        """on_result(result) is called for every finished (stage, topic), one call at a time."""
+        self.stages = list(stages)
+        self.queue_size = queue_size
+        self.on_result = on_result
+        self.results = []
+        self._lock = threading.Lock()
+
+    def _record(self, result: dict):
+        with self._lock:
+            self.results.append(result)
+            if self.on_result:
+                # a failing callback must not kill the worker (its queue would never drain)
+                try:
+                    self.on_result(result)
+                except Exception as e:
+                    logger.warning(f"⚠️ Result callback failed for {result['stage']} {result['topic']}: {e}")
+
+    def _worker(self, stage: Stage, inbox: queue.Queue, outbox: queue.Queue):
+        while True:
+            item = inbox.get()
+            if item is _DONE:
+                return
+            topic, queued_at = item
+            start = time.perf_counter()
+            result = {"stage": stage.name, "topic": topic, "status": "ok", "result": None, "error": None,
+                      "queued_s": round(start - queued_at, 4)}
+            try:
+                result["result"] = stage.fn(topic)
+            except Exception as e:
+                result["status"] = "failed"
+                result["error"] = str(e)
+                logger.error(f"❌ {stage.name} failed for {topic}: {e}")
+            result["elapsed_s"] = round(time.perf_counter() - start, 4)
+            self._record(result)
+            if outbox is not None and result["status"] == "ok":
+                outbox.put((topic, time.perf_counter()))
+
+    def run(self, topics: list) -> list:
+        """Run every topic through the stages; returns one result dict per (stage, topic), in completion order."""
+        self.results = []
+        start = time.perf_counter()
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        workers = []
+        for i, stage in enumerate(self.stages):
+            outbox = queues[i + 1] if i + 1 < len(queues) else None
+            workers.append([
+                threading.Thread(target=self._worker, args=(stage, queues[i], outbox),
+                                 name=f"{stage.name}-{n}", daemon=True)
+                for n in range(max(1, stage.workers))
+            ])
+        for thread in (t for group in workers for t in group):
+            thread.start()
+
+        for topic in topics:
+            queues[0].put((topic, time.perf_counter()))
+        # a stage is finished once its queue is drained; only then can the next one be told to stop
+        for inbox, group in zip(queues, workers):
+            for _ in group:
+                inbox.put(_DONE)
+            for thread in group:
+                thread.join()
+
+        failed = sum(r["status"] == "failed" for r in self.results)
+        logger.info(f"🏁 Pipelined {len(topics)} topic(s) through {len(self.stages)} stage(s) in "
+                    f"{time.perf_counter() - start:.1f}s ({failed} failed step(s))")
+        return list(self.results)
@@ -0,0 +1,350 @@
+"""
+Module: benchmark_backend.py
+Purpose: Load-test the FastAPI backend against a synthetic multi-year drift history.
+
+Generates N topics x M days of summaries (plus rollups, embedding snapshots,
+projections and search indexes for the most recent days) under a scratch data
+root, then runs a weighted, concurrent request mix against every GET/POST
+route and reports throughput and p50/p95/p99 per route.
+
+Usage:
+    python -m scripts.benchmark_backend --topics 20 --days 1825 --requests 5000
+    python -m scripts.benchmark_backend --server uvicorn          # real HTTP on localhost
+    python -m scripts.benchmark_backend --url http://host:8000    # already-running server
+    python -m scripts.benchmark_backend --compare benchmarks/results/<older>.json
+
+Results are written to benchmarks/results/<timestamp>_<git rev>.json (git rev ends in -dirty
+when the tree has uncommitted changes; such results are not meant to be committed).
+The /events stream and the model-backed /drift_score route are not part of the mix.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import subprocess
+import tempfile
+import datetime as dt
+from pathlib import Path
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+
+from data_pipeline.utils.io_utils import ensure_dir, save_json
+
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+STATUSES = ["Stable", "Moderate Drift", "High Drift"]
+EMB_DIM = 384
+
+
+# ---------- Synthetic data ----------
+def topic_names(n: int):
+    return [f"Topic {i:03d}" for i in range(n)]
+
+
+def generate_history(root: Path, n_topics: int, n_days: int, end_date: str = "2025-11-15",
+                     snapshot_days: int = 2, snapshot_rows: int = 2000, seed: int = 0):
+    """Write summaries, rollups, drift_history and recent embedding snapshots under `root`."""
+    from monitoring.rollups import GRANULARITIES, rollup_path, build_overall_rollup, build_topic_rollup
+    from analytics.vector_index import save_rows, build_index
+    from analytics.projection import run_projections
+
+    rng = np.random.default_rng(seed)
+    topics = topic_names(n_topics)
+    end = dt.date.fromisoformat(end_date)
+    dates = [(end - dt.timedelta(days=i)).isoformat() for i in reversed(range(n_days))]
+
+    summary_dir = root / "drift_reports" / "summaries"
+    rollup_dir = root / "drift_reports" / "rollups"
+    processed = root / "data_pipeline" / "data" / "processed"
+    ensure_dir(summary_dir)
+
+    # random walk per topic so histories look like real drift series
+    level = rng.uniform(0.05, 0.2, size=n_topics)
+    summaries = []
+    for date in dates:
+        level = np.clip(level + rng.normal(0, 0.01, size=n_topics), 0.0, 0.6)
+        rows = []
+        for topic, score in zip(topics, level):
+            acc = float(np.clip(rng.normal(0.75, 0.08), 0, 1))
+            rows.append({
+                "topic": topic, "date": date,
+                "semantic_status": STATUSES[min(2, int(score / 0.2))],
+                "semantic_score": round(float(score), 4),
+                "cosine_drift": float(score * 0.7), "jsd_drift": float(score * 1.3),
+                "concept_status": STATUSES[rng.integers(0, 3)],
+                "test_acc": acc, "test_f1": acc, "accuracy_drop": round(1 - acc, 4),
+            })
+        summary = {"generated_at": date, "date": date, "rows": rows}
+        with open(summary_dir / f"drift_summary_{date}.json", "w") as f:
+            json.dump(summary, f)
+        summaries.append(summary)
+
+    # rollups built in one pass (update_rollups per day would rewrite every file M times)
+    for granularity in GRANULARITIES:
+        save_json(build_overall_rollup(summaries, granularity), rollup_path(granularity, rollup_dir=rollup_dir))
+        for topic in topics:
+            save_json(build_topic_rollup(summaries, topic, granularity), rollup_path(granularity, topic, rollup_dir))
+
+    history_dir = processed / "drift_history"
+    ensure_dir(history_dir)
+    for i, topic in enumerate(topics):
+        save_json([{"date": s["date"], "drift": s["rows"][i]["semantic_score"]} for s in summaries],
+                  str(history_dir / f"{topic.replace(' ', '_')}.json"))
+
+    emb_root = processed / "embeddings"
+    centers = rng.normal(size=(32, EMB_DIM)).astype(np.float32)
+    for date in dates[-snapshot_days:]:
+        date_dir = emb_root / date
+        ensure_dir(date_dir)
+        for topic in topics:
+            key = topic.replace(" ", "_")
+            emb = centers[rng.integers(0, 32, snapshot_rows)] + 0.5 * rng.normal(size=(snapshot_rows, EMB_DIM))
+            emb = (emb / np.linalg.norm(emb, axis=1, keepdims=True)).astype(np.float32)
+            np.save(date_dir / f"{key}.npy", emb)
+            save_rows([f"{topic} text {j}" for j in range(snapshot_rows)], str(date_dir), key)
+            build_index(emb, str(date_dir), key)
+
+    run_projections(str(emb_root), str(processed / "projections"), str(processed / "projection_basis"))
+    return {"topics": topics, "dates": dates}
+
+
+# ---------- Request mix ----------
+def request_mix(topics: list, dates: list, rng: random.Random):
+    """(weight, label, request factory) covering every benchmarked route."""
+    def topic():
+        return rng.choice(topics)
+
+    def date():
+        return rng.choice(dates)
+
+    def date_range(days):
+        start = rng.randrange(0, max(1, len(dates) - days))
+        return dates[start], dates[min(len(dates) - 1, start + days)]
+
+    def history_params():
+        g = rng.choice(["day", "day", "week", "month"])
+        start, end = date_range(365)
+        return {"granularity": g, "start": start, "end": end}
+
+    def vector():
+        v = np.random.default_rng(rng.randrange(1 << 30)).normal(size=EMB_DIM)
+        return (v / np.linalg.norm(v)).round(5).tolist()
+
+    return [
+        (10, "GET /dashboard", lambda: ("GET", "/dashboard", {}, None)),
+        (6, "GET /drift_summary", lambda: ("GET", "/drift_summary", {"date": date()}, None)),
+        (2, "GET /latest_summary", lambda: ("GET", "/latest_summary", {}, None)),
+        (4, "GET /alert_status", lambda: ("GET", "/alert_status", {}, None)),
+        (4, "GET /semantic_drift", lambda: ("GET", "/semantic_drift", {}, None)),
+        (4, "GET /concept_drift", lambda: ("GET", "/concept_drift", {}, None)),
+        (8, "GET /drift_history", lambda: ("GET", "/drift_history", history_params(), None)),
+        (8, "GET /topic/{topic_name}/history",
+         lambda: ("GET", f"/topic/{topic()}/history", history_params(), None)),
+        (2, "GET /embeddings/info", lambda: ("GET", "/embeddings/info", {}, None)),
+        (2, "GET /embeddings/{topic_name}", lambda: ("GET", f"/embeddings/{topic()}", {}, None)),
+        (2, "GET /embeddings/{topic_name}/history", lambda: ("GET", f"/embeddings/{topic()}/history", {}, None)),
+        (4, "GET /embeddings/{topic_name}/projection",
+         lambda: ("GET", f"/embeddings/{topic()}/projection", {"max_points": 2000}, None)),
+        (4, "POST /topic/{topic_name}/search",
+         lambda: ("POST", f"/topic/{topic()}/search", {}, {"vector": vector(), "k": 10})),
+        (1, "GET /metrics", lambda: ("GET", "/metrics", {}, None)),
+    ]
+
+
+async def run_load(client, mix, n_requests: int, concurrency: int, revalidate: float, seed: int = 0):
+    """Issue n_requests with `concurrency` workers; a fraction revalidates with If-None-Match."""
+    rng = random.Random(seed)
+    weights = [w for w, _, _ in mix]
+    plan = rng.choices(range(len(mix)), weights=weights, k=n_requests)
+    etags = {}
+    latencies = {label: [] for _, label, _ in mix}
+    statuses = {label: {} for _, label, _ in mix}
+    cursor = iter(plan)
+
+    async def worker():
+        for i in cursor:
+            _, label, make = mix[i]
+            method, path, params, body = make()
+            key = (path, tuple(sorted(params.items())))
+            headers = {"Accept-Encoding": "gzip"}
+            if method == "GET" and key in etags and rng.random() < revalidate:
+                headers["If-None-Match"] = etags[key]
+
+            start = time.perf_counter()
+            r = await client.request(method, path, params=params, json=body, headers=headers)
+            await r.aread()
+            latencies[label].append(time.perf_counter() - start)
+            statuses[label][r.status_code] = statuses[label].get(r.status_code, 0) + 1
+            if "etag" in r.headers:
+                etags[key] = r.headers["etag"]
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return latencies, statuses, time.perf_counter() - start
+
+
+def summarize(latencies, statuses, elapsed):
+    routes = {}
+    all_lat = []
+    for label, values in latencies.items():
+        if not values:
+            continue
+        ms = np.asarray(values) * 1000
+        all_lat.extend(values)
+        routes[label] = {
+            "requests": len(values),
+            "p50_ms": round(float(np.percentile(ms, 50)), 3),
+            "p95_ms": round(float(np.percentile(ms, 95)), 3),
+            "p99_ms": round(float(np.percentile(ms, 99)), 3),
+            "max_ms": round(float(ms.max()), 3),
+            "statuses": {str(k): v for k, v in sorted(statuses[label].items())},
+        }
+    ms = np.asarray(all_lat) * 1000
+    overall = {
+        "requests": len(all_lat),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(all_lat) / elapsed, 1) if elapsed else None,
+        "p50_ms": round(float(np.percentile(ms, 50)), 3),
+        "p95_ms": round(float(np.percentile(ms, 95)), 3),
+        "p99_ms": round(float(np.percentile(ms, 99)), 3),
+    }
+    return overall, routes
+
+
+def print_report(overall, routes, baseline=None):
+    base_routes = (baseline or {}).get("routes", {})
+    print(f"\n{'route':44} {'n':>6} {'p50':>9} {'p95':>9} {'p99':>9}  {'Δp95':>8}")
+    for label, r in sorted(routes.items()):
+        delta = ""
+        if label in base_routes:
+            delta = f"{(r['p95_ms'] / base_routes[label]['p95_ms'] - 1) * 100:+.0f}%" if base_routes[label]["p95_ms"] else ""
+        print(f"{label:44} {r['requests']:>6} {r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['p99_ms']:>9.2f}  {delta:>8}")
+    print(f"\n📊 {overall['requests']} requests in {overall['elapsed_s']}s → {overall['throughput_rps']} req/s "
+          f"(p50 {overall['p50_ms']} ms, p95 {overall['p95_ms']} ms, p99 {overall['p99_ms']} ms)")
+
+
+def git_revision():
+    """Short HEAD hash, with a "-dirty" suffix when the tree has uncommitted changes."""
+    try:
+        rev = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True).strip()
+        # untracked files (earlier result files, scratch data) don't change the measured code
+        status = subprocess.check_output(["git", "status", "--porcelain", "--untracked-files=no"],
+                                         cwd=ROOT, text=True)
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{rev}-dirty" if status.strip() else rev
+
+
+def save_results(result: dict, results_dir: Path = RESULTS_DIR, prefix: str = ""):
+    ensure_dir(results_dir)
+    stamp = dt.datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+    path = results_dir / f"{prefix}{stamp}_{result['git_rev']}.json"
+    save_json(result, str(path))
+    return path
+
+
+# ---------- Targets ----------
+def _wait_for_server(url: str, timeout: float = 30):
+    import httpx
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(url + "/").status_code == 200:
+                return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not come up within {timeout}s")
+
+
+async def benchmark(args, topics, dates):
+    import httpx
+
+    mix = request_mix(topics, dates, random.Random(args.seed))
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=60)
+    else:
+        from backend.app import app   # imported after INTENTDRIFTWATCH_DATA_ROOT is set
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60)
+
+    async with client:
+        if args.warmup:
+            await run_load(client, mix, args.warmup, args.concurrency, args.revalidate, seed=args.seed + 1)
+        return await run_load(client, mix, args.requests, args.concurrency, args.revalidate, seed=args.seed)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="IntentDriftWatch backend load test")
+    parser.add_argument("--topics", type=int, default=20)
+    parser.add_argument("--days", type=int, default=3 * 365)
+    parser.add_argument("--snapshot-rows", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--revalidate", type=float, default=0.3,
+                        help="fraction of repeat GETs sent with If-None-Match")
+    parser.add_argument("--data-root", help="reuse/generate synthetic data here (default: temp dir)")
+    parser.add_argument("--server", choices=["inprocess", "uvicorn"], default="inprocess")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--url", help="benchmark an already-running server (its data root must match)")
+    parser.add_argument("--compare", help="earlier results JSON to diff p95 against")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args(argv)
+
+    data_root = Path(args.data_root or tempfile.mkdtemp(prefix="idw-bench-"))
+    marker = data_root / "benchmark_data.json"
+    if marker.exists():
+        meta = json.loads(marker.read_text())
+        print(f"♻️  Reusing synthetic data in {data_root}")
+    else:
+        print(f"🧪 Generating {args.topics} topics × {args.days} days under {data_root}...")
+        t0 = time.perf_counter()
+        meta = generate_history(data_root, args.topics, args.days, snapshot_rows=args.snapshot_rows, seed=args.seed)
+        meta["config"] = {"topics": args.topics, "days": args.days, "snapshot_rows": args.snapshot_rows}
+        save_json(meta, str(marker))
+        print(f"   done in {time.perf_counter() - t0:.1f}s")
+
+    os.environ["INTENTDRIFTWATCH_DATA_ROOT"] = str(data_root)
+
+    server = None
+    if args.server == "uvicorn" and not args.url:
+        args.url = f"http://127.0.0.1:{args.port}"
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "backend.app:app", "--port", str(args.port), "--log-level", "warning"],
+            cwd=ROOT, env=os.environ.copy(),
+        )
+        _wait_for_server(args.url)
+
+    try:
+        latencies, statuses, elapsed = asyncio.run(benchmark(args, meta["topics"], meta["dates"]))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    overall, routes = summarize(latencies, statuses, elapsed)
+    baseline = json.loads(Path(args.compare).read_text()) if args.compare else None
+    print_report(overall, routes, baseline)
+
+    result = {
+        "timestamp": str(dt.datetime.utcnow()),
+        "git_rev": git_revision(),
+        "target": args.url or "inprocess",
+        "data": meta.get("config", {}),
+        "load": {"requests": args.requests, "concurrency": args.concurrency, "revalidate": args.revalidate},
+        "overall": overall,
+        "routes": routes,
+    }
+    if not args.no_save:
+        print(f"💾 Results saved → {save_results(result)}")
+    return result
+
+
+if __name__ == "__main__":
+    main()
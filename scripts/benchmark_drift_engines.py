@@ -0,0 +1,209 @@
+"""
+Module: benchmark_drift_engines.py
+Purpose: Time the drift engines on synthetic scenarios and check their verdicts against ground truth.
+
+Generates snapshots with scripts/synthetic_drift.py in a scratch root, runs
+`run_semantic_drift` and `run_concept_drift` there unchanged (they write
+cwd-relative reports, so the run happens inside the scratch root), then scores:
+
+- detection rate per drift scenario  (status != "Stable" on the drifted pair)
+- false-positive rate on controls    (scenario "none", and every earlier pair)
+- wall time and rows/s per engine
+
+Usage:
+    python -m scripts.benchmark_drift_engines --topics 40 --rows 2000
+    python -m scripts.benchmark_drift_engines --topics 2000 --rows 1000 --engines semantic
+    python -m scripts.benchmark_drift_engines --scenarios none mean_shift --magnitude mean_shift=0.3
+
+Results are written to benchmarks/results/drift_engines_<timestamp>_<git rev>.json.
+Exit code is 1 if any check fails (--no-check to only report).
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tempfile
+from glob import glob
+from pathlib import Path
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+
+from scripts.synthetic_drift import generate_scenarios, SCENARIOS, DEFAULT_MAGNITUDE
+from scripts.benchmark_backend import git_revision, save_results
+
+ENGINES = {
+    "semantic": ("analytics.semantic_drift", "run_semantic_drift", "drift_reports/semantic"),
+    "concept": ("models.concept_drift_xgb", "run_concept_drift", "drift_reports/concept"),
+}
+
+MIN_DETECTION_RATE = 0.9
+MAX_FALSE_POSITIVE_RATE = 0.1
+
+
+def load_engine(name: str):
+    """Return the engine's runner, or None if its dependencies aren't installed."""
+    module_name, fn_name, _ = ENGINES[name]
+    try:
+        module = __import__(module_name, fromlist=[fn_name])
+    except ImportError as e:
+        print(f"⚠️ {name} engine unavailable: {e}")
+        return None
+    # the engines log every topic; keep the benchmark output readable
+    for logger_name in (module_name, "data_pipeline.utils.io_utils"):
+        logging.getLogger(logger_name).setLevel(logging.ERROR)
+    return getattr(module, fn_name)
+
+
+def run_engine(name: str, runner, emb_dir: str):
+    """Run one engine inside the current (scratch) working directory and collect its reports."""
+    report_dir = ENGINES[name][2]
+    start_wall, start_cpu = time.perf_counter(), time.process_time()
+    runner(emb_dir)
+    wall, cpu = time.perf_counter() - start_wall, time.process_time() - start_cpu
+
+    reports = []
+    for path in glob(os.path.join(report_dir, "*.json")):
+        with open(path) as f:
+            reports.append(json.load(f))
+    return reports, wall, cpu
+
+
+def score_reports(reports: list, manifest: dict):
+    """Compare engine verdicts with the scenario ground truth."""
+    last_date = manifest["dates"][-1]
+    by_scenario = {}
+    controls = []
+    for r in reports:
+        key = r["topic"].replace(" ", "_")
+        spec = manifest["topics"].get(key)
+        if spec is None:
+            continue
+        flagged = r.get("status") != "Stable"
+        score = r.get("drift_score", r.get("test_acc"))
+        if r["new_date"] == last_date and spec["expected_drift"]:
+            by_scenario.setdefault(spec["scenario"], []).append((flagged, score))
+        else:
+            controls.append((flagged, score))
+
+    scenarios = {
+        name: {
+            "pairs": len(v),
+            "detection_rate": round(sum(f for f, _ in v) / len(v), 4),
+            "mean_score": round(float(np.mean([s for _, s in v])), 4),
+        }
+        for name, v in sorted(by_scenario.items())
+    }
+    control = {
+        "pairs": len(controls),
+        "false_positive_rate": round(sum(f for f, _ in controls) / len(controls), 4) if controls else None,
+        "mean_score": round(float(np.mean([s for _, s in controls])), 4) if controls else None,
+    }
+    return scenarios, control
+
+
+def check(scenarios: dict, control: dict):
+    failures = []
+    for name, s in scenarios.items():
+        if s["detection_rate"] < MIN_DETECTION_RATE:
+            failures.append(f"{name}: detection rate {s['detection_rate']:.0%} < {MIN_DETECTION_RATE:.0%}")
+    if control["false_positive_rate"] is not None and control["false_positive_rate"] > MAX_FALSE_POSITIVE_RATE:
+        failures.append(f"controls: false-positive rate {control['false_positive_rate']:.0%} "
+                        f"> {MAX_FALSE_POSITIVE_RATE:.0%}")
+    return failures
+
+
+def parse_magnitudes(items):
+    out = {}
+    for item in items or []:
+        name, value = item.split("=")
+        out[name] = float(value)
+    return out
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="IntentDriftWatch drift engine benchmark")
+    parser.add_argument("--topics", type=int, default=40)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--dates", type=int, default=2)
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=SCENARIOS)
+    parser.add_argument("--magnitude", nargs="*", help="override scenario strength, e.g. mean_shift=0.3")
+    parser.add_argument("--engines", nargs="+", default=list(ENGINES), choices=list(ENGINES))
+    parser.add_argument("--data-root", help="scratch root (default: temp dir)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-check", action="store_true")
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args(argv)
+
+    root = Path(args.data_root or tempfile.mkdtemp(prefix="idw-drift-bench-")).resolve()
+    emb_dir = str(root / "data_pipeline" / "data" / "processed" / "embeddings")
+
+    print(f"🧪 Generating {args.topics} topics × {args.dates} dates × {args.rows} rows under {root}...")
+    t0 = time.perf_counter()
+    generate_scenarios(emb_dir, args.topics, args.rows, args.dim, args.dates,
+                       scenarios=tuple(args.scenarios), magnitudes=parse_magnitudes(args.magnitude), seed=args.seed)
+    generation_s = time.perf_counter() - t0
+    with open(os.path.join(emb_dir, "scenarios.json")) as f:
+        manifest = json.load(f)
+    total_rows = args.topics * args.rows * args.dates
+    print(f"   {total_rows:,} rows in {generation_s:.1f}s")
+
+    results = {}
+    failures = []
+    cwd = os.getcwd()
+    os.chdir(root)
+    try:
+        for name in args.engines:
+            runner = load_engine(name)
+            if runner is None:
+                results[name] = {"available": False}
+                continue
+            print(f"⏱️  Running {name} drift engine...")
+            reports, wall, cpu = run_engine(name, runner, emb_dir)
+            scenarios, control = score_reports(reports, manifest)
+            results[name] = {
+                "available": True,
+                "wall_s": round(wall, 3),
+                "cpu_s": round(cpu, 3),
+                "rows_per_s": round(total_rows / wall, 1) if wall else None,
+                "reports": len(reports),
+                "scenarios": scenarios,
+                "controls": control,
+            }
+            engine_failures = check(scenarios, control)
+            failures.extend(f"{name} {msg}" for msg in engine_failures)
+
+            print(f"   {len(reports)} reports in {wall:.2f}s ({results[name]['rows_per_s']:,} rows/s)")
+            for s_name, s in scenarios.items():
+                print(f"   {s_name:12} detected {s['detection_rate']:.0%}  mean score {s['mean_score']}")
+            print(f"   {'controls':12} flagged  {control['false_positive_rate'] or 0:.0%}  mean score {control['mean_score']}")
+    finally:
+        os.chdir(cwd)
+
+    result = {
+        "git_rev": git_revision(),
+        "data": {"topics": args.topics, "rows": args.rows, "dim": args.dim, "dates": args.dates,
+                 "scenarios": args.scenarios, "magnitudes": {**DEFAULT_MAGNITUDE, **parse_magnitudes(args.magnitude)},
+                 "generation_s": round(generation_s, 3)},
+        "engines": results,
+        "failures": failures,
+    }
+    if not args.no_save:
+        print(f"💾 Results saved → {save_results(result, prefix='drift_engines_')}")
+
+    if failures:
+        print("❌ " + "\n❌ ".join(failures))
+        if not args.no_check:
+            sys.exit(1)
+    else:
+        print("✅ All drift checks passed")
+    return result
+
+
+if __name__ == "__main__":
+    main()
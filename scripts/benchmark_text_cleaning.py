@@ -0,0 +1,115 @@
+"""
+Module: benchmark_text_cleaning.py
+Purpose: Compare the batch text cleaner with the previous per-string regex cleaner.
+
+Builds a synthetic corpus of scraped-looking texts (URLs, punctuation, mixed
+case, emoji, accented words, irregular whitespace), then times:
+
+- legacy:   the previous clean_text (three uncompiled re.sub passes per string)
+- batch:    clean_batch in one process
+- parallel: clean_batch across worker processes
+- skip:     re-cleaning a file already marked with CLEANING_VERSION (no work)
+
+and checks that the outputs match the legacy cleaner and are idempotent.
+
+Usage:
+    python -m scripts.benchmark_text_cleaning --texts 1000000
+    python -m scripts.benchmark_text_cleaning --texts 200000 --processes 4 --no-save
+
+Results are written to benchmarks/results/text_cleaning_<timestamp>_<git rev>.json.
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT))
+
+from data_pipeline.utils.text_cleaning import clean_batch, clean_text
+from scripts.benchmark_backend import git_revision, save_results
+
+WORDS = ["election", "Rover", "NASA's", "climate", "EV", "battery", "bitcoin", "AI", "model", "launch",
+         "vote", "turnout", "Mars", "carbon", "charging", "crypto", "policy", "orbit", "résumé", "naïve"]
+NOISE = ["!!", "...", ",", "—", "#breaking", "@user", "(update)", "🚀", "🔥", "$BTC", "50%", "\t", "  ", "\n"]
+POOL_SIZE = 50_000
+
+
+def legacy_clean_text(text: str) -> str:
+    """The cleaner as it was before batch cleaning, kept here as the baseline."""
+    if not isinstance(text, str):
+        return ""
+    text = re.sub(r"http\S+", "", text)
+    text = re.sub(r"[^A-Za-z0-9\s]", "", text)
+    text = re.sub(r"\s+", " ", text).strip().lower()
+    return text
+
+
+def synthetic_corpus(n: int, seed: int = 0):
+    """n texts drawn from a pool of distinct synthetic posts (20-60 tokens each)."""
+    rng = random.Random(seed)
+    pool = []
+    for i in range(min(n, POOL_SIZE)):
+        tokens = rng.choices(WORDS, k=rng.randint(20, 60))
+        for _ in range(rng.randint(2, 8)):
+            tokens.insert(rng.randrange(len(tokens)), rng.choice(NOISE))
+        if rng.random() < 0.3:
+            tokens.insert(rng.randrange(len(tokens)), f"https://news.example.com/{i}?ref=rss")
+        pool.append(" ".join(tokens))
+    return [pool[rng.randrange(len(pool))] for _ in range(n)]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    out = fn()
+    return out, round(time.perf_counter() - start, 3)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="IntentDriftWatch text cleaning benchmark")
+    parser.add_argument("--texts", type=int, default=1_000_000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args(argv)
+
+    print(f"🧪 Building {args.texts:,} synthetic texts...")
+    corpus = synthetic_corpus(args.texts, args.seed)
+
+    legacy, legacy_s = timed(lambda: [legacy_clean_text(t) for t in corpus])
+    batch, batch_s = timed(lambda: clean_batch(corpus, processes=1))
+    parallel, parallel_s = timed(lambda: clean_batch(corpus, processes=args.processes, min_parallel=0))
+    # what clean_combined_topic does for a file already marked with CLEANING_VERSION
+    _, skip_s = timed(lambda: [t for t in batch if t and isinstance(t, str)])
+
+    sample = batch[:10_000]
+    result = {
+        "git_rev": git_revision(),
+        "texts": args.texts,
+        "processes": args.processes,
+        "cpu_count": os.cpu_count(),
+        "seconds": {"legacy": legacy_s, "batch": batch_s, "parallel": parallel_s, "skip": skip_s},
+        "texts_per_s": {name: round(args.texts / s) if s else None
+                        for name, s in (("legacy", legacy_s), ("batch", batch_s), ("parallel", parallel_s))},
+        "speedup_vs_legacy": {"batch": round(legacy_s / batch_s, 2), "parallel": round(legacy_s / parallel_s, 2)},
+        "matches_legacy": round(sum(a == b for a, b in zip(legacy, batch)) / len(corpus), 6),
+        "parallel_matches_batch": parallel == batch,
+        "idempotent": all(clean_text(t) == t for t in sample),
+    }
+
+    print(f"   legacy   {legacy_s:>8}s  ({result['texts_per_s']['legacy']:,} texts/s)")
+    print(f"   batch    {batch_s:>8}s  ({result['speedup_vs_legacy']['batch']}x)")
+    print(f"   parallel {parallel_s:>8}s  ({result['speedup_vs_legacy']['parallel']}x, {args.processes} processes)")
+    print(f"   skip     {skip_s:>8}s  (already-clean file)")
+    print(f"   outputs matching legacy: {result['matches_legacy']:.2%}, idempotent: {result['idempotent']}")
+    if not args.no_save:
+        print(f"💾 Results saved → {save_results(result, prefix='text_cleaning_')}")
+    return result
+
+
+if __name__ == "__main__":
+    main()
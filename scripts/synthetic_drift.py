@@ -0,0 +1,123 @@
+"""
+Module: synthetic_drift.py
+Purpose: Write embedding snapshots with controlled, known drift in the pipeline's on-disk layout.
+
+Each topic is a mixture of Gaussian clusters on the unit sphere around a shared
+"topic direction" (so, like real sentence embeddings, rows have a common mean
+component). Every date before the last one is a fresh sample of the same
+mixture; the last date applies the topic's scenario:
+
+- none         same mixture, new sample (control: should stay Stable)
+- mean_shift   every cluster centre pulled toward one random direction
+- reweight     mixture weight concentrated on a few clusters
+- new_cluster  a fraction of rows drawn from a centre the topic never had
+
+Layout: <emb_dir>/<date>/<Topic>.npy, plus <emb_dir>/scenarios.json with the
+ground truth. Rows are written in chunks through np.lib.format.open_memmap, so
+snapshot size is bounded by disk, not memory.
+"""
+
+import os
+import datetime as dt
+import numpy as np
+from data_pipeline.utils.io_utils import ensure_dir, save_json
+
+SCENARIOS = ("none", "mean_shift", "reweight", "new_cluster")
+
+# Default strength per scenario: shift length, share of weight moved, new-cluster fraction
+DEFAULT_MAGNITUDE = {"none": 0.0, "mean_shift": 0.6, "reweight": 0.9, "new_cluster": 0.3}
+
+N_CLUSTERS = 8
+CLUSTER_SIGMA = 0.06
+TOPIC_MEAN_WEIGHT = 0.35
+CHUNK_ROWS = 100000
+
+
+def topic_key(i: int) -> str:
+    return f"Synthetic_{i:05d}"
+
+
+def _unit(x):
+    return x / np.linalg.norm(x, axis=-1, keepdims=True)
+
+
+def topic_mixture(rng, dim: int, n_clusters: int = N_CLUSTERS):
+    """Return (centres[k, dim], weights[k]) of one topic's baseline mixture."""
+    direction = _unit(rng.normal(size=dim))
+    centres = _unit(TOPIC_MEAN_WEIGHT * direction + rng.normal(size=(n_clusters, dim)) / np.sqrt(dim))
+    return centres.astype(np.float32), np.full(n_clusters, 1.0 / n_clusters)
+
+
+def apply_scenario(rng, centres, weights, scenario: str, magnitude: float):
+    """Drifted (centres, weights, new_centre, new_fraction) for the last snapshot."""
+    if scenario == "none":
+        return centres, weights, None, 0.0
+    if scenario == "mean_shift":
+        shift = magnitude * _unit(rng.normal(size=centres.shape[1]))
+        return _unit(centres + shift).astype(np.float32), weights, None, 0.0
+    if scenario == "reweight":
+        keep = max(1, len(weights) // 4)
+        favoured = rng.choice(len(weights), size=keep, replace=False)
+        new_weights = weights * (1 - magnitude)
+        new_weights[favoured] += magnitude / keep
+        return centres, new_weights / new_weights.sum(), None, 0.0
+    if scenario == "new_cluster":
+        return centres, weights, _unit(rng.normal(size=centres.shape[1])).astype(np.float32), magnitude
+    raise ValueError(f"Unknown scenario: {scenario}")
+
+
+def write_snapshot(path: str, rng, n_rows: int, centres, weights, new_centre=None, new_fraction=0.0,
+                   sigma: float = CLUSTER_SIGMA, chunk_rows: int = CHUNK_ROWS):
+    """Sample n_rows unit-norm float32 rows from the mixture straight into a .npy memmap."""
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32, shape=(n_rows, centres.shape[1]))
+    for start in range(0, n_rows, chunk_rows):
+        n = min(chunk_rows, n_rows - start)
+        block = centres[rng.choice(len(centres), size=n, p=weights)]
+        if new_centre is not None:
+            block[rng.random(n) < new_fraction] = new_centre
+        block = block + sigma * rng.standard_normal((n, centres.shape[1]), dtype=np.float32)
+        out[start:start + n] = _unit(block)
+    out.flush()
+    del out
+    return path
+
+
+def scenario_plan(n_topics: int, scenarios=SCENARIOS, magnitudes=None):
+    """Round-robin scenarios over topics: {topic_key: {"scenario", "magnitude", "expected_drift"}}."""
+    magnitudes = {**DEFAULT_MAGNITUDE, **(magnitudes or {})}
+    plan = {}
+    for i in range(n_topics):
+        scenario = scenarios[i % len(scenarios)]
+        plan[topic_key(i)] = {
+            "scenario": scenario,
+            "magnitude": magnitudes[scenario],
+            "expected_drift": scenario != "none",
+        }
+    return plan
+
+
+def generate_scenarios(emb_dir: str, n_topics: int = 40, n_rows: int = 2000, dim: int = 384,
+                       n_dates: int = 2, start_date: str = "2025-01-01", scenarios=SCENARIOS,
+                       magnitudes=None, seed: int = 0):
+    """Write n_dates snapshots per topic; drift (if any) appears in the last date. Returns the plan."""
+    plan = scenario_plan(n_topics, scenarios, magnitudes)
+    start = dt.date.fromisoformat(start_date)
+    dates = [(start + dt.timedelta(days=i)).isoformat() for i in range(n_dates)]
+    for date in dates:
+        ensure_dir(os.path.join(emb_dir, date))
+
+    for i, (key, spec) in enumerate(plan.items()):
+        rng = np.random.default_rng([seed, i])
+        centres, weights = topic_mixture(rng, dim)
+        for j, date in enumerate(dates):
+            path = os.path.join(emb_dir, date, f"{key}.npy")
+            sample_rng = np.random.default_rng([seed, i, j + 1])
+            if j < n_dates - 1:
+                write_snapshot(path, sample_rng, n_rows, centres, weights)
+            else:
+                drifted = apply_scenario(rng, centres, weights, spec["scenario"], spec["magnitude"])
+                write_snapshot(path, sample_rng, n_rows, *drifted)
+
+    save_json({"dates": dates, "rows": n_rows, "dim": dim, "seed": seed, "topics": plan},
+              os.path.join(emb_dir, "scenarios.json"))
+    return plan
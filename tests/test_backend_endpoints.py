@@ -17,3 +17,32 @@ def test_latest_summary():
     data = r.json()
     assert isinstance(data, dict)
     assert "rows" in data or "date" in data or "generated_at" in data
+
+
+def test_dashboard_bundle_matches_routes():
+    r = client.get("/dashboard")
+    assert r.status_code == 200
+    data = r.json()
+    assert data["drift_summary"] == client.get("/drift_summary").json()
+    assert data["alert_status"] == client.get("/alert_status").json()
+    assert data["drift_history"] == client.get("/drift_history").json()
+    assert data["embeddings_info"] == client.get("/embeddings/info").json()
+
+
+def test_dashboard_field_selection():
+    r = client.get("/dashboard", params={"fields": "semantic_drift,concept_drift"})
+    assert r.status_code == 200
+    assert set(r.json()) == {"semantic_drift", "concept_drift"}
+
+    assert client.get("/dashboard", params={"fields": "nope"}).status_code == 400
+
+
+def test_history_granularity_and_bounds():
+    r = client.get("/drift_history", params={"granularity": "month", "limit": 1})
+    assert r.status_code == 200
+    data = r.json()
+    assert data["granularity"] == "month"
+    assert len(data["history"]) <= 1
+
+    assert client.get("/drift_history", params={"granularity": "year"}).status_code == 422
+    assert client.get("/topic/Elections/history", params={"start": "11/2025"}).status_code == 400
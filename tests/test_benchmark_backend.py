@@ -0,0 +1,37 @@
+import json
+from scripts.benchmark_backend import generate_history, summarize
+
+
+def test_generate_history_writes_summaries_rollups_and_snapshots(tmp_path):
+    meta = generate_history(tmp_path, n_topics=3, n_days=15, snapshot_days=1, snapshot_rows=40)
+
+    summaries = sorted((tmp_path / "drift_reports" / "summaries").glob("drift_summary_*.json"))
+    assert len(summaries) == 15
+    assert json.loads(summaries[-1].read_text())["date"] == meta["dates"][-1]
+
+    rollup = json.loads((tmp_path / "drift_reports" / "rollups" / "overall_week.json").read_text())
+    assert rollup["dates"] == meta["dates"]
+
+    latest = tmp_path / "data_pipeline" / "data" / "processed" / "embeddings" / meta["dates"][-1]
+    assert (latest / "Topic_000.npy").exists()
+    assert (latest / "Topic_000_rows.json").exists()
+    assert (latest / "index" / "Topic_000_ivf.npz").exists()
+    assert (tmp_path / "data_pipeline" / "data" / "processed" / "projections" / meta["dates"][-1] / "Topic_000.npy").exists()
+
+
+def test_summarize_reports_percentiles():
+    overall, routes = summarize({"GET /a": [0.001] * 99 + [0.1], "GET /b": []}, {"GET /a": {200: 100}, "GET /b": {}}, 1.0)
+    assert overall["requests"] == 100
+    assert overall["throughput_rps"] == 100.0
+    assert routes["GET /a"]["p50_ms"] == 1.0
+    assert routes["GET /a"]["statuses"] == {"200": 100}
+    assert "GET /b" not in routes
+
+
+def test_git_revision_marks_dirty_trees(monkeypatch):
+    from scripts import benchmark_backend
+    outputs = {"rev-parse": "abc1234\n", "status": ""}
+    monkeypatch.setattr(benchmark_backend.subprocess, "check_output", lambda cmd, **kw: outputs[cmd[1]])
+    assert benchmark_backend.git_revision() == "abc1234"
+    outputs["status"] = " M backend/app.py\n"
+    assert benchmark_backend.git_revision() == "abc1234-dirty"
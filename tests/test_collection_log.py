@@ -0,0 +1,80 @@
+import json
+import multiprocessing
+from data_pipeline.utils import log_data_collection as log
+
+
+def _log_many(cwd, worker, n):
+    import os
+    os.chdir(cwd)
+    for i in range(n):
+        log.log_collection_event(f"Topic{worker % 2}", "rss", f"data/{worker}_{i}.json")
+
+
+def test_concurrent_processes_append_every_event(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ctx = multiprocessing.get_context("fork")
+    procs = [ctx.Process(target=_log_many, args=(str(tmp_path), w, 40)) for w in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+
+    events = list(log.read_events())
+    assert len(events) == 160
+    assert len(list(log.read_events(topic="Topic1"))) == 80
+    assert log.last_collection("Topic0", "rss")["path"].endswith("_39.json")
+
+
+def test_index_tracks_last_success_separately(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    log.log_collection_event("Elections", "reddit", "data/raw/reddit/Elections_2025-01-01.json")
+    log.log_collection_event("Elections", "reddit", "failed: 503 Service Unavailable")
+
+    assert log.last_collection("Elections", "reddit")["path"].endswith("2025-01-01.json")
+    assert log.last_collection("Elections", "reddit", successful=False)["path"].startswith("failed")
+    assert log.last_collection("Elections", "rss") is None
+
+
+def test_rotation_keeps_backups_and_history(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(log, "MAX_LOG_BYTES", 500)
+    monkeypatch.setattr(log, "BACKUP_COUNT", 2)
+    for i in range(30):
+        log.log_collection_event("Elections", "rss", f"data/{i}.json")
+
+    assert (tmp_path / "logging/logs/data_collection_log.jsonl.2").exists()
+    assert not (tmp_path / "logging/logs/data_collection_log.jsonl.3").exists()
+    paths = [e["path"] for e in log.read_events()]
+    assert paths == sorted(paths, key=lambda p: int(p.split("/")[1].split(".")[0]))
+    assert paths[-1] == "data/29.json"
+    assert log.last_collection("Elections", "rss")["path"] == "data/29.json"
+
+
+def test_legacy_json_log_is_migrated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    legacy = tmp_path / "logging/logs/data_collection_log.json"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text(json.dumps([{"topic": "Elections", "source": "wikipedia", "path": "old.json",
+                                   "timestamp": "2025-01-01 00:00:00"}]))
+    log.log_collection_event("Elections", "rss", "new.json")
+
+    assert [e["path"] for e in log.read_events()] == ["old.json", "new.json"]
+    assert log.last_collection("Elections", "wikipedia")["path"] == "old.json"
+    assert not legacy.exists()
+
+
+def test_large_legacy_log_writes_the_index_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    legacy = tmp_path / "logging/logs/data_collection_log.json"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text(json.dumps([{"topic": f"Topic{i % 3}", "source": "rss", "path": f"{i}.json",
+                                   "timestamp": "2025-01-01 00:00:00"} for i in range(500)]))
+    writes = []
+    atomic_write = log.atomic_write
+    monkeypatch.setattr(log, "atomic_write", lambda path, *a, **kw: writes.append(path) or atomic_write(path, *a, **kw))
+
+    log.log_collection_event("Topic0", "wikipedia", "new.json")
+    # one write for the migrated log, one for the new event
+    assert writes == [log.INDEX_PATH, log.INDEX_PATH]
+    assert log.last_collection("Topic2", "rss")["path"] == "497.json"
+    assert sum(1 for _ in log.read_events()) == 501
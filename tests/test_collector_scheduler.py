@@ -0,0 +1,130 @@
+import json
+import time
+import threading
+import urllib.request
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import pytest
+from data_pipeline.data_collectors.scheduler import CollectorScheduler, CollectionJob, TokenBucket
+
+
+class StubAPI:
+    """Local HTTP stand-in for a source API: tracks concurrency, can fail the first N calls."""
+
+    def __init__(self, delay=0.0, fail_first=0):
+        self.delay, self.fail_first = delay, fail_first
+        self.calls, self.in_flight, self.max_in_flight = 0, 0, 0
+        self.lock = threading.Lock()
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with api.lock:
+                    api.calls += 1
+                    call = api.calls
+                    api.in_flight += 1
+                    api.max_in_flight = max(api.max_in_flight, api.in_flight)
+                time.sleep(api.delay)
+                with api.lock:
+                    api.in_flight -= 1
+                self.send_response(503 if call <= api.fail_first else 200)
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def fetch(self, topic):
+        with urllib.request.urlopen(f"{self.url}/{topic.replace(' ', '_')}") as resp:
+            return resp.read().decode()
+
+
+@pytest.fixture
+def stub_apis():
+    apis = []
+    yield lambda **kw: apis.append(StubAPI(**kw)) or apis[-1]
+    for api in apis:
+        api.server.shutdown()
+
+
+def test_token_bucket_spaces_requests_after_burst():
+    bucket = TokenBucket(rate=2.0, burst=1, clock=lambda: 0.0, sleep=lambda s: None)
+    assert [bucket.acquire() for _ in range(3)] == [0.0, 0.5, 1.0]
+
+
+def test_sources_run_in_parallel_under_their_own_caps(stub_apis):
+    slow, fast = stub_apis(delay=0.2), stub_apis(delay=0.0)
+    limits = {"slow": {"rate": 100, "burst": 100, "concurrency": 2},
+              "fast": {"rate": 100, "burst": 100, "concurrency": 4}}
+    jobs = [CollectionJob("slow", f"t{i}", slow.fetch) for i in range(6)]
+    jobs += [CollectionJob("fast", f"t{i}", fast.fetch) for i in range(6)]
+
+    start = time.perf_counter()
+    results = CollectorScheduler(limits).run(jobs)
+    elapsed = time.perf_counter() - start
+
+    assert all(r["status"] == "ok" for r in results)
+    assert [r["topic"] for r in results[:6]] == [f"t{i}" for i in range(6)]
+    assert slow.max_in_flight == 2
+    # 6 slow jobs two at a time ≈ 0.6s; the fast source must not add to that
+    assert elapsed < 1.0
+
+
+def test_rate_limit_applies_per_source(stub_apis):
+    api = stub_apis()
+    limits = {"limited": {"rate": 10, "burst": 1, "concurrency": 4}}
+    start = time.perf_counter()
+    CollectorScheduler(limits).run([CollectionJob("limited", f"t{i}", api.fetch) for i in range(4)])
+    assert time.perf_counter() - start >= 0.28
+
+
+def test_failures_are_retried_with_backoff(stub_apis, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    api = stub_apis(fail_first=2)
+    limits = {"flaky": {"rate": 100, "burst": 100, "concurrency": 1}}
+    scheduler = CollectorScheduler(limits, max_attempts=3, backoff_s=0.01)
+    [result] = scheduler.run([CollectionJob("flaky", "Elections", api.fetch)])
+    assert result["status"] == "ok" and result["attempts"] == 3 and result["path"] == "ok"
+
+    api.fail_first = 10
+    [result] = scheduler.run([CollectionJob("flaky", "Elections", api.fetch)])
+    assert result["status"] == "failed" and "503" in result["error"]
+
+
+def test_final_failure_is_logged_once(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+
+    def fetch(topic):
+        calls.append(topic)
+        raise RuntimeError("rate limited")
+
+    scheduler = CollectorScheduler({"flaky": {"rate": 100, "burst": 100, "concurrency": 1}},
+                                   max_attempts=3, backoff_s=0.01)
+    [result] = scheduler.run([CollectionJob("flaky", "Elections", fetch)])
+    assert result["status"] == "failed" and len(calls) == 3
+
+    with open(tmp_path / "logging/logs/data_collection_log.jsonl") as f:
+        events = [json.loads(line) for line in f]
+    assert [(e["topic"], e["source"]) for e in events] == [("Elections", "flaky")]
+    assert events[0]["path"] == "failed after 3 attempts: rate limited"
+
+
+def test_paged_jobs_take_a_token_per_page():
+    waits = []
+
+    def fetch(topic, acquire):
+        for _ in range(3):
+            acquire()
+        return "ok"
+
+    scheduler = CollectorScheduler({"paged": {"rate": 1.0, "burst": 1, "concurrency": 1}})
+    scheduler._bucket("paged")
+    scheduler.buckets["paged"] = TokenBucket(1.0, 1, clock=lambda: 0.0, sleep=waits.append)
+    [result] = scheduler.run([CollectionJob("paged", "Elections", fetch, paged=True)])
+    assert result["status"] == "ok"
+    # burst of 1: the first request uses it, the three further pages each wait for a new token
+    assert waits == [1.0, 2.0, 3.0] and result["waited_s"] == 6.0
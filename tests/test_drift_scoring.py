@@ -0,0 +1,106 @@
+import asyncio
+import numpy as np
+from fastapi.testclient import TestClient
+from api.utils.micro_batcher import MicroBatcher
+from backend.app import app
+from backend.utils import drift_scoring
+
+
+def _fake_encode(calls):
+    def encode(texts):
+        calls.append(len(texts))
+        return np.array([[float(len(t)), 1.0, 0.5] for t in texts], dtype=np.float32)
+    return encode
+
+
+def test_micro_batcher_merges_concurrent_requests():
+    calls = []
+    batcher = MicroBatcher(_fake_encode(calls), max_batch_size=100, max_wait_ms=50)
+
+    async def run():
+        return await asyncio.gather(*[batcher.encode(["a" * i, "b"]) for i in range(1, 6)])
+
+    results = asyncio.run(run())
+    assert sum(calls) == 10
+    assert len(calls) < 5
+    assert [r[0, 0] for r in results] == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+def test_drift_score_endpoint_uses_cached_baseline(tmp_path, monkeypatch):
+    (tmp_path / "2025-01-01").mkdir()
+    np.save(tmp_path / "2025-01-01" / "Elections.npy",
+            np.tile(np.array([[5.0, 1.0, 0.5]], dtype=np.float32), (20, 1)))
+
+    calls = []
+    monkeypatch.setattr(drift_scoring, "baselines", drift_scoring.BaselineCache(tmp_path))
+    monkeypatch.setattr(drift_scoring, "_batcher", MicroBatcher(_fake_encode(calls)))
+
+    client = TestClient(app)
+    r = client.post("/topic/Elections/drift_score", json={"texts": ["Hello", "World!"]})
+    assert r.status_code == 200
+    data = r.json()
+    assert data["baseline_date"] == "2025-01-01"
+    assert data["new_samples"] == 2
+    assert data["status"] == "Stable"
+    assert calls == [2]
+
+    assert client.post("/topic/Unknown/drift_score", json={"texts": ["x"]}).status_code == 404
+    assert client.post("/topic/Elections/drift_score", json={"texts": ["!!"]}).status_code == 400
+
+
+def test_scoring_uses_the_pipeline_metric_on_a_random_baseline_sample():
+    from analytics.semantic_drift import semantic_drift_metrics
+    rng = np.random.default_rng(0)
+    baseline = np.vstack([rng.normal(1.0, 0.1, (500, 8)), rng.normal(-1.0, 0.1, (500, 8))]).astype(np.float32)
+    new = baseline[:100]
+
+    sample = drift_scoring.baseline_sample(baseline, size=400)
+    assert sample.shape == (400, 8)
+    assert np.array_equal(sample, drift_scoring.baseline_sample(baseline, size=400))
+    assert len(drift_scoring.baseline_sample(baseline[:10], size=400)) == 10
+
+    result = drift_scoring.score_against_baseline(sample, new)
+    assert result["compared_samples"] == 100
+    assert result["drift_score"] == semantic_drift_metrics(sample[:100], new)[2]
+    # texts from one half of a bimodal baseline are not "Stable" against a sample of all of it
+    # (a prefix of the file would have been the same half)
+    assert result["status"] != "Stable"
+    assert drift_scoring.score_against_baseline(baseline[:100], new)["status"] == "Stable"
+
+
+def test_blocking_loads_run_off_the_event_loop(tmp_path, monkeypatch):
+    (tmp_path / "2025-01-01").mkdir()
+    np.save(tmp_path / "2025-01-01" / "Elections.npy", np.ones((20, 3), dtype=np.float32))
+    cache = drift_scoring.BaselineCache(tmp_path)
+    loaded_on = []
+
+    def no_running_loop():
+        try:
+            asyncio.get_running_loop()
+            return False
+        except RuntimeError:
+            return True
+
+    def get(topic_key):
+        loaded_on.append(("baseline", no_running_loop()))
+        return drift_scoring.BaselineCache.get(cache, topic_key)
+
+    def get_batcher():
+        loaded_on.append(("model", no_running_loop()))
+        return MicroBatcher(_fake_encode([]))
+
+    monkeypatch.setattr(cache, "get", get)
+    monkeypatch.setattr(drift_scoring, "baselines", cache)
+    monkeypatch.setattr(drift_scoring, "_batcher", None)
+    monkeypatch.setattr(drift_scoring, "get_batcher", get_batcher)
+
+    r = TestClient(app).post("/topic/Elections/drift_score", json={"texts": ["Hello"]})
+    assert r.status_code == 200
+    assert loaded_on == [("baseline", True), ("model", True)]
+
+
+def test_oversized_request_rejected_before_cleaning(monkeypatch):
+    from backend.routes import drift_score
+    monkeypatch.setattr(drift_score, "clean_texts", lambda texts: (_ for _ in ()).throw(AssertionError))
+    r = TestClient(app).post("/topic/Elections/drift_score", json={"texts": ["x"] * (drift_score.MAX_TEXTS + 1)})
+    assert r.status_code == 400
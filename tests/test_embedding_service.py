@@ -0,0 +1,63 @@
+import os
+import time
+import threading
+import tempfile
+import socketserver
+import numpy as np
+from api.utils.embedding_service import EmbeddingServer, EmbeddingServiceClient, get_service_client, default_socket_path
+
+
+def _fake_encode(texts, normalize):
+    time.sleep(0.02)
+    return np.array([[len(t), 1.0 if normalize else 0.0] for t in texts], dtype=np.float32)
+
+
+def test_service_batches_clients_and_reports_stats():
+    socket_path = os.path.join(tempfile.mkdtemp(), "embed.sock")
+    server = EmbeddingServer(socket_path, encode_fn=_fake_encode, max_wait_ms=50)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    for _ in range(100):
+        if os.path.exists(socket_path):
+            break
+        time.sleep(0.01)
+
+    try:
+        assert os.stat(socket_path).st_mode & 0o777 == 0o600
+        assert socketserver.ThreadingUnixStreamServer.daemon_threads is False
+        assert get_service_client(socket_path, model="sentence-transformers/all-MiniLM-L6-v2") is not None
+        assert get_service_client(socket_path, model="other-model") is None
+
+        results = {}
+
+        def worker(i):
+            client = EmbeddingServiceClient(socket_path)
+            results[i] = client.encode(["x" * i, "yy"], normalize=i % 2 == 0)
+            client.close()
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(1, 9)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for i, emb in results.items():
+            assert emb.shape == (2, 2)
+            assert emb[0, 0] == i
+            assert emb[0, 1] == (1.0 if i % 2 == 0 else 0.0)
+
+        stats = EmbeddingServiceClient(socket_path).stats()
+        assert stats["requests"] == 8
+        assert stats["texts"] == 16
+        assert stats["batches"] < 8
+        assert "queue_depth" in stats
+    finally:
+        server.shutdown()
+
+
+def test_default_socket_is_not_in_shared_tmp(monkeypatch):
+    monkeypatch.delenv("EMBEDDING_SERVICE_SOCKET", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+    assert default_socket_path() == "/run/user/1000/intentdriftwatch-embed.sock"
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setenv("INTENTDRIFTWATCH_DATA_ROOT", "/srv/idw")
+    assert default_socket_path() == "/srv/idw/.intentdriftwatch-embed.sock"
@@ -0,0 +1,110 @@
+import json
+from backend.utils import event_bus, summary_store
+from backend.utils.event_bus import SummaryWatcher, diff_summaries, format_sse
+
+
+def _summary(date, statuses):
+    return {
+        "generated_at": date,
+        "date": date,
+        "rows": [
+            {"topic": t, "semantic_status": s, "concept_status": c, "semantic_score": 0.1, "accuracy_drop": 0.0}
+            for t, (s, c) in statuses.items()
+        ],
+    }
+
+
+def test_diff_summaries_reports_changes_and_new_alerts():
+    prev = _summary("2025-11-10", {"AI": ("Stable", "Stable"), "Crypto": ("Stable", "Stable")})
+    curr = _summary("2025-11-11", {"AI": ("Stable", "Moderate Drift"), "Crypto": ("Stable", "Stable")})
+
+    events = diff_summaries(prev, curr)
+    names = [e for e, _ in events]
+    assert names == ["summary", "topic_status", "alert"]
+    assert events[1][1]["topic"] == "AI"
+    assert events[1][1]["previous"] == {"semantic_status": "Stable", "concept_status": "Stable"}
+    assert events[2][1]["topic"] == "AI"
+
+    assert diff_summaries(curr, curr) == []
+
+
+def test_watcher_check_only_fires_on_disk_change(tmp_path, monkeypatch):
+    monkeypatch.setattr(event_bus, "SUMMARY_DIR", tmp_path)
+    monkeypatch.setattr(summary_store, "SUMMARY_DIR", tmp_path)
+    summary_store.clear_cache()
+
+    watcher = SummaryWatcher()
+    assert watcher.check() == []
+
+    (tmp_path / "drift_summary_2025-11-11.json").write_text(
+        json.dumps(_summary("2025-11-11", {"AI": ("Stable", "Stable")}))
+    )
+    events = watcher.check()
+    assert [e for e, _ in events] == ["summary", "topic_status"]
+    assert watcher.check() == []
+
+
+def test_format_sse():
+    msg = format_sse("summary", {"date": "2025-11-11"}, 3)
+    assert msg == 'id: 3\nevent: summary\ndata: {"date":"2025-11-11"}\n\n'
+
+
+def test_slow_subscriber_is_dropped_and_its_stream_ends(monkeypatch):
+    import asyncio
+    from fastapi.testclient import TestClient
+    from backend.app import app
+    from backend.routes import events
+
+    watcher = SummaryWatcher()
+    slow, fast = asyncio.Queue(maxsize=2), asyncio.Queue(maxsize=10)
+    watcher.subscribers.update({slow, fast})
+    for i in range(3):
+        watcher.publish("summary", {"n": i})
+    assert watcher.subscribers == {fast}
+    assert slow.qsize() == 1 and slow.get_nowait() is event_bus.CLOSED
+    assert fast.qsize() == 3
+
+    # the SSE response finishes instead of sending keep-alives forever
+    closed = asyncio.Queue()
+    closed.put_nowait(event_bus.CLOSED)
+
+    async def subscribe():
+        return closed
+
+    monkeypatch.setattr(events.watcher, "subscribe", subscribe)
+    with TestClient(app).stream("GET", "/events") as r:
+        body = "".join(r.iter_text())
+    assert body.startswith("event: ready")
+
+
+def test_watcher_start_loads_off_the_event_loop(tmp_path, monkeypatch):
+    import asyncio
+    monkeypatch.setattr(event_bus, "SUMMARY_DIR", tmp_path)
+    monkeypatch.setattr(summary_store, "SUMMARY_DIR", tmp_path)
+    summary_store.clear_cache()
+    (tmp_path / "drift_summary_2025-11-11.json").write_text(
+        json.dumps(_summary("2025-11-11", {"AI": ("Stable", "Stable")}))
+    )
+    watcher = SummaryWatcher(poll_interval=0.01)
+    loaded_in_loop = []
+    load = watcher._load
+
+    def tracked_load():
+        try:
+            asyncio.get_running_loop()
+            loaded_in_loop.append(True)
+        except RuntimeError:
+            loaded_in_loop.append(False)
+        return load()
+
+    monkeypatch.setattr(watcher, "_load", tracked_load)
+
+    async def run():
+        queue = await watcher.subscribe()
+        summary = watcher.current_summary
+        watcher.unsubscribe(queue)
+        await watcher._task
+        return summary
+
+    assert asyncio.run(run())["date"] == "2025-11-11"
+    assert loaded_in_loop == [False]
@@ -0,0 +1,68 @@
+from fastapi.testclient import TestClient
+from backend.app import app
+from backend.utils import http_cache
+from backend.utils.http_cache import clear_response_cache
+
+client = TestClient(app)
+
+
+def test_etag_and_not_modified():
+    clear_response_cache()
+    r = client.get("/drift_history")
+    assert r.status_code == 200
+    etag = r.headers.get("etag")
+    assert etag and etag.startswith('"')
+    assert "last-modified" in r.headers
+
+    r2 = client.get("/drift_history", headers={"If-None-Match": etag})
+    assert r2.status_code == 304
+    assert r2.content == b""
+    assert r2.headers["etag"].strip('"').startswith(etag.strip('"').replace("-gzip", ""))
+
+
+def test_etag_differs_per_query():
+    a = client.get("/drift_summary").headers["etag"]
+    b = client.get("/drift_summary", params={"date": "2025-11-11"}).headers["etag"]
+    assert a != b
+
+
+def test_large_payload_is_gzipped(monkeypatch):
+    monkeypatch.setattr(http_cache, "GZIP_MIN_SIZE", 0)
+    clear_response_cache()
+    r = client.get("/topic/Climate Change/history", headers={"Accept-Encoding": "gzip"})
+    assert r.status_code == 200
+    assert r.headers.get("content-encoding") == "gzip"
+    assert r.headers["etag"].endswith('-gzip"')
+
+    raw = client.get("/topic/Climate Change/history", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in raw.headers
+    assert r.json() == raw.json()
+
+
+def test_rewriting_an_older_file_changes_the_data_version(tmp_path, monkeypatch):
+    import os
+    summaries = tmp_path / "summaries"
+    summaries.mkdir()
+    for date in ("2025-11-10", "2025-11-11"):
+        (summaries / f"drift_summary_{date}.json").write_text("{}")
+    monkeypatch.setattr(http_cache, "WATCHED_DIRS", [summaries, tmp_path / "missing"])
+
+    before = http_cache.data_version()[0]
+    older = summaries / "drift_summary_2025-11-10.json"
+    older.write_text('{"rows": []}')
+    os.utime(older, ns=(1, 1))  # even with an old mtime, the size changed
+    assert http_cache.data_version()[0] != before
+
+
+def test_data_version_is_cached_until_ttl_or_invalidation(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, "WATCHED_DIRS", [tmp_path])
+    http_cache.invalidate_data_version()
+    first = http_cache.cached_data_version()
+    (tmp_path / "drift_summary_2025-11-12.json").write_text("{}")
+    assert http_cache.cached_data_version() == first
+    assert http_cache.cached_data_version(ttl=0) != first
+    http_cache.invalidate_data_version()
+
+
+def test_projection_date_is_validated():
+    assert client.get("/embeddings/Elections/projection", params={"date": "../../etc"}).status_code == 400
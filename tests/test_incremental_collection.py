@@ -0,0 +1,94 @@
+import json
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import pytest
+from data_pipeline.data_collectors.incremental import conditional_get, SeenIds, save_daily_texts
+
+FEED = """<?xml version="1.0"?><rss version="2.0"><channel><title>stub</title>{items}</channel></rss>"""
+ITEM = "<item><guid>{id}</guid><title>{title}</title><description>story {id}</description></item>"
+
+
+class StubFeed:
+    """Local RSS server that honours If-None-Match."""
+
+    def __init__(self):
+        self.items = []
+        self.version = 0
+        self.requests = []
+        feed = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                etag = f'"v{feed.version}"'
+                feed.requests.append(self.headers.get("If-None-Match"))
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                body = FEED.format(items="".join(ITEM.format(id=i, title=t) for i, t in feed.items)).encode()
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Type", "application/rss+xml")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def publish(self, *items):
+        self.items = list(items) + self.items
+        self.version += 1
+
+
+@pytest.fixture
+def stub_feed():
+    feed = StubFeed()
+    yield feed
+    feed.server.shutdown()
+
+
+def test_conditional_get_returns_304_for_known_etag(stub_feed):
+    stub_feed.publish(("a1", "Election day"))
+    status, body, headers = conditional_get(stub_feed.url + "/rss")
+    assert status == 200 and b"Election day" in body
+
+    status, body, _ = conditional_get(stub_feed.url + "/rss", etag=headers["ETag"])
+    assert (status, body) == (304, None)
+
+
+def test_seen_ids_keep_newest():
+    seen = SeenIds(["a", "b"], max_size=3)
+    for item in ("c", "a", "d"):
+        seen.add(item)
+    assert seen.to_list() == ["c", "a", "d"] and "b" not in seen
+
+
+def test_daily_file_accumulates(tmp_path):
+    first = save_daily_texts(str(tmp_path), "Elections", "rss", ["one"])
+    second = save_daily_texts(str(tmp_path), "Elections", "rss", ["two"])
+    assert first == second
+    with open(first) as f:
+        assert json.load(f)["texts"] == ["one", "two"]
+
+
+def test_rss_collector_only_stores_new_articles(stub_feed, tmp_path, monkeypatch):
+    pytest.importorskip("feedparser")
+    from data_pipeline.data_collectors import rss_scraper
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(rss_scraper, "RSS_FEED_URL", stub_feed.url + "/rss?q={query}")
+    stub_feed.publish(("a1", "Polls open"), ("a2", "Turnout high"))
+
+    path = rss_scraper.fetch_rss_articles("Elections")
+    assert rss_scraper.fetch_rss_articles("Elections") is None   # 304
+    assert stub_feed.requests[-1] == '"v1"'
+
+    stub_feed.publish(("a3", "Recount requested"))
+    assert rss_scraper.fetch_rss_articles("Elections") == path
+    with open(path) as f:
+        texts = json.load(f)["texts"]
+    assert len(texts) == 3 and texts[-1].startswith("recount requested")
@@ -0,0 +1,105 @@
+import json
+from types import SimpleNamespace
+from data_pipeline.data_collectors import reddit_scraper, twitter_scraper
+from data_pipeline.data_collectors.incremental import BloomFilter
+
+
+class FakeReddit:
+    """Search listing (newest first) that records how far the collector paged."""
+
+    def __init__(self):
+        self.posts = []
+        self.yielded = 0
+
+    def post(self, pid, created, title):
+        self.posts.insert(0, SimpleNamespace(id=pid, created_utc=created, title=title, selftext=""))
+
+    def subreddit(self, name):
+        return self
+
+    def search(self, topic, limit, sort):
+        for submission in self.posts[:limit]:
+            self.yielded += 1
+            yield submission
+
+
+class FakeX:
+    def __init__(self, tweets):
+        self.tweets = tweets   # newest first, ids ascending with time
+        self.calls = []
+
+    def search_recent_tweets(self, query, max_results, tweet_fields, since_id=None, next_token=None):
+        self.calls.append({"since_id": since_id, "next_token": next_token})
+        newer = [t for t in self.tweets if since_id is None or t.id > int(since_id)]
+        start = int(next_token or 0)
+        page = newer[start:start + max_results]
+        meta = {"newest_id": newer[0].id} if newer else {}
+        if start + max_results < len(newer) and since_id is not None:
+            meta["next_token"] = str(start + max_results)
+        return SimpleNamespace(data=page, meta=meta)
+
+
+def _texts(path):
+    with open(path) as f:
+        return json.load(f)["texts"]
+
+
+def test_bloom_filter_round_trip():
+    bloom = BloomFilter(capacity=1000)
+    for i in range(1000):
+        bloom.add(f"t3_{i}")
+    restored = BloomFilter.from_dict(json.loads(json.dumps(bloom.to_dict())))
+    assert all(f"t3_{i}" in restored for i in range(1000))
+    false_positives = sum(f"other_{i}" in restored for i in range(10000))
+    assert false_positives < 300
+
+
+def test_reddit_collects_only_posts_newer_than_cursor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fake = FakeReddit()
+    monkeypatch.setattr(reddit_scraper, "get_reddit_client", lambda: fake)
+    for i in range(5):
+        fake.post(f"p{i}", 1000 + i, f"Election post {i}")
+
+    path = reddit_scraper.fetch_reddit_posts("Elections", limit=3)
+    assert _texts(path) == ["election post 4", "election post 3", "election post 2"]
+
+    fake.post("p5", 2000, "Recount requested")
+    fake.post("p6", 2001, "Results certified")
+    fake.yielded = 0
+    reddit_scraper.fetch_reddit_posts("Elections", limit=3)
+    assert _texts(path)[3:] == ["results certified", "recount requested"]
+    assert fake.yielded == 3   # stopped at the cursor
+
+    assert reddit_scraper.fetch_reddit_posts("Elections", limit=3) is None
+
+
+def test_x_pages_until_cursor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fake = FakeX([SimpleNamespace(id=i, text=f"tweet {i}") for i in range(20, 0, -1)])
+    monkeypatch.setattr(twitter_scraper, "get_twitter_client", lambda: fake)
+
+    path = twitter_scraper.fetch_twitter_posts("Elections", limit=10)
+    assert len(_texts(path)) == 10
+
+    fake.tweets = [SimpleNamespace(id=i, text=f"tweet {i}") for i in range(45, 20, -1)] + fake.tweets
+    twitter_scraper.fetch_twitter_posts("Elections", limit=10)
+    assert len(_texts(path)) == 35
+    assert fake.calls[1]["since_id"] == "20" and fake.calls[-1]["next_token"] == "20"
+
+
+def test_each_page_after_the_first_takes_a_token(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fake = FakeX([SimpleNamespace(id=i, text=f"tweet {i}") for i in range(20, 0, -1)])
+    monkeypatch.setattr(twitter_scraper, "get_twitter_client", lambda: fake)
+    twitter_scraper.fetch_twitter_posts("Elections", limit=10)
+
+    tokens = []
+    fake.tweets = [SimpleNamespace(id=i, text=f"tweet {i}") for i in range(45, 20, -1)] + fake.tweets
+    fake.calls = []
+    twitter_scraper.fetch_twitter_posts("Elections", limit=10, acquire=lambda: tokens.append(len(fake.calls)))
+    assert len(fake.calls) == 3 and tokens == [1, 2]
+
+    listing = iter(range(250))
+    assert len(list(reddit_scraper.paced(listing, lambda: tokens.append("page")))) == 250
+    assert tokens[2:] == ["page", "page"]
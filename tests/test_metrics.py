@@ -0,0 +1,45 @@
+import re
+from fastapi.testclient import TestClient
+from backend.app import app
+from backend.utils.http_cache import clear_response_cache
+from backend.utils.metrics import registry
+
+client = TestClient(app)
+
+SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{.*\})? (\S+)$')
+
+
+def scrape():
+    """Parse the exposition the way a Prometheus scrape would: {(name, labels): value}."""
+    r = client.get("/metrics")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/plain; version=0.0.4")
+    samples = {}
+    for line in r.text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        m = SAMPLE.match(line)
+        assert m, f"malformed sample line: {line}"
+        samples[(m.group(1), m.group(2) or "")] = float(m.group(3))
+    return samples
+
+
+def test_metrics_record_route_latency_and_cache_outcomes():
+    registry.clear()
+    clear_response_cache()
+    before = scrape()
+
+    etag = client.get("/drift_summary").headers["etag"]
+    client.get("/drift_summary", headers={"If-None-Match": etag})
+    client.get("/topic/Elections/history")
+
+    after = scrape()
+    labels = '{method="GET",route="/drift_summary"}'
+    assert after[("http_request_duration_seconds_count", labels)] == 2
+    assert after[("http_request_duration_seconds_bucket", labels[:-1] + ',le="+Inf"}')] == 2
+    assert after[("http_requests_total", '{method="GET",route="/drift_summary",status="304"}')] == 1
+    assert ("http_request_duration_seconds_count", '{method="GET",route="/topic/{topic_name}/history"}') in after
+    assert after[("http_response_size_bytes_count", labels)] == 1
+
+    key = ("http_cache_responses_total", '{result="not_modified"}')
+    assert after[key] == before[key] + 1
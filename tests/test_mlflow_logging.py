@@ -0,0 +1,44 @@
+import os
+import time
+from analytics.semantic_drift import run_semantic_drift, semantic_report_path
+from pipelines.mlflow_logging import SEMANTIC_FIELDS, drift_metric_entries, files_modified_since
+from scripts.synthetic_drift import generate_scenarios
+
+
+def test_semantic_runner_returns_only_this_runs_results(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    emb_dir = str(tmp_path / "embeddings")
+    generate_scenarios(emb_dir, n_topics=2, n_rows=100, dim=16, n_dates=3)
+
+    results = run_semantic_drift(emb_dir)
+    assert len(results) == 4
+    assert all(os.path.exists(semantic_report_path(r["topic"], r["new_date"])) for r in results)
+
+    entries = drift_metric_entries(results, SEMANTIC_FIELDS, timestamp_ms=1)
+    assert len(entries) == 4 * len(SEMANTIC_FIELDS)
+    # one key per topic/field; dates become steps instead of separate keys
+    keys = {(k, step) for k, _, _, step in entries}
+    assert ("Synthetic_00000_drift_score", 20250102) in keys
+    assert ("Synthetic_00000_drift_score", 20250103) in keys
+
+
+def test_files_modified_since(tmp_path):
+    (tmp_path / "old.html").write_text("x")
+    os.utime(tmp_path / "old.html", (0, 0))
+    since = time.time() - 1
+    (tmp_path / "new.html").write_text("y")
+    assert files_modified_since(str(tmp_path), since) == [str(tmp_path / "new.html")]
+    assert files_modified_since(str(tmp_path / "missing"), since) == []
+
+
+def test_files_modified_since_walks_subdirectories(tmp_path):
+    nested = tmp_path / "Climate Change" / "2025-01-02"
+    nested.mkdir(parents=True)
+    (nested / "old.png").write_text("x")
+    os.utime(nested / "old.png", (0, 0))
+    since = time.time() - 1
+    (nested / "umap.png").write_text("y")
+    (tmp_path / "summary.html").write_text("z")
+    assert files_modified_since(str(tmp_path), since) == [
+        str(nested / "umap.png"), str(tmp_path / "summary.html")
+    ]
@@ -0,0 +1,55 @@
+import os
+import json
+import random
+from data_pipeline.utils.near_dedup import dedupe_texts, lsh_params, MinHasher, shingles
+from data_pipeline.clean_combined_data import clean_combined_topic
+
+
+def test_near_duplicates_removed_distinct_texts_kept():
+    rng = random.Random(0)
+    words = [f"word{i}" for i in range(3000)]
+    distinct = [" ".join(rng.choices(words, k=40)) for _ in range(500)]
+    # syndicated copies: same story with a trailing source tag
+    copies = [t + " via reuters" for t in distinct[:100]]
+    kept, stats = dedupe_texts(distinct + copies + distinct[:20], threshold=0.8)
+
+    assert kept == distinct
+    assert stats["exact_duplicates"] == 20 and stats["near_duplicates"] == 100
+    assert stats["input_texts"] == 620 and stats["kept_texts"] == 500
+
+
+def test_lsh_threshold_tracks_requested_threshold():
+    for threshold in (0.5, 0.7, 0.9):
+        bands, rows = lsh_params(threshold, 128)
+        assert bands * rows <= 128
+        assert abs((1 / bands) ** (1 / rows) - threshold) < 0.1
+
+
+def test_cleaned_file_records_duplicate_counts(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("data_pipeline/data/processed/combined")
+    texts = ["Breaking: rover lands on Mars, NASA confirms",
+             "BREAKING: Rover lands on Mars -- NASA confirms!",
+             "Launch window for the lunar mission moves to May"]
+    with open("data_pipeline/data/processed/combined/Space_Exploration_combined.json", "w") as f:
+        json.dump({"topic": "Space Exploration", "texts": texts}, f)
+
+    with open(clean_combined_topic("Space Exploration")) as f:
+        data = json.load(f)
+    assert data["num_cleaned_texts"] == 2
+    assert data["dedup"]["exact_duplicates"] == 1
+
+    with open(clean_combined_topic("Space Exploration", dedup_threshold=None)) as f:
+        assert json.load(f)["num_cleaned_texts"] == 3
+
+
+def test_chunked_signature_matches_one_pass():
+    import numpy as np
+    rng = random.Random(3)
+    text = " ".join(f"ballot{rng.randrange(10000)}" for _ in range(3000))
+    grams = shingles(text)
+    assert len(grams) > 5000
+    hasher = MinHasher()
+    one_pass = ((hasher.a * grams[None, :] + hasher.b) >> np.uint64(32)).min(axis=1).astype(np.uint32)
+    assert np.array_equal(hasher.signature(grams, chunk_size=7), one_pass)
+    assert np.array_equal(hasher.signature(grams), one_pass)
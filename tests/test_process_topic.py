@@ -0,0 +1,74 @@
+import os
+import json
+from glob import glob
+import numpy as np
+import data_pipeline.process_topic as process_module
+import data_pipeline.generate_embeddings as embeddings_module
+from data_pipeline.process_topic import process_topic
+from data_pipeline.combine_sources import combine_topic_data
+from data_pipeline.clean_combined_data import clean_combined_topic
+from data_pipeline.generate_embeddings import generate_embeddings_for_topic
+from data_pipeline.utils.record_store import record_id
+
+
+def fake_encode(texts):
+    return np.array([[len(t), t.count(" ")] for t in texts], dtype=np.float32)
+
+
+def write_raw(raw_dir, texts):
+    os.makedirs(f"data_pipeline/data/raw/{raw_dir}", exist_ok=True)
+    with open(f"data_pipeline/data/raw/{raw_dir}/Elections_2026-10-18.json", "w") as f:
+        json.dump({"collected_at": "2026-10-18 06:00:00", "texts": texts}, f)
+
+
+def test_fused_pass_matches_staged_path_without_intermediate_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(embeddings_module, "encode_texts", fake_encode)
+    write_raw("reddit", ["Turnout is UP!", "Turnout is up!!", "Recount requested in two states"])
+    write_raw("news", ["Polls close at 8pm https://news.example/1"])
+
+    fused_path = process_topic("Elections")
+    fused = np.load(fused_path)
+    with open(fused_path.replace(".npy", "_rows.json")) as f:
+        fused_ids = json.load(f)["ids"]
+    assert glob("data_pipeline/data/processed/combined/*") == []
+    assert glob("data_pipeline/data/processed/cleaned/*") == []
+
+    combine_topic_data("Elections")
+    clean_combined_topic("Elections")
+    staged_path = generate_embeddings_for_topic("Elections", force=True)
+    staged = np.load(staged_path)
+    assert np.array_equal(fused, staged) and len(fused) == 3
+    # both paths key search rows by record id (source + raw text), not by cleaned text
+    with open(staged_path.replace(".npy", "_rows.json")) as f:
+        assert json.load(f)["ids"] == fused_ids
+    assert fused_ids[0] == record_id("reddit", "Turnout is UP!")
+
+
+def test_materialize_writes_intermediates_and_unchanged_inputs_skip(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+    monkeypatch.setattr(embeddings_module, "encode_texts", lambda texts: calls.append(texts) or fake_encode(texts))
+    write_raw("reddit", ["Vote counts are in", "Turnout was high"])
+
+    path = process_topic("Elections", materialize=True)
+    assert process_topic("Elections", materialize=True) == path and len(calls) == 1
+    with open(glob("data_pipeline/data/processed/cleaned/Elections_cleaned_*.json")[0]) as f:
+        assert json.load(f)["texts"] == ["vote counts are in", "turnout was high"]
+    with open("data_pipeline/data/processed/combined/Elections_combined.json") as f:
+        assert json.load(f)["provenance"]["source"] == ["reddit", "reddit"]
+
+
+def test_only_new_texts_are_encoded_when_another_source_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = []
+    monkeypatch.setattr(embeddings_module, "encode_texts", lambda texts: calls.append(texts) or fake_encode(texts))
+    write_raw("wiki", ["A long and unchanged election article"])
+    write_raw("reddit", ["Turnout was high"])
+    process_topic("Elections")
+
+    write_raw("reddit", ["Turnout was high", "Recount requested"])
+    path = process_topic("Elections")
+    assert calls[1] == ["recount requested"]
+    assert np.array_equal(np.load(path), fake_encode(
+        ["turnout was high", "recount requested", "a long and unchanged election article"]))
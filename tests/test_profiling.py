@@ -0,0 +1,63 @@
+import json
+import pytest
+from pipelines.profiling import PipelineProfiler, count_items
+
+
+def test_stages_record_time_items_and_errors(tmp_path):
+    profiler = PipelineProfiler("run", mode="cprofile", output_dir=str(tmp_path))
+    with profiler.stage("embedding"):
+        for topic in ("Elections", "Climate Change"):
+            with profiler.stage("embedding", topic) as st:
+                st["items"] = 10
+    with pytest.raises(RuntimeError):
+        with profiler.stage("semantic_drift"):
+            raise RuntimeError("boom")
+
+    phases = profiler.phase_totals()
+    assert phases["embedding"]["items"] == 20
+    assert phases["embedding"]["errors"] == 0
+    assert phases["semantic_drift"]["errors"] == 1
+    assert profiler.captures["embedding"]["top_functions"]
+    assert (tmp_path / "run" / "embedding.prof").exists()
+
+    metrics = profiler.mlflow_metrics()
+    assert metrics["profile_embedding_items"] == 20.0
+    assert "profile_embedding_Climate_Change_wall_s" in metrics
+
+    saved = json.loads(open(profiler.save()).read())
+    assert [s["topic"] for s in saved["stages"]] == ["Elections", "Climate Change", None, None]
+    assert saved["stages"][-1]["error"] == "boom"
+
+
+def test_count_items_reads_pipeline_outputs(tmp_path):
+    path = tmp_path / "Elections_cleaned.json"
+    path.write_text(json.dumps({"texts": ["a", "b", "c"]}))
+    assert count_items(str(path)) == 3
+    assert count_items(None) == 0
+
+
+def test_count_items_reads_parquet_row_count(tmp_path):
+    pytest.importorskip("pyarrow")
+    from data_pipeline.utils import record_store
+    records = [{"source": "rss", "text": t, "clean_text": t} for t in ("a", "b", "c", "d")]
+    path = record_store.write_records(records, "Elections", "2025-01-02", root=str(tmp_path))
+    assert count_items(path) == 4
+
+
+def test_pipelined_stage_records_save_a_profile(tmp_path):
+    from pipelines.stage_executor import PipelinedExecutor, Stage
+
+    profiler = PipelineProfiler("run", output_dir=str(tmp_path))
+
+    def on_result(r):
+        profiler.add(r["stage"], r["topic"], items=1, wall_s=r["elapsed_s"], status=r["status"])
+
+    with profiler.stage("pipelined"):
+        PipelinedExecutor([Stage("collection", str), Stage("embedding", len)],
+                          on_result=on_result).run(["Elections", "Climate Change"])
+
+    saved = json.loads(open(profiler.save()).read())
+    assert saved["phases"]["embedding"]["items"] == 2
+    assert saved["phases"]["embedding"]["cpu_s"] is None
+    assert saved["phases"]["pipelined"]["cpu_s"] is not None
+    assert "profile_collection_cpu_s" not in profiler.mlflow_metrics()
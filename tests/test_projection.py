@@ -0,0 +1,64 @@
+import numpy as np
+from fastapi.testclient import TestClient
+from analytics.projection import fit_basis, project, grid_strata, stratified_sample, run_projections
+from backend.app import app
+from backend.routes import embeddings as embeddings_route
+
+
+def test_stratified_sample_respects_budget_and_covers_strata():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(3000, 8)).astype(np.float32)
+    mean, components = fit_basis(X)
+    coords = project(X, mean, components)
+    strata = grid_strata(coords)
+
+    idx = stratified_sample(strata, 200)
+    assert len(idx) == 200
+    assert len(np.unique(idx)) == 200
+    assert set(np.unique(strata[idx])) == set(np.unique(strata))
+
+
+def test_projection_endpoint_binary_and_json(tmp_path, monkeypatch):
+    rng = np.random.default_rng(1)
+    emb_dir = tmp_path / "embeddings"
+    for date in ("2025-01-01", "2025-01-02"):
+        (emb_dir / date).mkdir(parents=True)
+        np.save(emb_dir / date / "Space_Exploration.npy", rng.normal(size=(500, 16)).astype(np.float32))
+
+    proj_dir = tmp_path / "projections"
+    written = run_projections(str(emb_dir), str(proj_dir), str(tmp_path / "basis"))
+    assert len(written) == 2
+    assert run_projections(str(emb_dir), str(proj_dir), str(tmp_path / "basis")) == []
+
+    monkeypatch.setattr(embeddings_route, "PROJ_DIR", proj_dir)
+    client = TestClient(app)
+
+    r = client.get("/embeddings/Space Exploration/projection", params={"max_points": 100})
+    assert r.status_code == 200
+    assert r.headers["x-date"] == "2025-01-02"
+    points = np.frombuffer(r.content, dtype="<f2").reshape(-1, 2)
+    assert points.shape == (100, 2)
+
+    r = client.get("/embeddings/Space Exploration/projection",
+                   params={"date": "2025-01-01", "max_points": 50, "format": "json"})
+    assert len(r.json()["points"]) == 50
+
+    assert client.get("/embeddings/Nope/projection").status_code == 404
+
+
+def test_snapshot_rewritten_in_place_is_reprojected(tmp_path):
+    import os
+    rng = np.random.default_rng(2)
+    emb_path = tmp_path / "embeddings" / "2025-01-01" / "Elections.npy"
+    emb_path.parent.mkdir(parents=True)
+    np.save(emb_path, rng.normal(size=(50, 8)).astype(np.float32))
+    args = (str(tmp_path / "embeddings"), str(tmp_path / "projections"), str(tmp_path / "basis"))
+    [coords_path] = run_projections(*args)
+
+    # a rerun later the same day overwrites the snapshot with more rows
+    earlier = os.stat(coords_path).st_mtime_ns - 60_000_000_000
+    os.utime(coords_path, ns=(earlier, earlier))
+    np.save(emb_path, rng.normal(size=(80, 8)).astype(np.float32))
+    assert run_projections(*args) == [coords_path]
+    assert np.load(coords_path).shape == (80, 2)
+    assert run_projections(*args) == []
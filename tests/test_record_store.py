@@ -0,0 +1,86 @@
+import os
+import json
+import pytest
+from data_pipeline.combine_sources import combine_topic_data
+from data_pipeline.clean_combined_data import records_from_combined, clean_records, clean_combined_topic
+
+pa = pytest.importorskip("pyarrow")
+
+from data_pipeline.utils import record_store  # noqa: E402
+
+
+def write_raw(raw_dir, texts, collected_at):
+    path = f"data_pipeline/data/raw/{raw_dir}/Elections_2026-10-18.json"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"topic": "Elections", "collected_at": collected_at, "texts": texts}, f)
+
+
+def test_provenance_survives_combine_and_clean(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_raw("reddit", ["Turnout is up!", "Turnout is up!!"], "2026-10-17 09:00:00")
+    write_raw("news", ["Polls close at 8pm", "https://x.example"], "2026-10-18 06:30:00")
+
+    with open(combine_topic_data("Elections")) as f:
+        records = records_from_combined(json.load(f), "Elections")
+    records, stats = clean_records(records)
+
+    assert [r["clean_text"] for r in records] == ["turnout is up", "polls close at 8pm", ""]
+    assert [r["source"] for r in records] == ["reddit", "rss", "rss"]
+    assert stats["exact_duplicates"] == 1
+    assert records[1]["id"] == record_store.record_id("rss", "Polls close at 8pm")
+
+    with open(clean_combined_topic("Elections")) as f:
+        stored = record_store.read_records(columns=["source", "collected_at"], topic="Elections")
+        assert json.load(f)["num_cleaned_texts"] == stored.num_rows == 3
+    assert str(stored.column("collected_at")[0]) == "2026-10-17 09:00:00"
+
+
+def test_filtered_reads_and_streaming(tmp_path):
+    root = str(tmp_path / "records")
+    rows = [{"id": str(i), "source": "reddit" if i % 2 else "rss",
+             "collected_at": f"2026-10-{10 + i % 5:02d} 12:00:00",
+             "raw_text": f"Text {i}", "clean_text": f"text {i}",
+             "content_hash": record_store.content_hash(f"text {i}")} for i in range(100)]
+    record_store.write_records(rows, "Climate Change", "2026-10-17", root)
+    record_store.write_records(rows[:10], "Climate Change", "2026-10-18", root)
+    record_store.write_records(rows, "Elections", "2026-10-18", root)
+
+    table = record_store.read_records(root, topic="Climate Change", dates=["2026-10-17"], sources=["rss"])
+    assert table.num_rows == 50
+    assert set(table.column("source").to_pylist()) == {"rss"}
+
+    recent = list(record_store.iter_records(root, columns=["id"], topic="Elections", since="2026-10-13"))
+    assert len(recent) == 40
+    assert record_store.latest_date("Climate Change", root) == "2026-10-18"
+    assert sum(b.num_rows for b in record_store.scan(root, batch_size=16)) == 210
+
+
+def test_embedding_streams_texts_from_the_record_store(tmp_path, monkeypatch):
+    import numpy as np
+    from data_pipeline import generate_embeddings
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(record_store, "ROW_GROUP_SIZE", 2)
+    write_raw("reddit", ["Turnout is up", "Polls close at 8pm", "Recount requested in two states",
+                         "Exit polls favour the incumbent"],
+              "2026-10-18 06:00:00")
+    combine_topic_data("Elections")
+    cleaned = clean_combined_topic("Elections")
+    # the JSON is not read when the record store has the snapshot
+    with open(cleaned, "w") as f:
+        json.dump({"texts": ["stale"]}, f)
+
+    calls = []
+    monkeypatch.setattr(generate_embeddings, "encode_texts",
+                        lambda texts: calls.append(len(texts)) or np.ones((len(texts), 3)))
+    path = generate_embeddings.generate_embeddings_for_topic("Elections")
+    assert calls == [2, 2]
+    assert np.load(path).shape == (4, 3)
+
+    # search rows carry the record store ids, so hits join back to their records
+    with open(path.replace(".npy", "_rows.json")) as f:
+        rows = json.load(f)
+    records = record_store.read_records(columns=["id", "clean_text"]).to_pylist()
+    assert rows["ids"] == [r["id"] for r in records]
+    assert rows["texts"] == [r["clean_text"] for r in records]
@@ -0,0 +1,50 @@
+import json
+from monitoring.rollups import bucket_for, update_rollups, rollup_path, build_overall_rollup
+from backend.routes.drift_history import select_buckets
+
+
+def _summary(date, score):
+    return {
+        "date": date,
+        "rows": [
+            {"topic": "AI", "semantic_score": score, "test_acc": 0.5, "accuracy_drop": 0.1,
+             "concept_status": "Stable"},
+            {"topic": "Elections", "semantic_score": score + 0.2, "test_acc": None,
+             "concept_status": "N/A"},
+        ],
+    }
+
+
+def test_bucket_for():
+    assert bucket_for("2025-11-11", "day") == ("2025-11-11", "2025-11-11", "2025-11-11")
+    assert bucket_for("2025-11-11", "week") == ("2025-W46", "2025-11-10", "2025-11-16")
+    assert bucket_for("2025-12-31", "month") == ("2025-12", "2025-12-01", "2025-12-31")
+
+
+def test_update_rollups_is_incremental_and_idempotent(tmp_path):
+    update_rollups(_summary("2025-11-10", 0.1), tmp_path)
+    update_rollups(_summary("2025-11-11", 0.3), tmp_path)
+    update_rollups(_summary("2025-11-11", 0.3), tmp_path)  # rewritten summary replaces, not double counts
+
+    week = json.loads(open(rollup_path("week", rollup_dir=tmp_path)).read())
+    bucket = week["buckets"]["2025-W46"]
+    assert sorted(bucket["days"]) == ["2025-11-10", "2025-11-11"]
+    # pooled over (0.1, 0.3, 0.3, 0.5)
+    assert bucket["values"]["semantic_drift_score"] == 0.3
+    assert week["dates"] == ["2025-11-10", "2025-11-11"]
+
+    topic_week = json.loads(open(rollup_path("week", "AI", tmp_path)).read())
+    assert abs(topic_week["buckets"]["2025-W46"]["values"]["semantic_score"] - 0.2) < 1e-9
+
+
+def test_select_buckets_paginates_with_cursor():
+    summaries = [_summary(f"2025-01-{d:02d}", 0.1) for d in range(1, 11)]
+    rollup = build_overall_rollup(summaries, "day")
+
+    page, cursor = select_buckets(rollup, start="2025-01-03", limit=4)
+    assert [k for k, _ in page] == ["2025-01-03", "2025-01-04", "2025-01-05", "2025-01-06"]
+    assert cursor == "2025-01-06"
+
+    page, cursor = select_buckets(rollup, start="2025-01-03", end="2025-01-08", limit=4, cursor=cursor)
+    assert [k for k, _ in page] == ["2025-01-07", "2025-01-08"]
+    assert cursor is None
@@ -0,0 +1,47 @@
+import os
+import json
+import numpy as np
+import pytest
+from data_pipeline.utils.io_utils import atomic_write, save_json, save_npy
+from pipelines.run_journal import RunJournal
+
+
+def test_journal_survives_reload_and_lists_pending(tmp_path):
+    plan = [("collection", "Elections"), ("collection", "Cryptocurrency"), ("semantic_drift", None)]
+    journal = RunJournal.create("abc123", "Run_test", journal_dir=str(tmp_path), force=False)
+    journal.mark_done("collection", "Elections")
+
+    resumed = RunJournal.load("abc123", journal_dir=str(tmp_path))
+    assert resumed.is_done("collection", "Elections")
+    assert resumed.pending(plan) == plan[1:]
+
+    resumed.start_attempt(force=True)
+    assert resumed.attempt == 2
+    for unit in plan[1:]:
+        resumed.mark_done(*unit)
+    resumed.finish()
+    assert RunJournal.load("abc123", journal_dir=str(tmp_path)).data["status"] == "complete"
+
+    with pytest.raises(FileNotFoundError):
+        RunJournal.load("missing", journal_dir=str(tmp_path))
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    path = str(tmp_path / "report.json")
+    save_json({"drift_score": 0.1}, path)
+
+    with pytest.raises(RuntimeError):
+        with atomic_write(path) as f:
+            f.write('{"drift_sc')
+            raise RuntimeError("killed mid-write")
+
+    with open(path) as f:
+        assert json.load(f) == {"drift_score": 0.1}
+    assert os.listdir(tmp_path) == ["report.json"]
+
+
+def test_save_npy_keeps_exact_path(tmp_path):
+    path = str(tmp_path / "emb" / "Elections.npy")
+    save_npy(np.eye(3, dtype=np.float32), path)
+    assert os.listdir(tmp_path / "emb") == ["Elections.npy"]
+    np.testing.assert_array_equal(np.load(path), np.eye(3))
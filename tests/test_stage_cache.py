@@ -0,0 +1,88 @@
+import os
+import json
+import threading
+from data_pipeline.combine_sources import combine_topic_data
+from data_pipeline.clean_combined_data import clean_combined_topic
+from data_pipeline.utils.stage_cache import StageCache
+from analytics.semantic_drift import run_semantic_drift
+from scripts.synthetic_drift import generate_scenarios
+
+
+def _write_raw(texts):
+    os.makedirs("data_pipeline/data/raw/reddit", exist_ok=True)
+    with open("data_pipeline/data/raw/reddit/Elections_2025-01-01.json", "w") as f:
+        json.dump({"texts": texts}, f)
+
+
+def test_unchanged_inputs_skip_combine_and_clean(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _write_raw(["Vote counts are in!", "Turnout was high"])
+
+    combined = combine_topic_data("Elections")
+    cleaned = clean_combined_topic("Elections")
+    mtimes = (os.stat(combined).st_mtime_ns, os.stat(cleaned).st_mtime_ns)
+
+    assert combine_topic_data("Elections") == combined
+    assert clean_combined_topic("Elections") == cleaned
+    assert (os.stat(combined).st_mtime_ns, os.stat(cleaned).st_mtime_ns) == mtimes
+
+    _write_raw(["Vote counts are in!", "Turnout was high", "Recount requested"])
+    combine_topic_data("Elections")
+    clean_combined_topic("Elections")
+    with open(cleaned) as f:
+        assert len(json.load(f)["texts"]) == 3
+
+    os.utime(cleaned, ns=(0, 0))
+    clean_combined_topic("Elections", force=True)
+    assert os.stat(cleaned).st_mtime_ns != 0
+
+
+def test_drift_pairs_are_skipped_until_snapshots_change(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    emb_dir = str(tmp_path / "embeddings")
+    generate_scenarios(emb_dir, n_topics=2, n_rows=50, dim=8, n_dates=2)
+
+    assert len(run_semantic_drift(emb_dir)) == 2
+    assert run_semantic_drift(emb_dir) == []
+    assert len(run_semantic_drift(emb_dir, force=True)) == 2
+
+    generate_scenarios(emb_dir, n_topics=2, n_rows=50, dim=8, n_dates=2, seed=1)
+    assert len(run_semantic_drift(emb_dir)) == 2
+
+
+def test_file_digest_is_memoized_by_size_and_mtime(tmp_path):
+    path = tmp_path / "a.json"
+    path.write_text("{}")
+    cache = StageCache(str(tmp_path / "cache.json"))
+    fp = cache.fingerprint([str(path)], {"model": "x"})
+    assert cache.fingerprint([str(path)], {"model": "y"}) != fp
+    cache.record("embed", "Elections", fp, [str(path)])
+
+    reloaded = StageCache(str(tmp_path / "cache.json"))
+    assert reloaded.lookup("embed", "Elections", fp) == [str(path)]
+    path.unlink()
+    assert reloaded.lookup("embed", "Elections", fp) is None
+
+
+def test_concurrent_fingerprint_and_record(tmp_path):
+    cache = StageCache(str(tmp_path / "cache.json"))
+    errors = []
+
+    def work(n):
+        try:
+            for i in range(60):
+                path = tmp_path / f"in_{n}_{i}.json"
+                path.write_text(str(i))
+                fp = cache.fingerprint([str(path)], {"n": n})
+                cache.record("embed", f"topic{n}_{i}", fp, [str(path)])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert len(StageCache(str(tmp_path / "cache.json")).stages) == 240
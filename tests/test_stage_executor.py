@@ -0,0 +1,48 @@
+import time
+from pipelines.stage_executor import PipelinedExecutor, Stage
+
+
+def sleeper(seconds):
+    def fn(topic):
+        time.sleep(seconds)
+        return topic
+    return fn
+
+
+def test_stages_overlap_across_topics():
+    stages = [Stage("collection", sleeper(0.1), workers=2), Stage("preparation", sleeper(0.1)),
+              Stage("embedding", sleeper(0.1))]
+    start = time.perf_counter()
+    results = PipelinedExecutor(stages).run(["a", "b", "c", "d"])
+    elapsed = time.perf_counter() - start
+
+    assert len(results) == 12 and all(r["status"] == "ok" for r in results)
+    # phase by phase this takes 1.2s; pipelined it is bounded by the slowest stage (~0.4s + fill)
+    assert elapsed < 1.0
+
+
+def test_failed_topic_stops_and_queues_are_bounded():
+    finished = {"fast": 0, "slow": 0, "last": 0}
+    leads = []
+
+    def on_result(r):
+        finished[r["stage"]] += 1
+        if r["stage"] == "fast":
+            leads.append(finished["fast"] - finished["slow"])
+
+    def fail_on_c(topic):
+        if topic == "c":
+            raise ValueError("bad topic")
+        return topic
+
+    stages = [Stage("fast", sleeper(0)), Stage("slow", sleeper(0.03)), Stage("last", fail_on_c)]
+    results = PipelinedExecutor(stages, queue_size=1, on_result=on_result).run(list("abcdefghij"))
+
+    # at most: one queued, one being processed, one waiting to be queued
+    assert max(leads) <= 3
+    failed = [r for r in results if r["status"] == "failed"]
+    assert [(r["stage"], r["topic"], r["error"]) for r in failed] == [("last", "c", "bad topic")]
+
+    stages[1] = Stage("slow", fail_on_c)
+    results = PipelinedExecutor(stages).run(list("abcd"))
+    assert not [r for r in results if r["stage"] == "last" and r["topic"] == "c"]
@@ -0,0 +1,25 @@
+import json
+import numpy as np
+from scripts.synthetic_drift import generate_scenarios
+from scripts.benchmark_drift_engines import main as run_benchmark
+
+
+def test_generator_writes_pipeline_layout_with_ground_truth(tmp_path):
+    plan = generate_scenarios(str(tmp_path), n_topics=4, n_rows=250, dim=32, n_dates=3)
+
+    manifest = json.loads((tmp_path / "scenarios.json").read_text())
+    assert manifest["dates"] == ["2025-01-01", "2025-01-02", "2025-01-03"]
+    assert [s["scenario"] for s in plan.values()] == ["none", "mean_shift", "reweight", "new_cluster"]
+
+    emb = np.load(tmp_path / "2025-01-03" / "Synthetic_00001.npy")
+    assert emb.shape == (250, 32) and emb.dtype == np.float32
+    assert np.allclose(np.linalg.norm(emb, axis=1), 1.0, atol=1e-5)
+
+
+def test_semantic_engine_detects_known_drift(tmp_path):
+    result = run_benchmark(["--topics", "8", "--rows", "300", "--engines", "semantic",
+                            "--data-root", str(tmp_path), "--no-save", "--no-check"])
+    semantic = result["engines"]["semantic"]
+    assert semantic["reports"] == 8
+    assert set(semantic["scenarios"]) == {"mean_shift", "reweight", "new_cluster"}
+    assert result["failures"] == []
@@ -0,0 +1,27 @@
+from data_pipeline.utils.text_cleaning import clean_text, clean_texts, clean_batch
+from scripts.benchmark_text_cleaning import legacy_clean_text, synthetic_corpus
+
+CASES = [
+    "Breaking: Rover lands on MARS!! https://nasa.gov/x?y=1 🚀",
+    "Résumé\u00a0of the naïve   model\t\n— (update)",
+    "Price hits $50,000 #BTC @user",
+    "K\u212a sign, İstanbul, x\u2028y, a\x1cb",
+    "", "   ", "http", "see myhttpserver now",
+]
+
+
+def test_matches_previous_cleaner():
+    for text in CASES + synthetic_corpus(2000):
+        assert clean_text(text) == legacy_clean_text(text), text
+
+
+def test_cleaning_is_idempotent():
+    for text in CASES + ["h.t.t.p.s://evil", "ht-tp-x"]:
+        once = clean_text(text)
+        assert clean_text(once) == once
+
+
+def test_parallel_batch_matches_serial():
+    corpus = synthetic_corpus(3000, seed=1)
+    assert clean_batch(corpus, processes=2, min_parallel=0, chunk_size=500) == [clean_text(t) for t in corpus]
+    assert clean_texts(["A!", None, "", "b?"]) == ["a", "b"]
@@ -0,0 +1,52 @@
+import numpy as np
+from fastapi.testclient import TestClient
+from analytics.vector_index import build_index, save_rows, SnapshotIndex, text_id
+from backend.app import app
+from backend.routes import search
+from backend.utils.snapshot_search import IndexCache
+
+
+def _clustered(n, dim=16, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(20, dim))
+    return (centers[rng.integers(0, 20, n)] + 0.3 * rng.normal(size=(n, dim))).astype(np.float32)
+
+
+def test_ivf_index_matches_exact_search(tmp_path):
+    emb = _clustered(3000)
+    build_index(emb, str(tmp_path), "Topic", nlist=32)
+    ivf = SnapshotIndex.load(str(tmp_path), "Topic")
+    exact = SnapshotIndex.from_embeddings(emb)
+
+    assert len(ivf.centroids) == 32
+    assert isinstance(ivf.vectors, np.memmap)
+    for row in (0, 17, 2999):
+        top_ivf = ivf.search(emb[row], k=5, nprobe=8)
+        top_exact = exact.search(emb[row], k=5)
+        assert top_ivf[0][0] == row
+        assert {r for r, _ in top_ivf} == {r for r, _ in top_exact}
+
+
+def test_search_endpoint_returns_aligned_texts(tmp_path, monkeypatch):
+    date_dir = tmp_path / "2025-01-01"
+    date_dir.mkdir()
+    emb = _clustered(50)
+    texts = [f"text {i}" for i in range(50)]
+    np.save(date_dir / "Elections.npy", emb)
+    save_rows(texts, str(date_dir), "Elections")
+    build_index(emb, str(date_dir), "Elections")
+
+    monkeypatch.setattr(search, "indexes", IndexCache(tmp_path))
+    client = TestClient(app)
+
+    r = client.post("/topic/Elections/search", json={"vector": emb[7].tolist(), "k": 3})
+    assert r.status_code == 200
+    data = r.json()
+    assert data["date"] == "2025-01-01"
+    assert data["results"][0]["text"] == "text 7"
+    assert data["results"][0]["id"] == text_id("text 7")
+    assert len(data["results"]) == 3
+
+    assert client.post("/topic/Unknown/search", json={"vector": emb[0].tolist()}).status_code == 404
+    assert client.post("/topic/Elections/search", json={}).status_code == 400
+    assert client.post("/topic/Elections/search", json={"vector": [1.0, 2.0]}).status_code == 400
@@ -0,0 +1,70 @@
+import json
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+import pytest
+from data_pipeline.data_collectors import wiki_scraper
+
+
+class StubMediaWiki:
+    """Local stand-in for the MediaWiki query API (revisions + extracts)."""
+
+    def __init__(self):
+        self.revid = 100
+        self.text = "Elections are formal group decision-making processes."
+        self.extract_requests = 0
+        wiki = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+                page = {"pageid": 1, "ns": 0, "title": params["titles"]}
+                if params["titles"] == "Nonexistent Topic":
+                    page = {"ns": 0, "title": params["titles"], "missing": True}
+                elif params["prop"] == "revisions":
+                    page["revisions"] = [{"revid": wiki.revid, "parentid": wiki.revid - 1,
+                                          "timestamp": "2025-11-15T10:00:00Z"}]
+                else:
+                    wiki.extract_requests += 1
+                    page["extract"] = wiki.text
+                body = json.dumps({"batchcomplete": True, "query": {"pages": [page]}}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/w/api.php"
+
+
+@pytest.fixture
+def stub_wiki(tmp_path, monkeypatch):
+    wiki = StubMediaWiki()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(wiki_scraper, "WIKIPEDIA_API_URL", wiki.url)
+    yield wiki
+    wiki.server.shutdown()
+
+
+def test_unchanged_revision_skips_download(stub_wiki):
+    path = wiki_scraper.fetch_wiki_page("Elections")
+    with open(path) as f:
+        data = json.load(f)
+    assert data["revision_id"] == 100 and data["texts"][0].startswith("elections are formal")
+
+    assert wiki_scraper.fetch_wiki_page("Elections") == path
+    assert stub_wiki.extract_requests == 1
+
+    stub_wiki.revid, stub_wiki.text = 101, "Elections were held."
+    wiki_scraper.fetch_wiki_page("Elections")
+    assert stub_wiki.extract_requests == 2
+    with open(path) as f:
+        assert json.load(f)["revision_id"] == 101
+
+
+def test_missing_page_returns_none(stub_wiki):
+    assert wiki_scraper.fetch_wiki_page("Nonexistent Topic") is None